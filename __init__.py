@@ -1,16 +1,66 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL, TRANSPORT_SERIAL
+from .alarm_log import VSRAlarmLog
+from .capabilities import VSRCapabilityStore
+from .const import (
+    CONF_FAN_CURVE,
+    CONF_FAN_MAX_RPM,
+    CONF_MAX_BLOCK_GAP,
+    CONF_PIPELINE_DEPTH,
+    CONF_REGISTER_PLAN,
+    CONF_SLOW_CYCLE_EVERY,
+    CONF_TRACE_POLLS,
+    CONF_UNIT_MODEL,
+    CONF_UPDATE_INTERVAL,
+    DOMAIN,
+    DEFAULT_MAX_BLOCK_GAP,
+    DEFAULT_PIPELINE_DEPTH,
+    DEFAULT_SLOW_CYCLE_EVERY,
+    DEFAULT_UPDATE_INTERVAL,
+    TRANSPORT_SERIAL,
+)
 from .hub import VSRHub
 from .coordinator import VSRCoordinator
+from .energy import VSREnergyIntegrator
+from .filter_monitor import VSRFilterMonitor
+from .power_model import DEFAULT_UNIT_MODEL
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
+# Options that only change how the coordinator polls; everything else
+# (transport settings, pipelining) needs a full reload
+HOT_OPTIONS = frozenset(
+    {
+        CONF_UPDATE_INTERVAL,
+        CONF_SLOW_CYCLE_EVERY,
+        CONF_MAX_BLOCK_GAP,
+        CONF_TRACE_POLLS,
+        CONF_UNIT_MODEL,
+        CONF_FAN_CURVE,
+        CONF_FAN_MAX_RPM,
+    }
+)
+
+# Value an option has while it is absent from entry.options (the options
+# form writes every field, so its first save must not count as a change)
+OPTION_DEFAULTS: dict[str, Any] = {
+    CONF_SLOW_CYCLE_EVERY: DEFAULT_SLOW_CYCLE_EVERY,
+    CONF_MAX_BLOCK_GAP: DEFAULT_MAX_BLOCK_GAP,
+    CONF_TRACE_POLLS: False,
+    CONF_UNIT_MODEL: DEFAULT_UNIT_MODEL,
+    CONF_FAN_CURVE: "",
+    CONF_FAN_MAX_RPM: 0,
+    CONF_PIPELINE_DEPTH: DEFAULT_PIPELINE_DEPTH,
+}
+
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
@@ -25,12 +75,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Systemair SAVE VSR from a config entry."""
     transport = entry.data.get("transport", TRANSPORT_SERIAL)
     slave_id = entry.data.get("slave_id")
-    update_interval = entry.options.get(
-        "update_interval",
-        entry.data.get("update_interval", DEFAULT_UPDATE_INTERVAL)
-    )
 
-    # Init hub based on transport type (serial or TCP)
+    # Init hub based on transport type (serial, TCP or RTU-over-TCP)
     if transport == TRANSPORT_SERIAL:
         hub = VSRHub(
             transport=transport,
@@ -47,17 +93,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             slave_id=slave_id,
             host=entry.data.get("host"),
             tcp_port=entry.data.get("tcp_port"),
+            pipeline_depth=entry.options.get(CONF_PIPELINE_DEPTH, DEFAULT_PIPELINE_DEPTH),
         )
 
+    # Learned per-device behaviour (command -> status mapping)
+    capabilities = VSRCapabilityStore(hass, entry.entry_id)
+    await capabilities.async_load()
+    energy = VSREnergyIntegrator(hass, entry.entry_id)
+    await energy.async_load()
+    filter_monitor = VSRFilterMonitor(hass, entry.entry_id)
+    await filter_monitor.async_load()
+    alarm_log = VSRAlarmLog(hass, entry.entry_id)
+    await alarm_log.async_load()
+
     # Initialize data coordinator
-    coordinator = VSRCoordinator(hass, hub, update_interval)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = VSRCoordinator(
+        hass, hub, DEFAULT_UPDATE_INTERVAL, capabilities, energy, filter_monitor, alarm_log
+    )
+    coordinator.apply_options(_polling_options(entry))
+    coordinator.set_register_plan(entry.data.get(CONF_REGISTER_PLAN))
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Give the shared bus back so a retry (or another unit) starts clean
+        await hub.async_close()
+        raise
 
     # Store integration data in hass.data
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "hub": hub,
         "coordinator": coordinator,
+        "options": _effective_options(entry),
         "device_info": {
             "identifiers": {(DOMAIN, entry.entry_id)},
             "name": "Systemair SAVE VSR",
@@ -69,6 +136,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Load all supported platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Entries created before probing existed (or whose plan no longer matches
+    # the registers we poll) are probed once in the background
+    if not coordinator.has_register_plan:
+        entry.async_create_background_task(
+            hass, coordinator.async_reprobe(), "save_vsr register probe"
+        )
+
+    async_setup_services(hass)
+
     # Listen for options updates (e.g., update_interval change)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
@@ -76,6 +152,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def _polling_options(entry: ConfigEntry) -> dict[str, Any]:
+    """Effective polling options (update_interval may still live in data)."""
+    return {
+        CONF_UPDATE_INTERVAL: entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+        **entry.options,
+    }
+
+
+def _effective_options(entry: ConfigEntry) -> dict[str, Any]:
+    """All options with their defaults filled in, for change detection."""
+    return {**OPTION_DEFAULTS, **_polling_options(entry)}
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -84,11 +173,32 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if data:
             hub: VSRHub = data["hub"]
             await hub.async_close()
+            await data["coordinator"].energy.async_save()
         _LOGGER.info("Systemair SAVE VSR integration unloaded")
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted per-device data when the entry is deleted."""
+    await VSRCapabilityStore(hass, entry.entry_id).async_remove()
+    await VSREnergyIntegrator(hass, entry.entry_id).async_remove()
+    await VSRFilterMonitor(hass, entry.entry_id).async_remove()
+    await VSRAlarmLog(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry (e.g., after options update)."""
+    data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if data is not None:
+        old, new = data["options"], _effective_options(entry)
+        changed = {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+        if not changed:
+            # Only entry data changed (e.g. a stored register plan); nothing to reload
+            return
+        if changed <= HOT_OPTIONS:
+            # Keep the connection, caches and entities; just retune polling
+            data["coordinator"].apply_options(_polling_options(entry))
+            data["options"] = new
+            return
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
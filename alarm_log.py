@@ -0,0 +1,190 @@
+"""Incremental reader of the device alarm log for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from pymodbus.exceptions import ModbusException
+
+from .const import ALARM_LOG_NAMES, ALARM_LOG_STATES, DOMAIN
+from .hub import VSRHub
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY_S = 10
+
+# Alarm log: 20 entries of 10 input registers, newest first. Offsets within
+# an entry: 0 alarm id, 1 state, 3..8 year (2 digits), month, day, hour,
+# minute, second; 2 and 9 are unused, so only 9 registers are read
+ALARM_LOG_START = 15700
+ALARM_LOG_ENTRIES = 20
+ALARM_LOG_STRIDE = 10
+ENTRY_REGISTERS = 9
+# Entries per read once the head changed (one new alarm is the common case)
+FETCH_CHUNK = 4
+# Entries kept in the store (the device only holds the last 20)
+MAX_STORED = 100
+# Give up on units that never answer the head read after this many tries
+# (an exception response disables the log at once)
+MAX_HEAD_FAILURES = 3
+
+
+def _decode_entry(regs: list[int]) -> dict[str, Any] | None:
+    """One log entry, or None for an empty slot."""
+    alarm_id, state, _unused, year, month, day, hour, minute, second = regs[:ENTRY_REGISTERS]
+    if not 1 <= month <= 12 or not 1 <= day <= 31:
+        return None
+    year = year + 2000 if year < 100 else year
+    return {
+        "alarm_id": alarm_id,
+        "alarm": ALARM_LOG_NAMES.get(alarm_id, f"Unknown ID: {alarm_id}"),
+        "state": ALARM_LOG_STATES.get(state, "Unknown"),
+        # Device clock (local time, no zone)
+        "time": f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}",
+    }
+
+
+def _key(entry: dict[str, Any]) -> str:
+    return f"{entry['alarm_id']}@{entry['time']}"
+
+
+class VSRAlarmLog:
+    """
+    Mirror of the device alarm log that only reads what is new.
+
+    Each update reads the newest entry (9 registers). If it is the entry
+    seen last time, that is all; otherwise entries are fetched in small
+    chunks until a known one (or an empty slot) is reached. Entries are
+    deduplicated by alarm id and timestamp and kept in a Store, so the
+    history survives restarts and outlives the device's 20 slots.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.alarm_log"
+        )
+        # Newest first
+        self.entries: list[dict[str, Any]] = []
+        self._keys: set[str] = set()
+        # False until the log has been read once; the initial contents are
+        # recorded without reporting them as new
+        self._primed = False
+        self._head_failures = 0
+        self.supported = True
+        self.reads = 0
+        self.registers_read = 0
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        self.entries = data.get("entries", [])
+        self._keys = {_key(entry) for entry in self.entries}
+        self._primed = data.get("primed", False)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    async def _read(self, hub: VSRHub, index: int, count: int) -> list[int] | None:
+        """Registers of `count` consecutive entries starting at `index`."""
+        nregs = (count - 1) * ALARM_LOG_STRIDE + ENTRY_REGISTERS
+        try:
+            regs = await hub.read_input(ALARM_LOG_START + index * ALARM_LOG_STRIDE, nregs)
+        except Exception as exc:
+            _LOGGER.debug("Alarm log read at entry %s failed: %s", index, exc)
+            return None
+        self.reads += 1
+        if regs is None or len(regs) < nregs:
+            return None
+        self.registers_read += nregs
+        return regs
+
+    async def _read_head(self, hub: VSRHub) -> list[int] | None:
+        """
+        Newest entry, as a single short probe-style read.
+
+        Without retries or the long request timeout, a unit that lacks the
+        log costs the shared bus one quick exchange per slow cycle at most.
+        """
+        try:
+            regs = await hub.read_once(ALARM_LOG_START, ENTRY_REGISTERS, is_input=True)
+        except (asyncio.TimeoutError, ModbusException, ConnectionError) as exc:
+            _LOGGER.debug("Alarm log head read failed: %s", exc)
+            self._head_failures += 1
+            if self._head_failures >= MAX_HEAD_FAILURES and not self.entries:
+                _LOGGER.info("Alarm log does not answer on this unit; history disabled")
+                self.supported = False
+            return None
+        self.reads += 1
+        if regs is None:
+            # Exception response: the unit has no alarm log (unless it was
+            # read before, then it is a passing busy/illegal-state answer)
+            if not self.entries:
+                _LOGGER.info("Alarm log not supported by this unit; history disabled")
+                self.supported = False
+            return None
+        if len(regs) < ENTRY_REGISTERS:
+            return None
+        self._head_failures = 0
+        self.registers_read += ENTRY_REGISTERS
+        return regs
+
+    async def async_update(self, hub: VSRHub) -> list[dict[str, Any]]:
+        """Fetch entries newer than the last seen one; returns them oldest first."""
+        if not self.supported:
+            return []
+        regs = await self._read_head(hub)
+        if regs is None:
+            return []
+
+        head = _decode_entry(regs)
+        if head is None:
+            self._prime()
+            return []
+        if _key(head) in self._keys:
+            newest = self.entries[0]
+            if _key(newest) == _key(head) and newest["state"] != head["state"]:
+                newest["state"] = head["state"]
+                self._store.async_delay_save(self._data_to_save, SAVE_DELAY_S)
+            return []
+
+        new = [head]
+        index = 1
+        done = False
+        while not done and index < ALARM_LOG_ENTRIES:
+            count = min(FETCH_CHUNK, ALARM_LOG_ENTRIES - index)
+            regs = await self._read(hub, index, count)
+            if regs is None:
+                # Nothing is committed; the next update starts over at the head
+                return []
+            for k in range(count):
+                offset = k * ALARM_LOG_STRIDE
+                entry = _decode_entry(regs[offset : offset + ENTRY_REGISTERS])
+                if entry is None or _key(entry) in self._keys:
+                    done = True
+                    break
+                new.append(entry)
+            index += count
+
+        self.entries[:0] = new
+        del self.entries[MAX_STORED:]
+        self._keys = {_key(entry) for entry in self.entries}
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY_S)
+
+        new.reverse()
+        if not self._primed:
+            self._prime()
+            _LOGGER.debug("Alarm log initialised with %s entries", len(new))
+            return []
+        return new
+
+    def _prime(self) -> None:
+        if not self._primed:
+            self._primed = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY_S)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"entries": self.entries, "primed": self._primed}
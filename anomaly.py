@@ -0,0 +1,190 @@
+"""Streaming anomaly detection over the poll stream for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+# Samples per rolling window (odd, so the median is a single element)
+WINDOW = 61
+# Samples needed before a signal is judged at all
+MIN_SAMPLES = 20
+# Robust z-score (deviation from the median in scaled MADs) that raises ...
+RAISE_SCORE = 6.0
+# ... on this many consecutive polls, and the score that clears again
+CONFIRM_POLLS = 2
+CLEAR_SCORE = 3.0
+# MAD to standard deviation for normally distributed noise
+MAD_SCALE = 1.4826
+
+
+@dataclass(frozen=True)
+class AnomalySignal:
+    """
+    One monitored value.
+
+    Attributes
+    ----------
+        key: Decoded data key the value is read from.
+        min_scale: Floor of the scaled MAD, so that a flat signal (every
+            sample equal) does not turn one sensor step into an anomaly.
+        context: Data key whose change restarts the window (a new fan
+            duty or setpoint makes a step in this signal expected).
+    """
+
+    key: str
+    min_scale: float
+    context: str | None = None
+
+
+# Signal name -> definition; "supply_error" is computed as supply - target
+ANOMALY_SIGNALS: dict[str, AnomalySignal] = {
+    signal.key: signal
+    for signal in (
+        AnomalySignal("temp_outdoor", 0.5),
+        AnomalySignal("temp_supply", 0.5, context="target_temp"),
+        AnomalySignal("temp_extract", 0.5),
+        AnomalySignal("temp_exhaust", 0.5),
+        AnomalySignal("saf_rpm", 50.0, context="fan_supply"),
+        AnomalySignal("eaf_rpm", 50.0, context="fan_extract"),
+        AnomalySignal("heater_percentage", 5.0, context="target_temp"),
+        AnomalySignal("supply_error", 1.0, context="target_temp"),
+    )
+}
+
+
+class _SignalWindow:
+    """Last WINDOW samples in arrival order and sorted; O(WINDOW) per sample."""
+
+    __slots__ = ("signal", "samples", "ordered", "context", "active", "streak", "warm")
+
+    def __init__(self, signal: AnomalySignal) -> None:
+        self.signal = signal
+        self.samples: deque[float] = deque()
+        self.ordered: list[float] = []
+        self.context: Any = None
+        self.active = False
+        self.streak = 0
+        # Set once MIN_SAMPLES were first seen; state reads None before that
+        self.warm = False
+
+    def clear(self) -> None:
+        self.samples.clear()
+        self.ordered.clear()
+        self.active = False
+        self.streak = 0
+
+    def add(self, value: float) -> None:
+        if len(self.samples) == WINDOW:
+            old = self.samples.popleft()
+            del self.ordered[bisect_left(self.ordered, old)]
+        self.samples.append(value)
+        insort(self.ordered, value)
+
+    def median(self) -> float:
+        ordered = self.ordered
+        n = len(ordered)
+        mid = n // 2
+        return ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
+    def scale(self, median: float) -> float:
+        deviations = sorted(abs(v - median) for v in self.ordered)
+        n = len(deviations)
+        mid = n // 2
+        mad = deviations[mid] if n % 2 else (deviations[mid - 1] + deviations[mid]) / 2
+        return max(mad * MAD_SCALE, self.signal.min_scale)
+
+
+class AnomalyDetector:
+    """
+    Per-signal robust z-score against a rolling median / MAD.
+
+    A value is scored against the window before it is added to it. The MAD
+    is only computed when the deviation could possibly reach a threshold
+    (it cannot while below threshold × min_scale), so a quiet poll costs a
+    deque append, one sorted insert and a median lookup per signal. A
+    lasting level shift stops being anomalous once it makes up half of the
+    window.
+    """
+
+    def __init__(self, signals: dict[str, AnomalySignal] = ANOMALY_SIGNALS) -> None:
+        self._windows = {name: _SignalWindow(signal) for name, signal in signals.items()}
+
+    @staticmethod
+    def _value(name: str, data: dict[str, Any]) -> float | None:
+        if name == "supply_error":
+            supply = data.get("temp_supply")
+            target = data.get("target_temp")
+            if supply is None or target is None:
+                return None
+            return supply - target
+        return data.get(name)
+
+    def update(self, data: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Score one poll; writes anomaly_<signal> and anomalies into data.
+
+        Returns the state changes of this poll (for events), each with the
+        signal, new active state, value, window median and score.
+        """
+        changes: list[dict[str, Any]] = []
+        for name, window in self._windows.items():
+            was_active = window.active
+            value = self._value(name, data)
+            median = score = None
+
+            context = data.get(window.signal.context) if window.signal.context else None
+            if context != window.context:
+                window.context = context
+                window.clear()
+            elif value is not None and len(window.samples) >= MIN_SAMPLES:
+                median = window.median()
+                deviation = abs(value - median)
+                score = 0.0
+                limit = CLEAR_SCORE if was_active else RAISE_SCORE
+                if deviation >= limit * window.signal.min_scale:
+                    score = deviation / window.scale(median)
+                if was_active:
+                    window.active = score >= CLEAR_SCORE
+                elif score >= RAISE_SCORE:
+                    window.streak += 1
+                    window.active = window.streak >= CONFIRM_POLLS
+                else:
+                    window.streak = 0
+
+            if value is not None:
+                window.add(value)
+                if len(window.samples) >= MIN_SAMPLES:
+                    window.warm = True
+            if window.active != was_active:
+                window.streak = 0
+                changes.append(
+                    {
+                        "signal": name,
+                        "active": window.active,
+                        "value": round(value, 2) if value is not None else None,
+                        "median": round(median, 2) if median is not None else None,
+                        "score": round(score, 1) if score is not None else None,
+                    }
+                )
+
+        active = []
+        for name, window in self._windows.items():
+            data[f"anomaly_{name}"] = window.active if window.warm else None
+            if window.active:
+                active.append(name)
+        data["anomalies"] = active
+        return changes
+
+    def as_dict(self) -> dict[str, Any]:
+        """Window state per signal, for diagnostics."""
+        return {
+            name: {
+                "samples": len(window.samples),
+                "median": round(window.median(), 2) if window.samples else None,
+                "active": window.active,
+            }
+            for name, window in self._windows.items()
+        }
@@ -0,0 +1,133 @@
+"""Per-poll cost and detection quality of the anomaly detector.
+
+Feeds a synthetic poll stream (slow temperature drift with sensor
+quantisation and noise, fan duty changes, heater modulation) with injected
+faults into `AnomalyDetector` and reports:
+
+    us/poll     mean and p99 wall time of one `update()` call
+    memory      bytes held by the rolling windows
+    detected    injected faults raised within their duration
+    false       raises outside any injected fault
+
+`anomaly.py` has no Home Assistant imports, so this runs on plain Python:
+
+    python benchmarks/anomaly_bench.py [--polls 100000] [--seed 1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+_spec = importlib.util.spec_from_file_location("vsr_anomaly", ROOT / "anomaly.py")
+anomaly = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = anomaly
+_spec.loader.exec_module(anomaly)
+
+# One fault per FAULT_EVERY polls, cycling: (signal, polls, offset added)
+FAULT_EVERY = 2000
+# Clear of the fan duty / setpoint changes, which restart some windows
+FAULT_START = 1250
+FAULTS: tuple[tuple[str, int, float], ...] = (
+    ("temp_supply", 10, 8.0),
+    ("temp_extract", 15, -6.0),
+    ("temp_exhaust", 10, 10.0),
+    ("temp_outdoor", 5, -20.0),
+    ("saf_rpm", 10, 900.0),
+    ("eaf_rpm", 10, -800.0),
+    ("heater_percentage", 10, 60.0),
+)
+
+
+def poll_stream(polls: int, seed: int):
+    """Yield (data, fault signal or None) per poll (30 s poll interval)."""
+    rng = random.Random(seed)
+    fan = 50
+    target = 20.0
+    for i in range(polls):
+        t = i * 30
+        day = math.sin(2 * math.pi * t / 86400)
+        if i % 500 == 0:
+            fan = rng.choice((30, 50, 70, 100))
+        if i % 3000 == 0:
+            target = rng.choice((18.0, 20.0, 22.0))
+        outdoor = 5 + 6 * day + rng.gauss(0, 0.1)
+        extract = 22 + 0.5 * day + rng.gauss(0, 0.1)
+        supply = target + rng.gauss(0, 0.15)
+        data: dict[str, Any] = {
+            "temp_outdoor": round(outdoor, 1),
+            "temp_extract": round(extract, 1),
+            "temp_supply": round(supply, 1),
+            "temp_exhaust": round(outdoor + 0.2 * (extract - outdoor), 1),
+            "target_temp": target,
+            "fan_supply": fan,
+            "fan_extract": fan,
+            "saf_rpm": round(fan * 34 + rng.gauss(0, 15)),
+            "eaf_rpm": round(fan * 33 + rng.gauss(0, 15)),
+            "heater_percentage": max(0, min(100, round(20 - 2 * outdoor + rng.gauss(0, 2)))),
+        }
+
+        fault = None
+        cycle, offset = divmod(i, FAULT_EVERY)
+        if cycle and offset >= FAULT_START:
+            signal, length, delta = FAULTS[cycle % len(FAULTS)]
+            if offset - FAULT_START < length:
+                data[signal] += delta
+                fault = (cycle, signal)
+        yield data, fault
+
+
+def window_bytes(detector: Any) -> int:
+    total = 0
+    for window in detector._windows.values():
+        total += sys.getsizeof(window.samples) + sys.getsizeof(window.ordered)
+        total += sum(sys.getsizeof(v) for v in window.samples)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    detector = anomaly.AnomalyDetector()
+    timings: list[float] = []
+    injected: set[tuple[int, str]] = set()
+    detected: set[tuple[int, str]] = set()
+    false_raises = 0
+    clock = time.perf_counter
+
+    for data, fault in poll_stream(args.polls, args.seed):
+        if fault is not None:
+            injected.add(fault)
+        start = clock()
+        changes = detector.update(data)
+        timings.append(clock() - start)
+        for change in changes:
+            if not change["active"]:
+                continue
+            if fault is not None and change["signal"] in (fault[1], "supply_error"):
+                detected.add(fault)
+            else:
+                false_raises += 1
+
+    timings.sort()
+    mean_us = sum(timings) / len(timings) * 1e6
+    p99_us = timings[int(len(timings) * 0.99)] * 1e6
+    print(f"polls       {args.polls}")
+    print(f"us/poll     mean {mean_us:.1f}  p99 {p99_us:.1f}")
+    print(f"memory      {window_bytes(detector)} bytes in {len(detector._windows)} windows")
+    print(f"detected    {len(detected)}/{len(injected)} injected faults")
+    print(f"false       {false_raises} raises outside faults")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Scripted fault scenarios against a simulated SAVE VSR unit.
+
+Runs the real hub, bus and coordinator against `VSRSimulatedClient`
+wrapped in `VSRFaultInjectingClient`, switches faults on for a while and
+measures how the coordinator copes:
+
+    recover_s   time from the end of the fault until the first good poll
+    complete_s  time until every polled register is fresh again
+                (addresses marked failed are skipped until the periodic reset)
+    wasted_s    line time spent on requests without a full, valid answer
+
+Needs Home Assistant and pymodbus installed (same as the integration):
+
+    python benchmarks/fault_scenarios.py [--poll 0.2] [--timeout 0.5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT.parent))
+pkg = ROOT.name
+
+hub_module = importlib.import_module(f"{pkg}.hub")
+faults_module = importlib.import_module(f"{pkg}.faults")
+coordinator_module = importlib.import_module(f"{pkg}.coordinator")
+
+FaultProfile = faults_module.FaultProfile
+FaultStats = faults_module.FaultStats
+VSRFaultInjectingClient = faults_module.VSRFaultInjectingClient
+VSRSimulatedClient = faults_module.VSRSimulatedClient
+VSRCoordinator = coordinator_module.VSRCoordinator
+
+
+@dataclass
+class Scenario:
+    name: str
+    fault: dict[str, Any]
+    fault_s: float = 3.0
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario("baseline", {}),
+    Scenario("slow gateway 200 ms", {"delay_s": 0.2, "jitter_s": 0.05}),
+    Scenario("10% dropped responses", {"drop_rate": 0.1}),
+    Scenario("50% dropped responses", {"drop_rate": 0.5}),
+    Scenario("exception storm", {"exception_rate": 0.5, "exception_code": 4}),
+    Scenario("partial responses", {"partial_rate": 0.5}),
+    Scenario("line down", {"disconnect_rate": 1.0}),
+    Scenario("flapping line", {"disconnect_rate": 0.2, "drop_rate": 0.1}),
+)
+
+
+class SimulatedHub(hub_module.VSRHub):
+    """Hub whose bus talks to a simulated unit through the fault injector."""
+
+    def __init__(self, unit: VSRSimulatedClient, faults: FaultProfile) -> None:
+        super().__init__(transport="tcp", host="simulated")
+        self._unit = unit
+        self.faults = faults
+        self.fault_stats = FaultStats()
+
+    def _create_client(self) -> Any:
+        return VSRFaultInjectingClient(self._unit, self.faults, self.fault_stats)
+
+
+def all_fresh(coordinator: VSRCoordinator, since: float) -> bool:
+    image = coordinator._register_image
+    return not coordinator._failed_addrs and all(
+        at >= since for at, _raw in image.values()
+    )
+
+
+async def run_scenario(hass: Any, scenario: Scenario, poll_s: float, settle_s: float) -> dict[str, Any]:
+    profile = FaultProfile(seed=1)
+    hub = SimulatedHub(VSRSimulatedClient({1160: 1, 1130: 3}), faults=profile)
+    await hub.async_connect()
+    coordinator = VSRCoordinator(hass, hub, 10, capabilities=None)
+    coordinator.slow_cycle_every = 1
+
+    async def poll_for(seconds: float) -> int:
+        ok = 0
+        end = time.monotonic() + seconds
+        while time.monotonic() < end:
+            await coordinator.async_refresh()
+            ok += coordinator.last_update_success
+            await asyncio.sleep(poll_s)
+        return ok
+
+    await poll_for(poll_s * 3)
+    stats = hub.fault_stats
+    wasted_before = stats.wasted_s
+
+    for key, value in scenario.fault.items():
+        setattr(profile, key, value)
+    polls_ok = await poll_for(scenario.fault_s)
+    profile.clear()
+    healed = time.monotonic()
+
+    recover_s = complete_s = None
+    deadline = healed + settle_s
+    while time.monotonic() < deadline:
+        await coordinator.async_refresh()
+        now = time.monotonic()
+        if coordinator.last_update_success and recover_s is None:
+            recover_s = now - healed
+        if recover_s is not None and all_fresh(coordinator, healed):
+            complete_s = now - healed
+            break
+        await asyncio.sleep(poll_s)
+
+    result = {
+        "scenario": scenario.name,
+        "polls_ok_during_fault": polls_ok,
+        "recover_s": recover_s,
+        "complete_s": complete_s,
+        "wasted_s": stats.wasted_s - wasted_before,
+        "faulted": stats.faulted,
+        "failed_addrs": len(coordinator._failed_addrs),
+        "poll_p95_ms": coordinator.poll_durations.percentile(0.95),
+    }
+    await hub.async_close()
+    return result
+
+
+def fmt(value: Any) -> str:
+    if value is None:
+        return "never"
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--poll", type=float, default=0.2, help="poll interval in seconds")
+    parser.add_argument("--timeout", type=float, default=0.5, help="hub request timeout in seconds")
+    parser.add_argument("--settle", type=float, default=20.0, help="max seconds to wait for recovery")
+    args = parser.parse_args()
+
+    # Scale the hub timeout down so dropped responses do not take 10 s each
+    hub_module.IO_TIMEOUT_S = args.timeout
+
+    from homeassistant.core import HomeAssistant
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            columns = ("scenario", "polls_ok_during_fault", "recover_s", "complete_s", "wasted_s", "faulted", "failed_addrs", "poll_p95_ms")
+            print(" | ".join(columns))
+            for scenario in SCENARIOS:
+                result = await run_scenario(hass, scenario, args.poll, args.settle)
+                print(" | ".join(fmt(result[c]) for c in columns), flush=True)
+        finally:
+            await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
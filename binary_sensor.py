@@ -14,6 +14,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .anomaly import ANOMALY_SIGNALS
 from .const import DOMAIN
 from .coordinator import VSRCoordinator
 
@@ -21,6 +22,8 @@ from .coordinator import VSRCoordinator
 @dataclass(frozen=True, kw_only=True)
 class VSRBinaryDescription(BinarySensorEntityDescription):
     coordinator_key: str
+    # Coordinator keys exposed as state attributes
+    attributes: tuple[str, ...] = ()
 
 
 BINARY_SENSORS: tuple[VSRBinaryDescription, ...] = (
@@ -55,6 +58,38 @@ BINARY_SENSORS: tuple[VSRBinaryDescription, ...] = (
         device_class=BinarySensorDeviceClass.COLD,
         coordinator_key="cooling_recovery",
     ),
+    # Streaming anomaly detection (see anomaly.py)
+    VSRBinaryDescription(
+        key="anomaly",
+        name="Anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        coordinator_key="anomalies",
+        attributes=("anomalies",),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+ANOMALY_NAMES: dict[str, str] = {
+    "temp_outdoor": "Outdoor Temperature",
+    "temp_supply": "Supply Temperature",
+    "temp_extract": "Extract Temperature",
+    "temp_exhaust": "Exhaust Temperature",
+    "saf_rpm": "Supply Fan RPM",
+    "eaf_rpm": "Extract Fan RPM",
+    "heater_percentage": "Heater Output",
+    "supply_error": "Supply Temperature Error",
+}
+
+ANOMALY_SENSORS: tuple[VSRBinaryDescription, ...] = tuple(
+    VSRBinaryDescription(
+        key=f"anomaly_{signal}",
+        name=f"{ANOMALY_NAMES.get(signal, signal)} Anomaly",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        coordinator_key=f"anomaly_{signal}",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    )
+    for signal in ANOMALY_SIGNALS
 )
 
 
@@ -67,7 +102,8 @@ async def async_setup_entry(
     device_info = data["device_info"]
 
     entities: list[BinarySensorEntity] = [
-        VSRBinarySensor(coordinator, desc, device_info) for desc in BINARY_SENSORS
+        VSRBinarySensor(coordinator, desc, device_info)
+        for desc in BINARY_SENSORS + ANOMALY_SENSORS
     ]
     async_add_entities(entities)
 
@@ -98,3 +134,10 @@ class VSRBinarySensor(CoordinatorEntity[VSRCoordinator], BinarySensorEntity):
         if value is None:
             return None
         return bool(value)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        keys = self.entity_description.attributes  # type: ignore[attr-defined]
+        if not keys:
+            return None
+        return {key: self.coordinator.data.get(key) for key in keys}
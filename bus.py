@@ -0,0 +1,338 @@
+"""Shared Modbus bus arbiter for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional
+
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+from .connection import CircuitOpenError, VSRConnectionManager
+
+_LOGGER = logging.getLogger(__name__)
+
+# Failures while several requests were in flight, with no concurrent success
+# in between, before pipelining is considered unsupported by the gateway and
+# the bus falls back to serial use
+PIPELINE_FALLBACK_ERRORS = 2
+
+ClientT = AsyncModbusSerialClient | AsyncModbusTcpClient
+# Settings every unit on one line must agree on (serial: baud rate, byte
+# size, parity, stop bits); None where the transport has no such settings
+LineSettings = Optional[tuple[Any, ...]]
+
+
+class LineSettingsMismatchError(ValueError):
+    """A unit asked to join a line that is open with other serial settings."""
+Request = Callable[[ClientT], Awaitable[Any]]
+
+# Errors that say something about the line, not about the request. A timeout
+# only says that one slave did not answer (powered off, wrong id, miswired)
+# and is tracked per slave instead, so it cannot take the line down for the
+# other units on it.
+TRANSPORT_ERRORS = (ConnectionError, ConnectionException, ModbusIOException)
+# Consecutive timeouts after which a slave counts as unresponsive
+SLAVE_TIMEOUTS_UNRESPONSIVE = 3
+
+
+class VSRBus:
+    """
+    One physical Modbus line (serial port or TCP endpoint).
+
+    Every unit on the line shares this object's client. Transactions are
+    queued per slave and served round-robin by a single worker, with a shared
+    pause between transactions, so several coordinators can poll units on
+    one RS485 adapter without colliding.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        client_factory: Callable[[], ClientT],
+        pacing_s: float,
+        pipeline_depth: int = 1,
+        line_settings: LineSettings = None,
+    ) -> None:
+        self.key = key
+        self.line_settings = line_settings
+        self.pacing_s = pacing_s
+        self.pipeline_depth = max(1, pipeline_depth)
+        self._client_factory = client_factory
+        self._client: Optional[ClientT] = None
+        self._connect_lock = asyncio.Lock()
+        self._users = 0
+        self.connection = VSRConnectionManager(key, self.async_connect)
+
+        # slave_id -> pending (request, future) in arrival order
+        self._queues: dict[int, deque[tuple[Request, asyncio.Future]]] = {}
+        # slaves with pending work, in round-robin order
+        self._ready: deque[int] = deque()
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self._last_tx_end = 0.0
+
+        # Pipelined mode (TCP): one connection per in-flight request
+        self._inflight = asyncio.Semaphore(self.pipeline_depth)
+        self._in_flight_count = 0
+        self._idle: deque[ClientT] = deque()
+        self._pool: list[ClientT] = []
+        self._pipeline_errors = 0
+
+        # slave_id -> consecutive timeouts (reset by any answer from it)
+        self._slave_timeouts: dict[int, int] = {}
+
+    @property
+    def connected(self) -> bool:
+        return self._client is not None and self._client.connected
+
+    async def async_connect(self) -> None:
+        """(Re)open the shared client."""
+        async with self._connect_lock:
+            self._close_client()
+            self._client = self._client_factory()
+            if not await self._client.connect():
+                raise ConnectionError(f"Failed to connect Modbus client on {self.key}")
+            _LOGGER.debug("Modbus bus %s connected", self.key)
+
+    async def async_ensure_connected(self) -> None:
+        """Initial connect; afterwards the connection manager owns reconnects."""
+        self.connection.check()
+        if not self.connected:
+            try:
+                await self.async_connect()
+            except Exception as e:
+                self.connection.record_failure(e)
+                self.connection.trip()
+                raise
+
+    def _check_line(self) -> None:
+        """Fail fast when the circuit is open or the connection was lost."""
+        self.connection.check()
+        if not self.connected:
+            self.connection.trip()
+            raise CircuitOpenError(f"Modbus line {self.key} lost its connection")
+
+    def _record(self, slave_id: int, exc: BaseException | None) -> None:
+        if exc is None:
+            self._slave_timeouts.pop(slave_id, None)
+            self.connection.record_success()
+        elif isinstance(exc, asyncio.TimeoutError):
+            timeouts = self._slave_timeouts.get(slave_id, 0) + 1
+            self._slave_timeouts[slave_id] = timeouts
+            if timeouts == SLAVE_TIMEOUTS_UNRESPONSIVE:
+                _LOGGER.warning(
+                    "Slave %s on %s stopped answering; other units are not affected",
+                    slave_id,
+                    self.key,
+                )
+        elif isinstance(exc, TRANSPORT_ERRORS) and not isinstance(exc, CircuitOpenError):
+            self.connection.record_failure(exc)
+
+    def slave_unresponsive(self, slave_id: int) -> bool:
+        """True after SLAVE_TIMEOUTS_UNRESPONSIVE timeouts in a row from `slave_id`."""
+        return self._slave_timeouts.get(slave_id, 0) >= SLAVE_TIMEOUTS_UNRESPONSIVE
+
+    def _close_client(self) -> None:
+        if self._client is not None:
+            self._leave_pool(self._client)
+            try:
+                self._client.close()
+            except Exception as e:
+                _LOGGER.debug("Error closing Modbus client on %s: %s", self.key, e)
+            self._client = None
+
+    async def execute(self, slave_id: int, request: Request) -> Any:
+        """Queue `request(client)` for `slave_id` and wait for its result."""
+        if self.pipeline_depth > 1:
+            return await self._execute_pipelined(slave_id, request)
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        queue = self._queues.setdefault(slave_id, deque())
+        queue.append((request, fut))
+        if len(queue) == 1:
+            self._ready.append(slave_id)
+        self._wakeup.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name=f"save_vsr bus {self.key}")
+        return await fut
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._ready:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            # One transaction per slave per turn keeps the line fair
+            slave_id = self._ready.popleft()
+            queue = self._queues[slave_id]
+            request, fut = queue.popleft()
+            if queue:
+                self._ready.append(slave_id)
+            if fut.cancelled():
+                continue
+
+            wait = self._last_tx_end + self.pacing_s - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                self._check_line()
+                result = await request(self._client)  # type: ignore[arg-type]
+            except Exception as e:  # handed to the caller
+                self._record(slave_id, e)
+                if not fut.cancelled():
+                    fut.set_exception(e)
+            else:
+                # Any answer, even an exception response, means the line works
+                self._record(slave_id, None)
+                if not fut.cancelled():
+                    fut.set_result(result)
+            finally:
+                self._last_tx_end = loop.time()
+
+    async def _checkout(self) -> ClientT:
+        """Idle pooled connection, opening another one up to the depth."""
+        while self._idle:
+            client = self._idle.popleft()
+            if client.connected:
+                return client
+            self._discard(client)
+        # The shared client is the first pool member rather than a spare
+        # connection held open next to the pool
+        client = self._client
+        if client is not None and client.connected and client not in self._pool:
+            self._pool.append(client)
+            return client
+        client = self._client_factory()
+        if not await client.connect():
+            raise ConnectionError(f"Failed to open pipelined connection on {self.key}")
+        self._pool.append(client)
+        return client
+
+    async def _execute_pipelined(self, slave_id: int, request: Request) -> Any:
+        """Run `request` concurrently with up to `pipeline_depth - 1` others."""
+        self.connection.check()
+        async with self._inflight:
+            self._in_flight_count += 1
+            concurrent = self._in_flight_count > 1
+            client = None
+            try:
+                self.connection.check()
+                client = await self._checkout()
+                result = await request(client)
+            except Exception as e:
+                self._record(slave_id, e)
+                # A connection that saw an error is not trusted again
+                if client is not None:
+                    self._discard(client)
+                if concurrent and not isinstance(e, CircuitOpenError):
+                    self._pipeline_failed()
+                raise
+            finally:
+                self._in_flight_count -= 1
+            self._record(slave_id, None)
+            if concurrent:
+                # The gateway handled overlapping requests
+                self._pipeline_errors = 0
+            if self.pipeline_depth > 1:
+                self._idle.append(client)
+            else:
+                self._retire(client)
+            return result
+
+    def _leave_pool(self, client: ClientT) -> None:
+        if client in self._pool:
+            self._pool.remove(client)
+        if client in self._idle:
+            self._idle.remove(client)
+
+    def _discard(self, client: ClientT) -> None:
+        self._leave_pool(client)
+        client.close()
+
+    def _retire(self, client: ClientT) -> None:
+        """Drop a connection after fallback; the shared client stays open for serial use."""
+        if client is self._client:
+            self._leave_pool(client)
+        else:
+            self._discard(client)
+
+    def _pipeline_failed(self) -> None:
+        """Count a failure under concurrency; fall back once it looks systematic."""
+        self._pipeline_errors += 1
+        if self._pipeline_errors < PIPELINE_FALLBACK_ERRORS or self.pipeline_depth == 1:
+            return
+        _LOGGER.warning(
+            "Gateway %s does not handle %d concurrent requests; falling back to serial use",
+            self.key,
+            self.pipeline_depth,
+        )
+        self.pipeline_depth = 1
+        # Connections still in use are closed when their request finishes
+        while self._idle:
+            self._retire(self._idle[0])
+
+    async def async_shutdown(self) -> None:
+        await self.connection.async_shutdown()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        for queue in self._queues.values():
+            for _request, fut in queue:
+                if not fut.done():
+                    fut.set_exception(ConnectionError(f"Modbus bus {self.key} closed"))
+        self._queues.clear()
+        self._ready.clear()
+        for client in self._pool:
+            client.close()
+        self._pool.clear()
+        self._idle.clear()
+        self._close_client()
+
+
+# Process-wide registry: one bus per port / host:port
+_BUSES: dict[str, VSRBus] = {}
+
+
+def bus_in_use(key: str) -> bool:
+    """True if a loaded unit already owns the line `key`."""
+    return key in _BUSES
+
+
+def acquire_bus(
+    key: str,
+    client_factory: Callable[[], ClientT],
+    pacing_s: float,
+    pipeline_depth: int = 1,
+    line_settings: LineSettings = None,
+) -> VSRBus:
+    """
+    Get (or create) the shared bus for `key` and register one more user.
+
+    Raises LineSettingsMismatchError if the line is already open with other
+    `line_settings`: the existing client would silently talk at those.
+    """
+    bus = _BUSES.get(key)
+    if bus is None:
+        bus = _BUSES[key] = VSRBus(key, client_factory, pacing_s, pipeline_depth, line_settings)
+    elif bus.line_settings != line_settings:
+        raise LineSettingsMismatchError(
+            f"{key} is in use with settings {bus.line_settings}, not {line_settings}"
+        )
+    bus._users += 1
+    return bus
+
+
+async def async_release_bus(bus: VSRBus) -> None:
+    """Drop one user; the last user closes the shared client."""
+    bus._users -= 1
+    if bus._users <= 0 and _BUSES.get(bus.key) is bus:
+        del _BUSES[bus.key]
+        await bus.async_shutdown()
@@ -0,0 +1,97 @@
+"""Per-device capability store for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Coalesce writes: learning happens in bursts right after setup
+SAVE_DELAY_S = 10
+# Writes in a row that left the mode unchanged before a learned command is dropped
+MISSES_TO_FORGET = 3
+
+
+class VSRCapabilityStore:
+    """
+    Remember what this particular unit does with main-mode commands.
+
+    Firmware revisions disagree on the command (1161) -> status (1160) offset,
+    so the first time a command is confirmed we record which status it
+    produced. Later writes go straight to the known-good command.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.capabilities"
+        )
+        # command value -> status value reported by the device
+        self._mode_commands: dict[int, int] = {}
+        # learned command -> consecutive writes that did not change the mode
+        self._misses: dict[int, int] = {}
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        self._mode_commands = {
+            int(cmd): int(status) for cmd, status in data.get("mode_commands", {}).items()
+        }
+        _LOGGER.debug("Loaded learned mode commands: %s", self._mode_commands)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    def command_for_status(self, status: int) -> int | None:
+        """Return the learned command that produces `status`, if any."""
+        for cmd, learned_status in self._mode_commands.items():
+            if learned_status == status:
+                return cmd
+        return None
+
+    def status_for_command(self, command: int) -> int | None:
+        """Return the status `command` was learned to produce, if any."""
+        return self._mode_commands.get(command)
+
+    def record_mode_command(self, command: int, status: int, previous: int) -> None:
+        """
+        Record that writing `command` moved the device from `previous` to `status`.
+
+        Nothing is learned if the device already reported `status` before.
+        """
+        if previous == status:
+            return
+        self._misses.pop(command, None)
+        if self._mode_commands.get(command) == status:
+            return
+        _LOGGER.info("Learned mode command %s -> status %s", command, status)
+        self._mode_commands[command] = status
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY_S)
+
+    def record_mode_miss(self, command: int) -> None:
+        """Count a write of `command` after which the mode did not change."""
+        if command not in self._mode_commands:
+            return
+        misses = self._misses.get(command, 0) + 1
+        if misses < MISSES_TO_FORGET:
+            self._misses[command] = misses
+            return
+        _LOGGER.info("Forgetting mode command %s after %s misses", command, misses)
+        self.forget_mode_command(command)
+
+    def forget_mode_command(self, command: int) -> None:
+        """Drop a learned command that no longer produces its status."""
+        self._misses.pop(command, None)
+        if self._mode_commands.pop(command, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY_S)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"mode_commands": dict(self._mode_commands)}
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"mode_commands": {str(k): v for k, v in self._mode_commands.items()}}
@@ -1,7 +1,6 @@
 # climate.py
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
@@ -19,7 +18,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
-    REG_MODE_MAIN_CMD,
     REG_MODE_SPEED,
     REG_TARGET_TEMP,
     FAN_SPEED_TO_VALUE,
@@ -148,8 +146,9 @@ class VSRClimate(CoordinatorEntity[VSRCoordinator], ClimateEntity):
             new["mode_speed"] = val
             # FIXED: Remove await - async_set_updated_data is NOT a coroutine
             self.coordinator.async_set_updated_data(new)
-            # schedule background refresh to validate
-            await self.coordinator.async_request_refresh()
+            # validate against the device; full refresh only if it never reports back
+            if not await self.coordinator.async_confirm_value("mode_speed", val):
+                await self.coordinator.async_request_refresh()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set target temperature (user sees 1°C steps, device expects tenths)."""
@@ -165,7 +164,8 @@ class VSRClimate(CoordinatorEntity[VSRCoordinator], ClimateEntity):
             new["target_temp"] = round(reg_value * 0.1, 1)
             # FIXED: Remove await
             self.coordinator.async_set_updated_data(new)
-            await self.coordinator.async_request_refresh()
+            if not await self.coordinator.async_confirm_value("target_temp", reg_value / 10):
+                await self.coordinator.async_request_refresh()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set a preset (writes command register)."""
@@ -188,44 +188,34 @@ class VSRClimate(CoordinatorEntity[VSRCoordinator], ClimateEntity):
         if val is None:
             _LOGGER.error("Unknown preset mode: %s", preset_mode)
             return
-        
+
+        expected_status = val - 1  # Status should be command - 1
         _LOGGER.info(
             "  Command value to write (from PRESET_COMMAND_MAP): %s\n"
             "  Writing to register 1161 (REG_MODE_MAIN_CMD)\n"
             "  Expected status value after write: %s",
             val,
-            val - 1  # Status should be command - 1
+            expected_status
         )
         
-        ok = await self.hub.write_register(REG_MODE_MAIN_CMD, val)
-        
-        if ok:
-            _LOGGER.info("  Write to register 1161 succeeded")
-            # Optimistic update: status value should be command - 1
-            new = dict(self.coordinator.data or {})
-            new["mode_main"] = val - 1  # CRITICAL FIX: Status is offset by -1
-            self.coordinator.async_set_updated_data(new)
-            await self.coordinator.async_request_refresh()
-            
-            # Log the value read back after refresh
-            await asyncio.sleep(0.5)  # Small delay to allow device to update
-            new_status = self.coordinator.data.get("mode_main")
-            new_preset = PRESET_STATUS_MAP.get(new_status) if new_status is not None else None
-            
-            _LOGGER.info(
-                "  After refresh:\n"
-                "    Status register value (1160): %s\n"
-                "    Preset name: %s\n"
-                "  Expected preset: %s\n"
-                "  MATCH: %s\n"
-                "=================================",
-                new_status,
-                new_preset,
-                preset_mode,
-                "YES" if new_preset == preset_mode else "NO - MISMATCH!"
-            )
-        else:
-            _LOGGER.error("  Write to register 1161 FAILED")
+        # A command learned for this unit takes precedence over the static map
+        ok = await self.coordinator.async_write_main_mode(expected_status, [val])
+        new_status = self.coordinator.data.get("mode_main")
+        new_preset = PRESET_STATUS_MAP.get(new_status) if new_status is not None else None
+
+        _LOGGER.info(
+            "  Confirmed by device: %s\n"
+            "    Status register value (1160): %s\n"
+            "    Preset name: %s\n"
+            "  Expected preset: %s\n"
+            "  MATCH: %s\n"
+            "=================================",
+            "YES" if ok else "NO",
+            new_status,
+            new_preset,
+            preset_mode,
+            "YES" if new_preset == preset_mode else "NO - MISMATCH!"
+        )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """
@@ -234,38 +224,22 @@ class VSRClimate(CoordinatorEntity[VSRCoordinator], ClimateEntity):
         NOTE: your device exhibits inconsistent values for status vs command.
         Observed *status* values: 6 -> OFF, 0 -> AUTO, 1 -> FAN_ONLY.
         Some devices expect command OFF=7 while status shows 6. To be robust
-        we attempt the common command (7) first and fall back to 6 if 7 fails.
+        we attempt the common command (7) first and fall back to 6 only if
+        the device rejects the first write. The command that worked (and what
+        a command did instead) is remembered per device (capabilities store).
         """
         if hvac_mode == HVACMode.OFF:
-            # Try 7 first (common command value for OFF), then 6 as fallback
-            if await self.hub.write_register(REG_MODE_MAIN_CMD, 7):
-                new = dict(self.coordinator.data or {})
-                new["mode_main"] = 7
-                # FIXED: Remove await
-                self.coordinator.async_set_updated_data(new)
-                await self.coordinator.async_request_refresh()
-                return
-            # fallback try 6
-            if await self.hub.write_register(REG_MODE_MAIN_CMD, 6):
-                new = dict(self.coordinator.data or {})
-                new["mode_main"] = 6
-                # FIXED: Remove await
-                self.coordinator.async_set_updated_data(new)
-                await self.coordinator.async_request_refresh()
-                return
+            # Try 7 first (common command value for OFF), then 6 if 7 is rejected.
+            # Whichever works is learned, so later calls need a single write.
+            await self.coordinator.async_write_main_mode(6, [7, 6])
             return
 
+        # Command value -> expected status value (status = command - 1)
         mapping = {HVACMode.AUTO: 1, HVACMode.FAN_ONLY: 2}
         value = mapping.get(hvac_mode)
         if value is None:
             return
-        ok = await self.hub.write_register(REG_MODE_MAIN_CMD, value)
-        if ok:
-            new = dict(self.coordinator.data or {})
-            new["mode_main"] = value
-            # FIXED: Remove await
-            self.coordinator.async_set_updated_data(new)
-            await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write_main_mode(value - 1, [value])
 
 
 async def async_setup_entry(
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import logging
+from typing import Any
+
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
     DOMAIN,
     TRANSPORT_SERIAL,
     TRANSPORT_TCP,
+    TRANSPORT_RTU_TCP,
     DEFAULT_SERIAL_PORT,
     DEFAULT_BAUDRATE,
     DEFAULT_BYTESIZE,
@@ -19,7 +23,27 @@ from .const import (
     DEFAULT_TCP_PORT,
     DEFAULT_SLAVE_ID,
     DEFAULT_UPDATE_INTERVAL,
+    CONF_REGISTER_PLAN,
+    CONF_PIPELINE_DEPTH,
+    DEFAULT_PIPELINE_DEPTH,
+    MAX_PIPELINE_DEPTH,
+    CONF_SLOW_CYCLE_EVERY,
+    CONF_MAX_BLOCK_GAP,
+    CONF_TRACE_POLLS,
+    CONF_UNIT_MODEL,
+    CONF_FAN_CURVE,
+    CONF_FAN_MAX_RPM,
+    DEFAULT_SLOW_CYCLE_EVERY,
+    DEFAULT_MAX_BLOCK_GAP,
 )
+from .bus import LineSettingsMismatchError
+from .coordinator import probe_candidates
+from .discovery import async_discover_serial
+from .hub import VSRHub
+from .power_model import DEFAULT_UNIT_MODEL, UNIT_MODELS, parse_fan_curve
+from .probe import async_probe_registers
+
+_LOGGER = logging.getLogger(__name__)
 
 SERIAL_SCHEMA = vol.Schema(
     {
@@ -42,7 +66,38 @@ TCP_SCHEMA = vol.Schema(
     }
 )
 
-TRANSPORT_PICK = vol.Schema({vol.Required("transport", default=TRANSPORT_SERIAL): vol.In([TRANSPORT_SERIAL, TRANSPORT_TCP])})
+DISCOVERY_MANUAL = "manual"
+
+TRANSPORT_PICK = vol.Schema({vol.Required("transport", default=TRANSPORT_SERIAL): vol.In([TRANSPORT_SERIAL, TRANSPORT_TCP, TRANSPORT_RTU_TCP])})
+
+async def async_probe_device(transport: str, user_input: dict[str, Any]) -> dict[str, Any]:
+    """Connect with the entered settings and probe the supported registers."""
+    if transport == TRANSPORT_SERIAL:
+        hub = VSRHub(
+            transport=transport,
+            slave_id=user_input["slave_id"],
+            port=user_input["port"],
+            baudrate=user_input["baudrate"],
+            bytesize=user_input["bytesize"],
+            parity=user_input["parity"],
+            stopbits=user_input["stopbits"],
+        )
+    else:
+        hub = VSRHub(
+            transport=transport,
+            slave_id=user_input["slave_id"],
+            host=user_input["host"],
+            tcp_port=user_input["tcp_port"],
+        )
+    try:
+        await hub.async_connect()
+        plan = await async_probe_registers(hub, probe_candidates())
+    finally:
+        await hub.async_close()
+    if not plan["supported"]:
+        raise ConnectionError("Device did not answer any register")
+    return plan
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
@@ -53,40 +108,127 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         transport = user_input["transport"]
         self._transport = transport
+        self._suggested: dict[str, Any] = {}
+        if transport == TRANSPORT_SERIAL:
+            return await self.async_step_discover()
+        return await self.async_step_transport_details()
+
+    async def async_step_discover(self, user_input=None) -> FlowResult:
+        """Offer serial units found by probing local ports, or manual entry."""
+        if user_input is None:
+            self._discovered = {
+                f"{found['port']}:{found['slave_id']}": found
+                for found in await async_discover_serial(self.hass)
+            }
+            if not self._discovered:
+                return await self.async_step_transport_details()
+            choices = {
+                key: f"{found['port']} ({found['baudrate']} {found['parity']}{found['stopbits']}, slave {found['slave_id']})"
+                for key, found in self._discovered.items()
+            }
+            choices[DISCOVERY_MANUAL] = "Enter settings manually"
+            return self.async_show_form(
+                step_id="discover",
+                data_schema=vol.Schema({vol.Required("device"): vol.In(choices)}),
+            )
+
+        self._suggested = self._discovered.get(user_input["device"], {})
         return await self.async_step_transport_details()
 
     async def async_step_transport_details(self, user_input=None) -> FlowResult:
         schema = SERIAL_SCHEMA if self._transport == TRANSPORT_SERIAL else TCP_SCHEMA
         if user_input is None:
-            return self.async_show_form(step_id="transport_details", data_schema=schema)
+            return self.async_show_form(
+                step_id="transport_details",
+                data_schema=self.add_suggested_values_to_schema(schema, self._suggested),
+            )
+
+        # Validate the settings and probe supported registers once
+        try:
+            plan = await async_probe_device(self._transport, user_input)
+        except LineSettingsMismatchError as err:
+            _LOGGER.warning("Could not probe Systemair VSR: %s", err)
+            return self.async_show_form(
+                step_id="transport_details",
+                data_schema=self.add_suggested_values_to_schema(schema, user_input),
+                errors={"base": "line_settings_mismatch"},
+            )
+        except Exception as err:  # noqa: BLE001 - any failure means "can't talk to it"
+            _LOGGER.warning("Could not probe Systemair VSR: %s", err)
+            return self.async_show_form(
+                step_id="transport_details",
+                data_schema=self.add_suggested_values_to_schema(schema, user_input),
+                errors={"base": "cannot_connect"},
+            )
 
         # Save config
-        data = {"transport": self._transport, **user_input}
+        data = {"transport": self._transport, **user_input, CONF_REGISTER_PLAN: plan}
         return self.async_create_entry(title="Systemair VSR", data=data)
 
     async def async_step_import(self, user_input=None) -> FlowResult:
         # Optional: support YAML import if desired later
         return await self.async_step_user(user_input)
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> OptionsFlowHandler:
+        return OptionsFlowHandler()
+
 class OptionsFlowHandler(config_entries.OptionsFlow):
-    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
-        self.config_entry = config_entry
+    # self.config_entry is provided by the framework; assigning it is
+    # deprecated and fails from Home Assistant 2025.12
 
     async def async_step_init(self, user_input=None) -> FlowResult:
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                parse_fan_curve(user_input.get(CONF_FAN_CURVE, ""))
+            except ValueError as err:
+                _LOGGER.debug("Rejected fan curve: %s", err)
+                errors[CONF_FAN_CURVE] = "invalid_fan_curve"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = {**self.config_entry.options, **(user_input or {})}
+        fields: dict[Any, Any] = {
+            vol.Required(
+                "update_interval",
+                default=options.get("update_interval", self.config_entry.data.get("update_interval", DEFAULT_UPDATE_INTERVAL)),
+            ): int,
+            vol.Required(
+                CONF_SLOW_CYCLE_EVERY,
+                default=options.get(CONF_SLOW_CYCLE_EVERY, DEFAULT_SLOW_CYCLE_EVERY),
+            ): vol.All(int, vol.Range(min=1, max=60)),
+            vol.Required(
+                CONF_MAX_BLOCK_GAP,
+                default=options.get(CONF_MAX_BLOCK_GAP, DEFAULT_MAX_BLOCK_GAP),
+            ): vol.All(int, vol.Range(min=0, max=20)),
+            vol.Required(
+                CONF_UNIT_MODEL,
+                default=options.get(CONF_UNIT_MODEL, DEFAULT_UNIT_MODEL),
+            ): vol.In({key: unit.name for key, unit in UNIT_MODELS.items()}),
+            vol.Optional(
+                CONF_FAN_CURVE,
+                default=options.get(CONF_FAN_CURVE, ""),
+            ): str,
+            vol.Required(
+                CONF_FAN_MAX_RPM,
+                default=options.get(CONF_FAN_MAX_RPM, 0),
+            ): vol.All(int, vol.Range(min=0, max=10000)),
+            vol.Required(
+                CONF_TRACE_POLLS,
+                default=options.get(CONF_TRACE_POLLS, False),
+            ): bool,
+        }
+        if self.config_entry.data.get("transport") == TRANSPORT_TCP:
+            fields[
+                vol.Required(
+                    CONF_PIPELINE_DEPTH,
+                    default=options.get(CONF_PIPELINE_DEPTH, DEFAULT_PIPELINE_DEPTH),
+                )
+            ] = vol.All(int, vol.Range(min=1, max=MAX_PIPELINE_DEPTH))
 
         return self.async_show_form(
-            step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        "update_interval",
-                        default=self.config_entry.options.get("update_interval", self.config_entry.data.get("update_interval", DEFAULT_UPDATE_INTERVAL)),
-                    ): int
-                }
-            ),
+            step_id="init", data_schema=vol.Schema(fields), errors=errors
         )
 
-async def async_get_options_flow(config_entry):
-    return OptionsFlowHandler(config_entry)
@@ -0,0 +1,119 @@
+"""Connection lifecycle and circuit breaker for a Modbus line."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from enum import Enum
+from typing import Awaitable, Callable, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+# Consecutive line failures before the circuit opens (slave timeouts excluded)
+FAILURES_TO_OPEN = 3
+# Reconnect backoff (doubles after each failed attempt)
+RECONNECT_INITIAL_S = 1.0
+RECONNECT_MAX_S = 60.0
+
+
+class CircuitOpenError(ConnectionError):
+    """The line is known to be down; the request was not sent."""
+
+
+class ConnectionState(Enum):
+    """
+    Lifecycle of a Modbus line.
+
+    Attributes
+    ----------
+        CONNECTED: Last transaction succeeded.
+        DEGRADED: Some consecutive failures, requests still sent.
+        OPEN: Line considered down; callers fail fast while reconnecting.
+        HALF_OPEN: Reconnected; the next request decides the state.
+    """
+
+    CONNECTED = "connected"
+    DEGRADED = "degraded"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class VSRConnectionManager:
+    """
+    Circuit breaker with a single tracked reconnect task.
+
+    Line failures (lost or refused connection, I/O errors) are counted; after
+    FAILURES_TO_OPEN in a row the circuit opens, pending callers are
+    refused immediately, and one background task reconnects with
+    exponential backoff. A successful reconnect half-opens the circuit and
+    the next transaction closes it again or re-opens it.
+    """
+
+    def __init__(self, name: str, connect: Callable[[], Awaitable[None]]) -> None:
+        self._name = name
+        self._connect = connect
+        self.state = ConnectionState.CONNECTED
+        self.consecutive_failures = 0
+        self._backoff_s = RECONNECT_INITIAL_S
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if requests must not be sent right now."""
+        if self.state is ConnectionState.OPEN:
+            raise CircuitOpenError(f"Modbus line {self._name} is down; reconnecting")
+
+    def record_success(self) -> None:
+        if self.state is not ConnectionState.CONNECTED:
+            _LOGGER.info("Modbus line %s healthy again", self._name)
+        self.state = ConnectionState.CONNECTED
+        self.consecutive_failures = 0
+        self._backoff_s = RECONNECT_INITIAL_S
+
+    def record_failure(self, exc: BaseException) -> None:
+        _LOGGER.debug("Modbus transport failure on %s: %s", self._name, exc)
+        self.consecutive_failures += 1
+        if self.state is ConnectionState.HALF_OPEN:
+            self._backoff_s = min(self._backoff_s * 2, RECONNECT_MAX_S)
+            self.trip()
+        elif self.consecutive_failures >= FAILURES_TO_OPEN:
+            self.trip()
+        elif self.state is ConnectionState.CONNECTED:
+            self.state = ConnectionState.DEGRADED
+
+    def trip(self) -> None:
+        """Open the circuit and make sure exactly one reconnect task runs."""
+        if self.state is not ConnectionState.OPEN:
+            _LOGGER.warning(
+                "Modbus line %s down after %d failures; reconnecting in background",
+                self._name,
+                self.consecutive_failures,
+            )
+        self.state = ConnectionState.OPEN
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(
+                self._async_reconnect(), name=f"save_vsr reconnect {self._name}"
+            )
+
+    async def _async_reconnect(self) -> None:
+        while True:
+            await asyncio.sleep(self._backoff_s)
+            try:
+                await self._connect()
+            except Exception as e:  # noqa: BLE001 - any failure means "still down"
+                self._backoff_s = min(self._backoff_s * 2, RECONNECT_MAX_S)
+                _LOGGER.debug(
+                    "Reconnect to %s failed (%s); next try in %.0fs", self._name, e, self._backoff_s
+                )
+                continue
+            self.state = ConnectionState.HALF_OPEN
+            _LOGGER.debug("Reconnected to %s; waiting for a good transaction", self._name)
+            return
+
+    async def async_shutdown(self) -> None:
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            try:
+                await self._reconnect_task
+            except asyncio.CancelledError:
+                pass
+            self._reconnect_task = None
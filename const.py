@@ -5,9 +5,28 @@ DOMAIN = "save_vsr"
 
 DEFAULT_UPDATE_INTERVAL = 10  # seconds
 
+# Polling options (applied to a running coordinator without reconnecting)
+CONF_UPDATE_INTERVAL = "update_interval"
+CONF_SLOW_CYCLE_EVERY = "slow_cycle_every"
+CONF_MAX_BLOCK_GAP = "max_block_gap"
+DEFAULT_SLOW_CYCLE_EVERY = 6
+DEFAULT_MAX_BLOCK_GAP = 2
+# Unit size for the power model (see power_model.UNIT_MODELS)
+CONF_UNIT_MODEL = "unit_model"
+# Measured fan curve ("speed %:watts, ..."; empty = affinity law) and the
+# fan RPM at 100 % (0 = the unit model's value)
+CONF_FAN_CURVE = "fan_curve"
+CONF_FAN_MAX_RPM = "fan_max_rpm"
+# Record per-poll trace spans (diagnostics / get_poll_traces service)
+CONF_TRACE_POLLS = "trace_polls"
+
 # Transport
 TRANSPORT_SERIAL = "serial"
 TRANSPORT_TCP = "tcp"
+# Modbus RTU frames over a transparent RS485-to-Ethernet bridge
+TRANSPORT_RTU_TCP = "rtu_tcp"
+# Recorded bus traffic served back from a capture file (benchmarks, debugging)
+TRANSPORT_REPLAY = "replay"
 
 # Serial defaults
 DEFAULT_SERIAL_PORT = "/dev/ttyUSB0"
@@ -19,6 +38,10 @@ DEFAULT_PARITY = "N"
 # TCP defaults
 DEFAULT_HOST = "192.168.1.100"
 DEFAULT_TCP_PORT = 502
+# Concurrent requests over Modbus TCP (1 = serialized, as on RS485)
+CONF_PIPELINE_DEPTH = "pipeline_depth"
+DEFAULT_PIPELINE_DEPTH = 1
+MAX_PIPELINE_DEPTH = 8
 
 DEFAULT_SLAVE_ID = 1
 
@@ -110,12 +133,51 @@ REG_ALARM_TYPE_C       = 15902
 ALARM_STATE_TO_VALUE = {"Inactive": 0, "Active": 1, "Waiting": 2, "Cleared Error Active": 3}
 ALARM_VALUE_TO_STATE = {v: k for k, v in ALARM_STATE_TO_VALUE.items()}
 
+# Alarm log (15700+): alarm id of an entry -> name, entry state -> text
+ALARM_LOG_NAMES = {
+    0: "Frost protection",
+    1: "Frost protection temperature sensor",
+    2: "Defrosting error",
+    3: "Supply air fan feedback",
+    4: "Extract air fan feedback",
+    5: "Supply air fan control error",
+    6: "Extract air fan control error",
+    7: "Emergency thermostat",
+    8: "Plate heat exchanger bypass damper",
+    9: "Rotary heat exchanger rotation guard",
+    10: "Secondary air damper",
+    11: "Outdoor air temperature sensor",
+    12: "Overheat temperature sensor",
+    13: "Supply air temperature sensor",
+    14: "Room air temperature sensor",
+    15: "Extract air temperature sensor",
+    16: "Extra controller temperature sensor",
+    17: "Efficiency temperature sensor",
+    18: "Inbuilt relative humidity sensor",
+    19: "Inbuilt extract air temperature sensor",
+    20: "Filter",
+    21: "Extra controller alarm",
+    22: "External stop",
+    23: "Manual fan stop",
+    24: "Heater overheat",
+    25: "Low supply air temperature",
+    26: "External CO2 sensor",
+    27: "External relative humidity sensor",
+    28: "Manual output mode",
+    29: "Fire alarm",
+    30: "Filter warning",
+    34: "Bypass damper feedback",
+}
+ALARM_LOG_STATES = {0: "Inactive", 1: "Active", 2: "Counter increasing", 3: "Acknowledged"}
+
 FAN_SPEED_MAP = {2: "low", 3: "medium", 4: "high"}
 FAN_SPEED_TO_VALUE = {v: k for k, v in FAN_SPEED_MAP.items()}
 
 # Main mode / Presets
 # CRITICAL: Status values (read from 1160) are offset by -1 from Command values (write to 1161)
 # Based on working example: command value N results in status value N-1
+# These maps only seed the first write: the command that actually produced a
+# given status is learned per device (capabilities.py) and used from then on.
 
 # Command values (what to WRITE to REG_MODE_MAIN_CMD register 1161)
 # Only 3 special presets available for user selection
@@ -136,3 +198,22 @@ PRESET_STATUS_MAP = {
 # Legacy compatibility - kept for backward compatibility but should use specific maps
 PRESET_MAP = PRESET_STATUS_MAP  # For reading
 PRESET_TO_VALUE = PRESET_COMMAND_MAP  # For writing
+
+# Services
+SERVICE_REPROBE_REGISTERS = "reprobe_registers"
+SERVICE_GET_POLL_TRACES = "get_poll_traces"
+SERVICE_RECORD_BUS_TRAFFIC = "record_bus_traffic"
+ATTR_DURATION = "duration"
+SERVICE_GET_HISTORY = "get_history"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_BUCKET_MINUTES = "bucket_minutes"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+# Events
+EVENT_ANOMALY = f"{DOMAIN}_anomaly"
+EVENT_ALARM = f"{DOMAIN}_alarm"
+EVENT_ALARM_LOGGED = f"{DOMAIN}_alarm_logged"
+
+# Config entry data keys
+CONF_REGISTER_PLAN = "register_plan"
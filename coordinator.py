@@ -2,33 +2,209 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from bisect import bisect_right
 from datetime import timedelta
-from typing import Any
+from typing import Any, Mapping
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEFAULT_UPDATE_INTERVAL
-from .hub import VSRHub
+from .alarm_log import VSRAlarmLog
+from .anomaly import AnomalyDetector
+from .capabilities import VSRCapabilityStore
+from .const import (
+    ALARM_VALUE_TO_STATE,
+    ATTR_CONFIG_ENTRY_ID,
+    CONF_MAX_BLOCK_GAP,
+    CONF_SLOW_CYCLE_EVERY,
+    CONF_TRACE_POLLS,
+    CONF_UNIT_MODEL,
+    CONF_FAN_CURVE,
+    CONF_FAN_MAX_RPM,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_MAX_BLOCK_GAP,
+    DEFAULT_SLOW_CYCLE_EVERY,
+    DEFAULT_UPDATE_INTERVAL,
+    EVENT_ALARM,
+    EVENT_ALARM_LOGGED,
+    EVENT_ANOMALY,
+    REG_MODE_MAIN_CMD,
+)
+from .connection import CircuitOpenError
+from .derived import CountdownClock, EfficiencyEstimator, derive_metrics
+from .energy import VSREnergyIntegrator
+from .filter_monitor import VSRFilterMonitor
+from .history import SampleHistory
+from .power_model import DEFAULT_UNIT_MODEL, power_model
+from .hub import IO_ATTEMPTS, VSRHub
+from .metrics import LatencyHistogram
 from .modbus import IntegerType, ModbusParameter, parameter_map
+from .publish import PublishContext
+from .probe import PLAN_VERSION, ProbeAbortedError, async_probe_registers, plan_signature
+from .tracing import CURRENT_SPAN, PollTracer, Span, span
 
 _LOGGER = logging.getLogger(__name__)
 
-# How many fast polls before doing slow-cycle alarms
-SLOW_CYCLE_EVERY = 6
-
-# Maximum gap for block merging in registers (small gaps tolerated)
-MAX_BLOCK_GAP = 2
-
 # How long to wait before retrying failed addresses (in polls)
 RESET_FAILED_EVERY = 180  # ~30min at 10s interval
 
+# Polls in a row with a failing planned block before the plan is re-probed
+# (firmware updates can change which registers are answered)
+PLAN_STALE_AFTER = 3
+
+# Newest alarm log entries exposed as a state attribute
+ALARM_HISTORY_ATTRIBUTE_ENTRIES = 10
+
+# Command confirmation: poll only the status register with exponential intervals
+CONFIRM_TIMEOUT_S = 5.0
+CONFIRM_INITIAL_DELAY_S = 0.1
+CONFIRM_MAX_DELAY_S = 1.0
+# Extra wait before the last look at a main mode change that was not
+# confirmed in time (some transitions ramp the fans down first)
+MODE_SETTLE_S = 10.0
+
+# Coordinator keys that can be confirmed with a single-register read
+CONFIRM_PARAMS: dict[str, str] = {
+    "mode_main": "REG_MODE_MAIN_STATUS_IN",
+    "mode_speed": "REG_MODE_SPEED",
+    "target_temp": "REG_TARGET_TEMP",
+}
+
+
+# Parameters read on every poll
+FAST_PARAMS: tuple[str, ...] = (
+    "REG_MODE_MAIN_STATUS_IN",
+    "REG_MODE_SPEED",
+    "REG_TARGET_TEMP",
+    "REG_TEMP_OUTDOOR",
+    "REG_TEMP_SUPPLY",
+    "REG_TEMP_EXHAUST",
+    "REG_TEMP_EXTRACT",
+    "REG_TEMP_OVERHEAT",
+    "REG_SAF_RPM",
+    "REG_EAF_RPM",
+    "REG_SUPPLY_FAN_PCT",
+    "REG_EXTRACT_FAN_PCT",
+    "REG_HEATER_PERCENT",
+    "REG_HEAT_EXCH_STATE",
+    "REG_ROTOR",
+    "REG_HEATER",
+    "REG_SETPOINT_ECO_OFFSET",
+    "REG_MODE_SUMMERWINTER",
+    "REG_FAN_RUNNING_START",
+    "REG_DAMPER_STATE",
+    "REG_COOLING_RECOVERY",
+    "REG_HOLIDAY_DAYS",
+    "REG_AWAY_HOURS",
+    "REG_FIREPLACE_MINS",
+    "REG_REFRESH_MINS",
+    "REG_CROWDED_HOURS",
+)
+
+# Parameters read on the slow cycle (alarms, switches, countdown)
+SLOW_PARAMS: tuple[str, ...] = (
+    "REG_ALARM_SAF",
+    "REG_ALARM_EAF",
+    "REG_ALARM_FROST_PROT",
+    "REG_ALARM_SAF_RPM",
+    "REG_ALARM_EAF_RPM",
+    "REG_ALARM_FPT",
+    "REG_ALARM_OAT",
+    "REG_ALARM_SAT",
+    "REG_ALARM_RAT",
+    "REG_ALARM_EAT",
+    "REG_ALARM_ECT",
+    "REG_ALARM_EFT",
+    "REG_ALARM_OHT",
+    "REG_ALARM_EMT",
+    "REG_ALARM_BYS",
+    "REG_ALARM_SEC_AIR",
+    "REG_ALARM_FILTER",
+    "REG_ALARM_RH",
+    "REG_ALARM_LOW_SAT",
+    "REG_ALARM_PDM_RHS",
+    "REG_ALARM_PDM_EAT",
+    "REG_ALARM_MAN_FAN_STOP",
+    "REG_ALARM_OVERHEAT_TEMP",
+    "REG_ALARM_FIRE",
+    "REG_ALARM_FILTER_WARN",
+    "REG_ALARM_TYPE_A",
+    "REG_ALARM_TYPE_B",
+    "REG_ALARM_TYPE_C",
+    "REG_ECO_MODE_ENABLE",
+    "REG_HEATER_ENABLE",
+    "REG_RH_TRANSFER_ENABLE",
+    "REG_TEMP_EFFICENCY",
+    # Countdown is projected locally between reads (see CountdownClock)
+    "REG_USERMODE_REMAIN",
+    "REG_USERMODE_FACTOR",
+)
+
+
+# Alarm data key -> register (slow cycle); raw values as in ALARM_VALUE_TO_STATE
+ALARM_REGISTERS: dict[str, str] = {
+    "alarm_saf": "REG_ALARM_SAF",
+    "alarm_eaf": "REG_ALARM_EAF",
+    "alarm_frost_protect": "REG_ALARM_FROST_PROT",
+    "alarm_saf_rpm": "REG_ALARM_SAF_RPM",
+    "alarm_eaf_rpm": "REG_ALARM_EAF_RPM",
+    "alarm_fpt": "REG_ALARM_FPT",
+    "alarm_oat": "REG_ALARM_OAT",
+    "alarm_sat": "REG_ALARM_SAT",
+    "alarm_rat": "REG_ALARM_RAT",
+    "alarm_eat": "REG_ALARM_EAT",
+    "alarm_ect": "REG_ALARM_ECT",
+    "alarm_eft": "REG_ALARM_EFT",
+    "alarm_oht": "REG_ALARM_OHT",
+    "alarm_emt": "REG_ALARM_EMT",
+    "alarm_bys": "REG_ALARM_BYS",
+    "alarm_sec_air": "REG_ALARM_SEC_AIR",
+    "alarm_filter": "REG_ALARM_FILTER",
+    "alarm_rh": "REG_ALARM_RH",
+    "alarm_low_SAT": "REG_ALARM_LOW_SAT",
+    "alarm_pdm_rhs": "REG_ALARM_PDM_RHS",
+    "alarm_pdm_eat": "REG_ALARM_PDM_EAT",
+    "alarm_man_fan_stop": "REG_ALARM_MAN_FAN_STOP",
+    "alarm_overheat_temp": "REG_ALARM_OVERHEAT_TEMP",
+    "alarm_fire": "REG_ALARM_FIRE",
+    "alarm_filter_warn": "REG_ALARM_FILTER_WARN",
+    "alarm_typeA": "REG_ALARM_TYPE_A",
+    "alarm_typeB": "REG_ALARM_TYPE_B",
+    "alarm_typeC": "REG_ALARM_TYPE_C",
+}
+# Class flags (any type A/B/C alarm active), not alarms of their own
+ALARM_SUMMARY_KEYS = frozenset({"alarm_typeA", "alarm_typeB", "alarm_typeC"})
+
+
+def register_count(param: ModbusParameter) -> int:
+    """Number of consecutive registers read for a parameter."""
+    return 2 if param.short == "REG_FAN_RUNNING_START" else 1
+
+
+def probe_candidates() -> list[tuple[ModbusParameter, int]]:
+    """All (parameter, count) pairs the coordinator may poll."""
+    return [
+        (parameter_map[short], register_count(parameter_map[short]))
+        for short in FAST_PARAMS + SLOW_PARAMS
+    ]
+
 
 class VSRCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for Systemair SAVE VSR Modbus integration."""
 
-    def __init__(self, hass: HomeAssistant, hub: VSRHub, update_interval_s: int) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        hub: VSRHub,
+        update_interval_s: int,
+        capabilities: VSRCapabilityStore,
+        energy: VSREnergyIntegrator | None = None,
+        filter_monitor: VSRFilterMonitor | None = None,
+        alarm_log: VSRAlarmLog | None = None,
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
@@ -37,10 +213,199 @@ class VSRCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=update_interval_s or DEFAULT_UPDATE_INTERVAL),
         )
         self.hub = hub
+        self.capabilities = capabilities
+        self.energy = energy
+        self.filter_monitor = filter_monitor
+        self.alarm_log = alarm_log
+        # How many fast polls before doing slow-cycle alarms
+        self.slow_cycle_every = DEFAULT_SLOW_CYCLE_EVERY
+        # Maximum gap for block merging in registers (small gaps tolerated)
+        self.max_block_gap = DEFAULT_MAX_BLOCK_GAP
+        self.tracer = PollTracer()
+        self.power_model = power_model(DEFAULT_UNIT_MODEL)
+        self.history = SampleHistory()
+        self.efficiency = EfficiencyEstimator()
+        self.countdown = CountdownClock()
+        self.anomalies = AnomalyDetector()
         self._slow_counter = 0  # Run slow cycle every N fast polls
         self._poll_count = 0  # For resetting failed addresses
-        self._failed_addrs: set[int] = set()
+        # Address -> (monotonic time of failure, reason); skipped until reset
+        self._failed_addrs: dict[int, tuple[float, str]] = {}
         self._failure_count: int = 0
+        # Parameter short name -> (monotonic time of last good read, raw registers)
+        self._register_image: dict[str, tuple[float, list[int]]] = {}
+        # Register values refreshed vs. served from the previous image
+        self._reads_fresh = 0
+        self._reads_cached = 0
+        # Last merged read layout: register type -> [(start, count), ...]
+        self._last_layout: dict[str, list[tuple[int, int]]] = {}
+        self.poll_durations = LatencyHistogram()
+        # Probed read layout: is_input -> sorted (start, count) verified blocks
+        self._plan_blocks: dict[bool, list[tuple[int, int]]] | None = None
+        self._plan_misses = 0
+        self._plan_block_failed = False
+        self._any_block_ok = False
+        self._reprobe_task: asyncio.Task | None = None
+        self._trace_fanout: Span | None = None
+        # Alarm key -> raw state last seen (transitions fire EVENT_ALARM)
+        self._alarm_states: dict[str, int] = {}
+        # Filtered entity updates (see publish.py)
+        self._last_notify_ok = False
+        self.publish_stats = {"published": 0, "suppressed": 0}
+
+    def apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply polling options in place (no reconnect, entities untouched)."""
+        interval = options.get(CONF_UPDATE_INTERVAL) or DEFAULT_UPDATE_INTERVAL
+        self.update_interval = timedelta(seconds=interval)
+        self.slow_cycle_every = options.get(CONF_SLOW_CYCLE_EVERY, DEFAULT_SLOW_CYCLE_EVERY)
+        self.max_block_gap = options.get(CONF_MAX_BLOCK_GAP, DEFAULT_MAX_BLOCK_GAP)
+        self.tracer.enabled = bool(options.get(CONF_TRACE_POLLS, False))
+        self.power_model = power_model(
+            options.get(CONF_UNIT_MODEL, DEFAULT_UNIT_MODEL),
+            options.get(CONF_FAN_CURVE, ""),
+            float(options.get(CONF_FAN_MAX_RPM, 0)),
+        )
+        _LOGGER.debug(
+            "Applied polling options: interval=%ss slow_cycle_every=%s max_block_gap=%s tracing=%s",
+            interval,
+            self.slow_cycle_every,
+            self.max_block_gap,
+            self.tracer.enabled,
+        )
+
+    @property
+    def has_register_plan(self) -> bool:
+        return self._plan_blocks is not None
+
+    def set_register_plan(self, plan: dict[str, Any] | None) -> bool:
+        """
+        Load a probed register plan (see probe.py).
+
+        Plans probed for a different candidate set are ignored so a newer
+        integration version never skips registers it has not tested.
+        """
+        candidates = [
+            (p.reg_type.value == "Input", p.register, cnt) for p, cnt in probe_candidates()
+        ]
+        if (
+            not plan
+            or plan.get("version") != PLAN_VERSION
+            or plan.get("signature") != plan_signature(candidates)
+        ):
+            self._plan_blocks = None
+            return False
+
+        self._plan_blocks = {
+            True: sorted((s, c) for s, c in plan["blocks"].get("input", [])),
+            False: sorted((s, c) for s, c in plan["blocks"].get("holding", [])),
+        }
+        self._plan_misses = 0
+        _LOGGER.debug("Loaded register plan: %s", self._plan_blocks)
+        return True
+
+    def _plan_block_index(self, is_input: bool, addr: int, cnt: int) -> int | None:
+        """Index of the verified block covering addr..addr+cnt-1, or None."""
+        blocks = self._plan_blocks[is_input]  # type: ignore[index]
+        i = bisect_right(blocks, (addr, float("inf"))) - 1
+        if i >= 0:
+            start, count = blocks[i]
+            if addr + cnt <= start + count:
+                return i
+        return None
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Planner, cache and poll statistics (in-memory only, cheap to build)."""
+        now = time.monotonic()
+        reads = self._reads_fresh + self._reads_cached
+        return {
+            "poll_count": self._poll_count,
+            "slow_cycle_every": self.slow_cycle_every,
+            "max_block_gap": self.max_block_gap,
+            "plan": {
+                "probed_blocks": (
+                    {
+                        "input": self._plan_blocks[True],
+                        "holding": self._plan_blocks[False],
+                    }
+                    if self._plan_blocks is not None
+                    else None
+                ),
+                "misses": self._plan_misses,
+                "last_layout": dict(self._last_layout),
+            },
+            "failed_addresses": {
+                addr: {"reason": reason, "age_s": round(now - at, 1)}
+                for addr, (at, reason) in sorted(self._failed_addrs.items())
+            },
+            "failed_reset_in_polls": RESET_FAILED_EVERY - self._poll_count % RESET_FAILED_EVERY,
+            "poll_duration": self.poll_durations.as_dict(),
+            "history": {
+                "samples": self.history.size,
+                "capacity": self.history.capacity,
+                "bytes": self.history.nbytes,
+            },
+            "publish": dict(self.publish_stats),
+            "register_map": {
+                "known": len(parameter_map),
+                "materialised": parameter_map.materialised,
+            },
+            "alarm_log": (
+                {
+                    "supported": self.alarm_log.supported,
+                    "entries": len(self.alarm_log.entries),
+                    "reads": self.alarm_log.reads,
+                    "registers_read": self.alarm_log.registers_read,
+                }
+                if self.alarm_log is not None
+                else None
+            ),
+            "anomaly": self.anomalies.as_dict(),
+            "register_cache": {
+                "fresh": self._reads_fresh,
+                "cached": self._reads_cached,
+                "hit_rate": round(self._reads_cached / reads, 3) if reads else None,
+            },
+            "register_image": {
+                short: {
+                    "address": parameter_map[short].register,
+                    "raw": raw,
+                    "age_s": round(now - at, 1),
+                }
+                for short, (at, raw) in sorted(self._register_image.items())
+            },
+        }
+
+    async def async_reprobe(self) -> dict[str, Any] | None:
+        """
+        Probe supported registers and persist the plan in the config entry.
+
+        Returns None, keeping the current plan, if the probe lost the device.
+        """
+        try:
+            plan = await async_probe_registers(self.hub, probe_candidates())
+        except ProbeAbortedError as err:
+            _LOGGER.warning("Register probe aborted (%s); keeping the current plan", err)
+            return None
+        if not plan["supported"]:
+            # Nothing answered: the line is down, not every register unsupported
+            _LOGGER.warning("Register probe got no answers; keeping the current plan")
+            return None
+        self.set_register_plan(plan)
+        self._failed_addrs.clear()
+        entry = self.config_entry
+        if entry is not None:
+            self.hass.config_entries.async_update_entry(
+                entry, data={**entry.data, "register_plan": plan}
+            )
+        return plan
+
+    def _schedule_reprobe(self) -> None:
+        if self._reprobe_task is not None and not self._reprobe_task.done():
+            return
+        _LOGGER.info("Register plan looks stale (firmware change?); re-probing")
+        self._reprobe_task = self.hass.async_create_background_task(
+            self.async_reprobe(), "save_vsr register reprobe"
+        )
 
     def get_modbus_data(self, parameter: ModbusParameter) -> float | int | bool:
         """
@@ -66,14 +431,18 @@ class VSRCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Handle 32-bit combined registers
         if parameter.combine_with_32_bit:
-            high_param = next(
-                (p for p in parameter_map.values() if p.register == parameter.combine_with_32_bit),
-                None,
+            high_param = parameter_map.by_register(
+                parameter.combine_with_32_bit, parameter.reg_type
             )
             if high_param:
                 high_value = self.data.get(high_param.short, 0)
                 raw_value = raw_value + (high_value << 16)
 
+        return self._decode_raw(parameter, raw_value)
+
+    @staticmethod
+    def _decode_raw(parameter: ModbusParameter, raw_value: int) -> float | int:
+        """Apply sign conversion and scale factor to a raw register value."""
         # Convert signed integers
         if parameter.sig == IntegerType.INT and raw_value > 32767:
             raw_value = raw_value - 65536
@@ -84,6 +453,139 @@ class VSRCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return raw_value
 
+    async def async_confirm_value(
+        self, key: str, expected: Any, timeout: float = CONFIRM_TIMEOUT_S
+    ) -> bool:
+        """
+        Wait until the device reports `expected` for coordinator `key`.
+
+        Only the register backing `key` is read, with exponentially growing
+        intervals, so a command returns as soon as the device reacts instead
+        of after a fixed sleep or a full poll. On success the coordinator data
+        is updated in place and listeners are notified.
+
+        Returns True if the value was confirmed before `timeout`.
+        """
+        param = parameter_map[CONFIRM_PARAMS[key]]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = CONFIRM_INITIAL_DELAY_S
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, CONFIRM_MAX_DELAY_S)
+
+            try:
+                regs = await self._read_param(param)
+            except CircuitOpenError as err:
+                _LOGGER.debug("Confirmation of %s=%s abandoned: %s", key, expected, err)
+                return False
+            if not regs:
+                continue
+
+            value = self._decode_raw(param, regs[0])
+            if value == expected:
+                new = dict(self.data or {})
+                new[param.short] = regs[0]
+                new[key] = value
+                self.async_set_updated_data(new)
+                return True
+
+        _LOGGER.debug("Confirmation of %s=%s timed out after %.1fs", key, expected, timeout)
+        return False
+
+    async def _read_param(self, param: ModbusParameter) -> list[int] | None:
+        """Direct single-register read of `param`, outside the poll."""
+        if param.reg_type.value == "Input":
+            return await self.hub.read_input(param.register, 1)
+        return await self.hub.read_holding(param.register, 1)
+
+    async def async_write_main_mode(self, status: int, candidates: list[int]) -> bool:
+        """
+        Put the unit into main mode `status` (as reported by 1160).
+
+        A command learned earlier for this unit is tried first, then the
+        `candidates` in order, skipping commands learned to produce another
+        status. The next candidate is only written if the unit did not
+        accept the previous write; once a command is written, the outcome is
+        confirmed (with one late re-read for slow transitions) and no other
+        mode command follows, so a slow unit never ends up in a mode the
+        user did not choose.
+
+        A command is only learned when the unit was in another mode before
+        the write and then reports the new one; a learned command is only
+        dropped after repeated writes that left the mode unchanged.
+        """
+        learned = self.capabilities.command_for_status(status)
+        order = [learned] if learned is not None else []
+        order += [
+            cmd
+            for cmd in candidates
+            if cmd != learned and self.capabilities.status_for_command(cmd) in (None, status)
+        ]
+
+        param = parameter_map[CONFIRM_PARAMS["mode_main"]]
+        try:
+            regs = await self._read_param(param)
+        except CircuitOpenError as err:
+            _LOGGER.warning("Cannot set main mode %s: %s", status, err)
+            return False
+        before = self._decode_raw(param, regs[0]) if regs else None
+        if before == status:
+            # Already there; a single write of the best guess (restarts timed modes)
+            order = order[:1]
+
+        for cmd in order:
+            if await self.hub.write_register(REG_MODE_MAIN_CMD, cmd):
+                break
+        else:
+            await self.async_request_refresh()
+            return False
+
+        new = dict(self.data or {})
+        new["mode_main"] = status
+        self.async_set_updated_data(new)
+        if await self.async_confirm_value("mode_main", status):
+            if before is not None:
+                self.capabilities.record_mode_command(cmd, status, before)
+            return True
+
+        # Not confirmed in time: one more look after the unit had time to
+        # settle, without writing anything else
+        await asyncio.sleep(MODE_SETTLE_S)
+        try:
+            regs = await self._read_param(param)
+        except CircuitOpenError:
+            regs = None
+        after = self._decode_raw(param, regs[0]) if regs else None
+        if after == status:
+            new = dict(self.data or {})
+            new[param.short] = regs[0]
+            new["mode_main"] = after
+            self.async_set_updated_data(new)
+            if before is not None:
+                self.capabilities.record_mode_command(cmd, status, before)
+            return True
+
+        _LOGGER.warning(
+            "Main mode %s not reached after command %s (status %s -> %s)",
+            status,
+            cmd,
+            before,
+            after,
+        )
+        if before is not None and after is not None and before != status:
+            if after == before:
+                self.capabilities.record_mode_miss(cmd)
+            else:
+                # A real transition, just not to the requested mode
+                self.capabilities.record_mode_command(cmd, after, before)
+        await self.async_request_refresh()
+        return False
+
     async def _batch_read_type(
         self, entries: list[tuple[int, int, int]], is_input: bool
     ) -> dict[int, list[int] | None]:
@@ -100,6 +602,65 @@ class VSRCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if not entries:
             return {}
 
+        kind = "input" if is_input else "holding"
+        with span(CURRENT_SPAN.get(), "plan_blocks", type=kind) as plan_span:
+            blocks = self._plan_blocks_for(entries, is_input)
+            if plan_span is not None:
+                plan_span.attrs["blocks"] = len(blocks)
+
+        self._last_layout[kind] = [
+            (block["start"], block["end"] - block["start"] + 1) for block in blocks
+        ]
+
+        async def read_block(block: dict) -> tuple[list[int] | None, str | None]:
+            start = block["start"]
+            nregs = block["end"] - block["start"] + 1
+            with span(CURRENT_SPAN.get(), "read_block", type=kind, address=start, count=nregs):
+                try:
+                    regs = (
+                        await self.hub.read_input(start, nregs)
+                        if is_input
+                        else await self.hub.read_holding(start, nregs)
+                    )
+                except CircuitOpenError:
+                    # Line is down: fail the whole poll fast instead of marking
+                    # every address as failed
+                    raise
+                except Exception as exc:
+                    _LOGGER.warning("Batch read failed at %s (count=%s): %s", start, nregs, exc)
+                    return None, repr(exc)
+                if regs is None:
+                    return None, f"no valid response after {IO_ATTEMPTS} attempts"
+                return regs, None
+
+        # Issue all blocks at once: a pipelined TCP bus overlaps them, a
+        # serial bus simply queues them in order
+        block_regs = await asyncio.gather(*(read_block(block) for block in blocks))
+
+        results: dict[int, list[int] | None] = {}
+        failed_at = time.monotonic()
+        for block, (regs, reason) in zip(blocks, block_regs):
+            start = block["start"]
+            if regs is None:
+                self._failure_count += 1
+                if block["plan"] is not None:
+                    self._plan_block_failed = True
+                for idx, addr, cnt in block["items"]:
+                    self._failed_addrs[addr] = (failed_at, f"{kind} block at {start}: {reason}")
+                    results[idx] = None
+            else:
+                self._any_block_ok = True
+                for idx, addr, cnt in block["items"]:
+                    offset = addr - start
+                    part = regs[offset : offset + cnt] if offset + cnt <= len(regs) else regs[offset:]
+                    results[idx] = part if part else None
+
+        return results
+
+    def _plan_blocks_for(
+        self, entries: list[tuple[int, int, int]], is_input: bool
+    ) -> list[dict]:
+        """Merge (index, address, count) entries into read blocks."""
         entries_sorted = sorted(entries, key=lambda x: x[1])
         blocks: list[dict] = []
         cur_block = None
@@ -109,181 +670,233 @@ class VSRCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if addr in self._failed_addrs:
                 continue
 
+            # With a probed plan, skip unsupported registers and only merge
+            # within a block the device is known to answer as a whole
+            plan_idx = None
+            if self._plan_blocks is not None:
+                plan_idx = self._plan_block_index(is_input, addr, cnt)
+                if plan_idx is None:
+                    continue
+
             new_end = addr + cnt - 1
             if cur_block is None:
-                cur_block = {"start": addr, "end": new_end, "items": [(idx, addr, cnt)]}
+                cur_block = {"start": addr, "end": new_end, "plan": plan_idx, "items": [(idx, addr, cnt)]}
                 continue
 
-            if addr <= cur_block["end"] + MAX_BLOCK_GAP + 1:
+            if (
+                plan_idx is not None and plan_idx == cur_block["plan"]
+            ) or (
+                plan_idx is None and addr <= cur_block["end"] + self.max_block_gap + 1
+            ):
                 cur_block["end"] = max(cur_block["end"], new_end)
                 cur_block["items"].append((idx, addr, cnt))
             else:
                 blocks.append(cur_block)
-                cur_block = {"start": addr, "end": new_end, "items": [(idx, addr, cnt)]}
+                cur_block = {"start": addr, "end": new_end, "plan": plan_idx, "items": [(idx, addr, cnt)]}
 
         if cur_block:
             blocks.append(cur_block)
-
-        # Read all blocks
-        results: dict[int, list[int] | None] = {}
-        for block in blocks:
-            start = block["start"]
-            nregs = block["end"] - block["start"] + 1
-            try:
-                regs = (
-                    await self.hub.read_input(start, nregs)
-                    if is_input
-                    else await self.hub.read_holding(start, nregs)
-                )
-            except Exception as exc:
-                _LOGGER.warning("Batch read failed at %s (count=%s): %s", start, nregs, exc)
-                regs = None
-
-            if regs is None:
-                self._failure_count += 1
-                for idx, addr, cnt in block["items"]:
-                    self._failed_addrs.add(addr)
-                    results[idx] = None
-            else:
-                for idx, addr, cnt in block["items"]:
-                    offset = addr - start
-                    part = regs[offset : offset + cnt] if offset + cnt <= len(regs) else regs[offset:]
-                    results[idx] = part if part else None
-
-        return results
+        return blocks
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the device."""
+        self._poll_count += 1
+        started = time.monotonic()
+        trace = self.tracer.start("poll", poll=self._poll_count)
+        token = CURRENT_SPAN.set(trace)
         try:
             # Preserve previous data to avoid losing slow-cycle values
             data: dict[str, Any] = self.data.copy() if self.data else {}
 
             # Reset failed addresses periodically
-            self._poll_count += 1
             if self._poll_count % RESET_FAILED_EVERY == 0:
                 self._failed_addrs.clear()
                 _LOGGER.debug("Reset failed addresses for periodic retry")
 
             # Build list of parameters to read (fast cycle)
-            fast_params = [
-                parameter_map["REG_MODE_MAIN_STATUS_IN"],
-                parameter_map["REG_MODE_SPEED"],
-                parameter_map["REG_TARGET_TEMP"],
-                parameter_map["REG_TEMP_OUTDOOR"],
-                parameter_map["REG_TEMP_SUPPLY"],
-                parameter_map["REG_TEMP_EXHAUST"],
-                parameter_map["REG_TEMP_EXTRACT"],
-                parameter_map["REG_TEMP_OVERHEAT"],
-                parameter_map["REG_SAF_RPM"],
-                parameter_map["REG_EAF_RPM"],
-                parameter_map["REG_SUPPLY_FAN_PCT"],
-                parameter_map["REG_EXTRACT_FAN_PCT"],
-                parameter_map["REG_HEATER_PERCENT"],
-                parameter_map["REG_HEAT_EXCH_STATE"],
-                parameter_map["REG_ROTOR"],
-                parameter_map["REG_HEATER"],
-                parameter_map["REG_SETPOINT_ECO_OFFSET"],
-                parameter_map["REG_MODE_SUMMERWINTER"],
-                parameter_map["REG_FAN_RUNNING_START"],
-                parameter_map["REG_DAMPER_STATE"],
-                parameter_map["REG_COOLING_RECOVERY"],
-                parameter_map["REG_USERMODE_REMAIN"],
-                parameter_map["REG_USERMODE_FACTOR"],
-                parameter_map["REG_HOLIDAY_DAYS"],
-                parameter_map["REG_AWAY_HOURS"],
-                parameter_map["REG_FIREPLACE_MINS"],
-                parameter_map["REG_REFRESH_MINS"],
-                parameter_map["REG_CROWDED_HOURS"],
-            ]
+            fast_params = [parameter_map[short] for short in FAST_PARAMS]
 
             # PART 1 COMPLETE - Continue in Part 2
             return await self._read_and_decode_data(data, fast_params)
 
         except Exception as err:
+            if trace is not None:
+                trace.attrs["error"] = repr(err)
             raise UpdateFailed(f"Coordinator update error: {err}") from err
+        finally:
+            self.poll_durations.observe((time.monotonic() - started) * 1000)
+            CURRENT_SPAN.reset(token)
+            # Listener fan-out follows the update; it closes the trace
+            self._trace_fanout = trace
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, timing the fan-out of a traced poll."""
+        trace, self._trace_fanout = self._trace_fanout, None
+        if trace is None:
+            self._notify_listeners()
+            return
+        with span(trace, "fanout", listeners=len(self._listeners)):
+            self._notify_listeners()
+        self.tracer.commit()
+
+    def _notify_listeners(self) -> None:
+        """Call listeners, skipping filtered entities whose value did not change enough."""
+        # Availability changes reach every entity
+        force = not (self.last_update_success and self._last_notify_ok)
+        self._last_notify_ok = self.last_update_success
+        data = self.data or {}
+        now = time.monotonic()
+        for update_callback, context in list(self._listeners.values()):
+            if isinstance(context, PublishContext):
+                value = data.get(context.key)
+                if not force and not context.should_publish(value, now):
+                    self.publish_stats["suppressed"] += 1
+                    continue
+                context.mark(value, now)
+                self.publish_stats["published"] += 1
+            update_callback()
 
     async def _read_and_decode_data(
         self, data: dict[str, Any], fast_params: list[ModbusParameter]
     ) -> dict[str, Any]:
         """Read registers and decode data (Part 2 of update)."""
-        # Add slow cycle parameters (alarms + switches)
-        self._slow_counter += 1
-        run_slow = self._slow_counter >= SLOW_CYCLE_EVERY
-        if self.data is None:
-            run_slow = True  # Force slow on first poll
-
-        if run_slow:
-            self._slow_counter = 0
-            slow_params = [
-                parameter_map["REG_ALARM_SAF"],
-                parameter_map["REG_ALARM_EAF"],
-                parameter_map["REG_ALARM_FROST_PROT"],
-                parameter_map["REG_ALARM_SAF_RPM"],
-                parameter_map["REG_ALARM_EAF_RPM"],
-                parameter_map["REG_ALARM_FPT"],
-                parameter_map["REG_ALARM_OAT"],
-                parameter_map["REG_ALARM_SAT"],
-                parameter_map["REG_ALARM_RAT"],
-                parameter_map["REG_ALARM_EAT"],
-                parameter_map["REG_ALARM_ECT"],
-                parameter_map["REG_ALARM_EFT"],
-                parameter_map["REG_ALARM_OHT"],
-                parameter_map["REG_ALARM_EMT"],
-                parameter_map["REG_ALARM_BYS"],
-                parameter_map["REG_ALARM_SEC_AIR"],
-                parameter_map["REG_ALARM_FILTER"],
-                parameter_map["REG_ALARM_RH"],
-                parameter_map["REG_ALARM_LOW_SAT"],
-                parameter_map["REG_ALARM_PDM_RHS"],
-                parameter_map["REG_ALARM_PDM_EAT"],
-                parameter_map["REG_ALARM_MAN_FAN_STOP"],
-                parameter_map["REG_ALARM_OVERHEAT_TEMP"],
-                parameter_map["REG_ALARM_FIRE"],
-                parameter_map["REG_ALARM_FILTER_WARN"],
-                parameter_map["REG_ALARM_TYPE_A"],
-                parameter_map["REG_ALARM_TYPE_B"],
-                parameter_map["REG_ALARM_TYPE_C"],
-                parameter_map["REG_ECO_MODE_ENABLE"],
-                parameter_map["REG_HEATER_ENABLE"],
-                parameter_map["REG_RH_TRANSFER_ENABLE"],
-            ]
-            fast_params.extend(slow_params)
-
-        # Build descriptors for batch reading
-        descriptors: list[tuple[bool, int, int]] = []
-        param_map_by_index: dict[int, ModbusParameter] = {}
-
-        for i, param in enumerate(fast_params):
-            is_input = param.reg_type.value == "Input"
-            count = 2 if param.short == "REG_FAN_RUNNING_START" else 1
-            descriptors.append((is_input, param.register, count))
-            param_map_by_index[i] = param
-
-        # Split into input vs holding
-        input_entries: list[tuple[int, int, int]] = []
-        holding_entries: list[tuple[int, int, int]] = []
-        for i, (is_input, addr, cnt) in enumerate(descriptors):
-            (input_entries if is_input else holding_entries).append((i, addr, cnt))
+        trace = CURRENT_SPAN.get()
+        with span(trace, "plan") as plan_span:
+            # Add slow cycle parameters (alarms + switches)
+            self._slow_counter += 1
+            run_slow = self._slow_counter >= self.slow_cycle_every
+            if self.data is None:
+                run_slow = True  # Force slow on first poll
+
+            if run_slow:
+                self._slow_counter = 0
+                slow_params = [parameter_map[short] for short in SLOW_PARAMS]
+                fast_params.extend(slow_params)
+
+            # Build descriptors for batch reading
+            descriptors: list[tuple[bool, int, int]] = []
+            param_map_by_index: dict[int, ModbusParameter] = {}
+
+            for i, param in enumerate(fast_params):
+                is_input = param.reg_type.value == "Input"
+                count = register_count(param)
+                descriptors.append((is_input, param.register, count))
+                param_map_by_index[i] = param
+
+            # Split into input vs holding
+            input_entries: list[tuple[int, int, int]] = []
+            holding_entries: list[tuple[int, int, int]] = []
+            for i, (is_input, addr, cnt) in enumerate(descriptors):
+                (input_entries if is_input else holding_entries).append((i, addr, cnt))
+
+            if plan_span is not None:
+                plan_span.attrs.update(slow=run_slow, params=len(descriptors))
 
         # Batch read
-        input_results = await self._batch_read_type(input_entries, is_input=True)
-        holding_results = await self._batch_read_type(holding_entries, is_input=False)
+        self._plan_block_failed = False
+        self._any_block_ok = False
+        with span(trace, "read"):
+            input_results, holding_results = await asyncio.gather(
+                self._batch_read_type(input_entries, is_input=True),
+                self._batch_read_type(holding_entries, is_input=False),
+            )
+
+        # A verified block failing poll after poll, while the rest of the bus
+        # answers, means the plan is outdated
+        if self._plan_block_failed and self._any_block_ok:
+            self._plan_misses += 1
+            if self._plan_misses >= PLAN_STALE_AFTER:
+                self._plan_misses = 0
+                self._schedule_reprobe()
+        else:
+            self._plan_misses = 0
+
+        with span(trace, "decode"):
+            data = self._decode_results(
+                data, descriptors, param_map_by_index, input_results, holding_results, run_slow
+            )
+
+        if run_slow and self.alarm_log is not None:
+            with span(trace, "alarm_log"):
+                await self._update_alarm_log(data)
+        return data
 
+    async def _update_alarm_log(self, data: dict[str, Any]) -> None:
+        """Fetch new device alarm log entries and report them as events."""
+        alarm_log = self.alarm_log
+        for entry in await alarm_log.async_update(self.hub):
+            _LOGGER.info("Alarm logged: %s (%s) at %s", entry["alarm"], entry["state"], entry["time"])
+            self.hass.bus.async_fire(
+                EVENT_ALARM_LOGGED, {ATTR_CONFIG_ENTRY_ID: self.config_entry.entry_id, **entry}
+            )
+        latest = alarm_log.entries[0] if alarm_log.entries else None
+        data["alarm_history_latest"] = latest["alarm"] if latest else None
+        data["alarm_history"] = [
+            {"alarm": entry["alarm"], "state": entry["state"], "time": entry["time"]}
+            for entry in alarm_log.entries[:ALARM_HISTORY_ATTRIBUTE_ENTRIES]
+        ]
+
+    def _diff_alarms(self, data: dict[str, Any]) -> None:
+        """Fire EVENT_ALARM for alarm state changes; write the active alarm summary."""
+        previous = self._alarm_states
+        active: dict[str, str] = {}
+        for key, short in ALARM_REGISTERS.items():
+            if key in ALARM_SUMMARY_KEYS:
+                continue
+            raw = data[key]
+            state = ALARM_VALUE_TO_STATE.get(raw, "Inactive")
+            if raw:
+                active[key] = state
+            old = previous.get(key)
+            previous[key] = raw
+            # The first read only seeds the states; current alarms are on the sensor
+            if old is None or old == raw:
+                continue
+            self.hass.bus.async_fire(
+                EVENT_ALARM,
+                {
+                    ATTR_CONFIG_ENTRY_ID: self.config_entry.entry_id,
+                    "alarm": key,
+                    "name": parameter_map[short].description,
+                    "state": state,
+                    "previous": ALARM_VALUE_TO_STATE.get(old, "Inactive"),
+                },
+            )
+        data["active_alarm_count"] = len(active)
+        data["active_alarms"] = active
+
+    def _decode_results(
+        self,
+        data: dict[str, Any],
+        descriptors: list[tuple[bool, int, int]],
+        param_map_by_index: dict[int, ModbusParameter],
+        input_results: dict[int, list[int] | None],
+        holding_results: dict[int, list[int] | None],
+        run_slow: bool,
+    ) -> dict[str, Any]:
+        """Decode raw block results into coordinator keys."""
         # Combine results
         results: list[list[int] | None] = []
         for i, (is_input, _addr, _cnt) in enumerate(descriptors):
             results.append(input_results.get(i) if is_input else holding_results.get(i))
 
         # Store raw values using parameter short names
+        now = time.monotonic()
+        fresh = 0
         for i, result in enumerate(results):
             if result is None:
                 continue
             param = param_map_by_index[i]
+            self._register_image[param.short] = (now, result)
+            fresh += 1
             if param.short == "REG_FAN_RUNNING_START" and len(result) >= 2:
                 data["fan_running"] = result[0]
                 data["cooldown"] = result[1]
             else:
                 data[param.short] = result[0]
+        self._reads_fresh += fresh
+        self._reads_cached += len(self._register_image) - fresh
 
         # Decode values using get_modbus_data
         mode_main_raw = data.get("REG_MODE_MAIN_STATUS_IN")
@@ -323,39 +936,47 @@ class VSRCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Decode alarms and switches (slow cycle only)
         if run_slow:
-            data["alarm_saf"] = data.get("REG_ALARM_SAF", 0)
-            data["alarm_eaf"] = data.get("REG_ALARM_EAF", 0)
-            data["alarm_frost_protect"] = data.get("REG_ALARM_FROST_PROT", 0)
-            data["alarm_saf_rpm"] = data.get("REG_ALARM_SAF_RPM", 0)
-            data["alarm_eaf_rpm"] = data.get("REG_ALARM_EAF_RPM", 0)
-            data["alarm_fpt"] = data.get("REG_ALARM_FPT", 0)
-            data["alarm_oat"] = data.get("REG_ALARM_OAT", 0)
-            data["alarm_sat"] = data.get("REG_ALARM_SAT", 0)
-            data["alarm_rat"] = data.get("REG_ALARM_RAT", 0)
-            data["alarm_eat"] = data.get("REG_ALARM_EAT", 0)
-            data["alarm_ect"] = data.get("REG_ALARM_ECT", 0)
-            data["alarm_eft"] = data.get("REG_ALARM_EFT", 0)
-            data["alarm_oht"] = data.get("REG_ALARM_OHT", 0)
-            data["alarm_emt"] = data.get("REG_ALARM_EMT", 0)
-            data["alarm_bys"] = data.get("REG_ALARM_BYS", 0)
-            data["alarm_sec_air"] = data.get("REG_ALARM_SEC_AIR", 0)
-            data["alarm_filter"] = data.get("REG_ALARM_FILTER", 0)
-            data["alarm_rh"] = data.get("REG_ALARM_RH", 0)
-            data["alarm_low_SAT"] = data.get("REG_ALARM_LOW_SAT", 0)
-            data["alarm_pdm_rhs"] = data.get("REG_ALARM_PDM_RHS", 0)
-            data["alarm_pdm_eat"] = data.get("REG_ALARM_PDM_EAT", 0)
-            data["alarm_man_fan_stop"] = data.get("REG_ALARM_MAN_FAN_STOP", 0)
-            data["alarm_overheat_temp"] = data.get("REG_ALARM_OVERHEAT_TEMP", 0)
-            data["alarm_fire"] = data.get("REG_ALARM_FIRE", 0)
-            data["alarm_filter_warn"] = data.get("REG_ALARM_FILTER_WARN", 0)
-            data["alarm_typeA"] = data.get("REG_ALARM_TYPE_A", 0)
-            data["alarm_typeB"] = data.get("REG_ALARM_TYPE_B", 0)
-            data["alarm_typeC"] = data.get("REG_ALARM_TYPE_C", 0)
+            for key, short in ALARM_REGISTERS.items():
+                data[key] = data.get(short, 0)
+            self._diff_alarms(data)
             data["eco_mode"] = self.get_modbus_data(parameter_map["REG_ECO_MODE_ENABLE"])
             data["heater_enable"] = self.get_modbus_data(parameter_map["REG_HEATER_ENABLE"])
             data["rh_transfer"] = self.get_modbus_data(parameter_map["REG_RH_TRANSFER_ENABLE"])
+            raw_efficiency_temp = data.get("REG_TEMP_EFFICENCY")
+            data["temp_efficiency"] = (
+                self._decode_raw(parameter_map["REG_TEMP_EFFICENCY"], raw_efficiency_temp)
+                if raw_efficiency_temp is not None
+                else None
+            )
+
+        # Power, efficiency, airflow and countdown totals, once per poll
+        derive_metrics(data, self.power_model)
+        self.efficiency.update(time.monotonic(), data)
+        countdown_read = self._register_image.get("REG_USERMODE_REMAIN")
+        if self.countdown.update(
+            time.monotonic(), time.time(), data, countdown_read[0] if countdown_read else None
+        ):
+            # Mode changed since 1110/1111 were read: make the next poll slow
+            self._slow_counter = self.slow_cycle_every
+        if self.energy is not None:
+            self.energy.add_sample(time.time(), data)
+            data.update(self.energy.totals())
+        if self.filter_monitor is not None:
+            self.filter_monitor.update(time.time(), data)
+        self.history.add(time.time(), data)
+        for change in self.anomalies.update(data):
+            self.hass.bus.async_fire(
+                EVENT_ANOMALY, {ATTR_CONFIG_ENTRY_ID: self.config_entry.entry_id, **change}
+            )
 
         # Add diagnostics
         data["modbus_failures"] = self._failure_count
+        metrics = self.hub.metrics
+        rates = metrics.roll()
+        data["bus_transactions_per_s"] = rates["transactions_per_s"]
+        data["bus_registers_per_s"] = rates["registers_per_s"]
+        data["bus_bytes_per_s"] = rates["bytes_per_s"]
+        data["bus_response_p95_ms"] = metrics.percentile("response", 0.95)
+        data["bus_queue_wait_p95_ms"] = metrics.percentile("queue_wait", 0.95)
 
         return data
@@ -0,0 +1,158 @@
+"""Derived metrics computed once per poll for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime, timezone
+from typing import Any
+
+from .power_model import PowerModel
+
+# Below this outdoor-to-extract difference the efficiency ratio is noise
+EFFICIENCY_MIN_DELTA_C = 3.0
+# Time constant of the efficiency EWMA (irregular poll intervals are fine)
+EFFICIENCY_TAU_S = 600.0
+# Plausible range for the device's efficiency temperature (12106); an
+# unconnected sensor input reads far outside it
+EFFICIENCY_TEMP_RANGE_C = (-50.0, 80.0)
+
+# Timed user mode -> (configured duration key, seconds per unit); used as the
+# countdown until the device's own value (1110/1111) is read after a change
+MODE_DURATIONS: dict[int, tuple[str, int]] = {
+    2: ("crowded_hours", 3600),
+    3: ("refresh_mins", 60),
+    4: ("fireplace_mins", 60),
+    5: ("away_hours", 3600),
+    6: ("holiday_days", 86400),
+}
+
+
+def heat_recovery_efficiency(
+    outdoor: float | None, supply: float | None, extract: float | None
+) -> float | None:
+    """Supply-side temperature efficiency in %, None when not meaningful."""
+    if outdoor is None or supply is None or extract is None:
+        return None
+    delta = extract - outdoor
+    if abs(delta) < EFFICIENCY_MIN_DELTA_C:
+        return None
+    return max(0.0, min(100.0, (supply - outdoor) / delta * 100))
+
+
+class EfficiencyEstimator:
+    """
+    Smoothed heat-recovery efficiency, O(1) per poll.
+
+    Samples are skipped while the ratio is meaningless: fans stopped, the
+    reheater running (supply air includes its heat) or outdoor and extract
+    temperatures too close. The smoothed value then simply holds. The same
+    formula with the device's efficiency temperature (12106) in place of the
+    extract temperature is reported alongside as a cross-check.
+    """
+
+    __slots__ = ("value", "_last_t")
+
+    def __init__(self) -> None:
+        self.value: float | None = None
+        self._last_t: float | None = None
+
+    def update(self, now: float, data: dict[str, Any]) -> None:
+        outdoor = data.get("temp_outdoor")
+        supply = data.get("temp_supply")
+        valid = bool(data.get("fan_supply")) and not data.get("heater_percentage")
+        sample = (
+            heat_recovery_efficiency(outdoor, supply, data.get("temp_extract")) if valid else None
+        )
+        if sample is not None:
+            if self.value is None or self._last_t is None:
+                self.value = sample
+            else:
+                alpha = 1 - math.exp(-(now - self._last_t) / EFFICIENCY_TAU_S)
+                self.value += alpha * (sample - self.value)
+            self._last_t = now
+
+        reference = None
+        device_temp = data.get("temp_efficiency")
+        low, high = EFFICIENCY_TEMP_RANGE_C
+        if valid and device_temp is not None and low <= device_temp <= high:
+            reference = heat_recovery_efficiency(outdoor, supply, device_temp)
+
+        data["heat_recovery_efficiency"] = round(self.value, 1) if self.value is not None else None
+        data["heat_recovery_efficiency_sample"] = round(sample, 1) if sample is not None else None
+        data["heat_recovery_efficiency_device"] = (
+            round(reference, 1) if reference is not None else None
+        )
+
+
+class CountdownClock:
+    """
+    User mode countdown projected forward between reads of 1110/1111.
+
+    The device value is anchored at the time its registers were read and
+    counted down locally, so the remaining time stays accurate while the
+    registers are only polled on the slow tier. A mode change seen before
+    the registers are re-read starts from the configured mode duration and
+    asks for a re-sync.
+    """
+
+    __slots__ = ("_anchor_s", "_anchor_t", "_read_at", "_mode", "_end")
+
+    def __init__(self) -> None:
+        self._anchor_s = 0
+        self._anchor_t = 0.0
+        self._read_at: float | None = None
+        self._mode: int | None = None
+        self._end: datetime | None = None
+
+    def _anchor(self, remaining_s: int, at: float, now: float, wall: float) -> None:
+        self._anchor_s = remaining_s
+        self._anchor_t = at
+        self._end = (
+            datetime.fromtimestamp(round(wall - (now - at) + remaining_s), timezone.utc)
+            if remaining_s > 0
+            else None
+        )
+
+    def update(
+        self, now: float, wall: float, data: dict[str, Any], read_at: float | None
+    ) -> bool:
+        """
+        Write countdown_total_s and countdown_end; `read_at` is the monotonic
+        time 1110/1111 were last read. Returns True when a re-sync is due.
+        """
+        mode = data.get("mode_main")
+        resync = False
+        if read_at is not None and read_at != self._read_at:
+            self._read_at = read_at
+            low = data.get("REG_USERMODE_REMAIN") or 0
+            high = data.get("REG_USERMODE_FACTOR") or 0
+            self._anchor(low + (high << 16), read_at, now, wall)
+        elif self._mode is not None and mode != self._mode:
+            duration_s = 0
+            configured = MODE_DURATIONS.get(mode)
+            if configured is not None:
+                key, unit_s = configured
+                duration_s = int(data.get(key) or 0) * unit_s
+                resync = True
+            self._anchor(duration_s, now, now, wall)
+        self._mode = mode
+
+        remaining = max(0, int(self._anchor_s - (now - self._anchor_t)))
+        data["countdown_total_s"] = remaining
+        data["countdown_end"] = self._end if remaining else None
+        return resync
+
+
+def derive_metrics(data: dict[str, Any], model: PowerModel) -> None:
+    """Add power and airflow keys to decoded data."""
+    supply_pct = data.get("fan_supply")
+    extract_pct = data.get("fan_extract")
+
+    data["supply_fan_power"] = model.fan_power(supply_pct, data.get("saf_rpm"))
+    data["extract_fan_power"] = model.fan_power(extract_pct, data.get("eaf_rpm"))
+    data["heater_power"] = model.heater_power(data.get("heater_percentage"))
+    data["fans_power"] = (data["supply_fan_power"] or 0.0) + (data["extract_fan_power"] or 0.0)
+    data["total_power"] = round(data["fans_power"] + (data["heater_power"] or 0.0), 1)
+
+    data["supply_airflow"] = model.airflow(supply_pct)
+    data["extract_airflow"] = model.airflow(extract_pct)
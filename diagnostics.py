@@ -0,0 +1,43 @@
+"""Diagnostics support for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, TRANSPORT_SERIAL
+from .coordinator import VSRCoordinator
+from .hub import VSRHub
+
+TO_REDACT = {"host"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    hub: VSRHub = data["hub"]
+    coordinator: VSRCoordinator = data["coordinator"]
+    state = hub.connection_state
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "bus": {
+            "key": hub.bus_key if hub.transport == TRANSPORT_SERIAL else f"{hub.transport}:**REDACTED**",
+            "connection_state": state.value if state is not None else None,
+            "metrics": hub.metrics.as_dict(),
+        },
+        "modbus_failures": coordinator.data.get("modbus_failures") if coordinator.data else None,
+        "coordinator": coordinator.diagnostics(),
+        "poll_traces": {
+            "enabled": coordinator.tracer.enabled,
+            "traces": coordinator.tracer.traces(),
+        },
+    }
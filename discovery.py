@@ -0,0 +1,112 @@
+"""Serial auto-discovery for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+import asyncio
+import glob
+import logging
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from pymodbus.exceptions import ModbusException
+
+from .bus import bus_in_use
+from .const import DEFAULT_BYTESIZE, REG_MODE_MAIN_STATUS_IN, TRANSPORT_SERIAL
+from .hub import VSRHub, serial_bus_key
+
+_LOGGER = logging.getLogger(__name__)
+
+# Per-attempt read timeout: a unit on the right settings answers in ~20 ms
+DISCOVERY_TIMEOUT_S = 0.3
+
+SERIAL_GLOBS = ("/dev/serial/by-id/*", "/dev/ttyUSB*", "/dev/ttyACM*")
+
+# (baudrate, parity, stopbits, slave_id), most likely first: factory default,
+# then common installer changes, then the less common remainder
+SERIAL_CANDIDATES: tuple[tuple[int, str, int, int], ...] = (
+    (9600, "N", 1, 1),
+    (19200, "N", 1, 1),
+    (9600, "E", 1, 1),
+    (115200, "N", 1, 1),
+    (38400, "N", 1, 1),
+    (19200, "E", 1, 1),
+    (9600, "N", 2, 1),
+    (9600, "O", 1, 1),
+    (57600, "N", 1, 1),
+    (9600, "N", 1, 2),
+    (9600, "N", 1, 3),
+)
+
+
+def list_serial_ports() -> list[str]:
+    """
+    Enumerate candidate serial ports, preferring stable /dev/serial/by-id names.
+
+    Blocking (filesystem access): run in the executor.
+    """
+    ports: list[str] = []
+    seen: set[str] = set()
+    for pattern in SERIAL_GLOBS:
+        for path in sorted(glob.glob(pattern)):
+            real = os.path.realpath(path)
+            if real in seen:
+                continue
+            seen.add(real)
+            ports.append(path)
+    return ports
+
+
+async def _async_probe_port(port: str) -> dict[str, Any] | None:
+    """Try candidate settings on one port; stop at the first valid status read."""
+    for baudrate, parity, stopbits, slave_id in SERIAL_CANDIDATES:
+        hub = VSRHub(
+            transport=TRANSPORT_SERIAL,
+            slave_id=slave_id,
+            port=port,
+            baudrate=baudrate,
+            bytesize=DEFAULT_BYTESIZE,
+            parity=parity,
+            stopbits=stopbits,
+        )
+        try:
+            await hub.async_connect()
+            regs = await hub.read_once(
+                REG_MODE_MAIN_STATUS_IN, 1, is_input=True, timeout=DISCOVERY_TIMEOUT_S
+            )
+        except (asyncio.TimeoutError, ModbusException):
+            # Nothing or garbage back: wrong settings, try the next candidate
+            regs = None
+        except Exception as err:  # noqa: BLE001 - port busy, permission denied, ...
+            _LOGGER.debug("Discovery on %s stopped: %s", port, err)
+            return None
+        finally:
+            await hub.async_close()
+
+        # 1160 reports the active user mode (0..8)
+        if regs and 0 <= regs[0] <= 8:
+            _LOGGER.info(
+                "Found SAVE VSR on %s (%s %s%s slave %s)",
+                port, baudrate, parity, stopbits, slave_id,
+            )
+            return {
+                "port": port,
+                "baudrate": baudrate,
+                "bytesize": DEFAULT_BYTESIZE,
+                "parity": parity,
+                "stopbits": stopbits,
+                "slave_id": slave_id,
+            }
+    return None
+
+
+async def async_discover_serial(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Probe all candidate serial ports concurrently and return found units."""
+    ports = await hass.async_add_executor_job(list_serial_ports)
+    # Ports already serving a configured unit keep their settings; re-probing
+    # them with other baud rates would disturb that unit's polling
+    ports = [port for port in ports if not bus_in_use(serial_bus_key(port))]
+    if not ports:
+        return []
+    results = await asyncio.gather(*(_async_probe_port(port) for port in ports))
+    return [found for found in results if found is not None]
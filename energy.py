@@ -0,0 +1,105 @@
+"""Coordinator-side energy integration for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Energy totals are cheap to lose for a few minutes; disk writes are not free
+SAVE_DELAY_S = 300
+# Longest interval integrated between two samples. Longer gaps (downtime,
+# restarts, a dead line) only count this much, at the power seen around them
+MAX_GAP_S = 120.0
+
+# Meter -> coordinator power key (W)
+ENERGY_METERS: dict[str, str] = {
+    "fans_energy": "fans_power",
+    "heater_energy": "heater_power",
+}
+
+
+class VSREnergyIntegrator:
+    """
+    Integrate derived power into kWh with the trapezoidal rule.
+
+    Totals are kept at full float precision and persisted with a delayed
+    save; entities only display them. The last sample is stored too, so the
+    first poll after a restart integrates across the (capped) downtime.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.energy"
+        )
+        self._totals: dict[str, float] = {}
+        # Meters whose total came from the store; the others only hold what
+        # was integrated since this start
+        self._stored: set[str] = set()
+        # (unix time, meter -> power W) of the previous sample
+        self._last: tuple[float, dict[str, float]] | None = None
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        self._totals = {k: float(v) for k, v in data.get("totals", {}).items()}
+        self._stored = set(self._totals)
+        last = data.get("last")
+        if last:
+            self._last = (float(last["t"]), {k: float(v) for k, v in last["power"].items()})
+        _LOGGER.debug("Loaded energy totals: %s", self._totals)
+
+    async def async_save(self) -> None:
+        """Write now (unload); normal updates use the delayed save."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    def seed(self, meter: str, kwh: float) -> None:
+        """
+        Apply a total restored elsewhere (entity state), whenever it arrives.
+
+        A meter without a stored total (entities from before the store)
+        continues from the restored value plus what was integrated since
+        startup, even if polls ran first. A stored total never goes down:
+        the larger of the two wins, so the Energy dashboard cannot step back.
+        """
+        current = self._totals.get(meter, 0.0)
+        if meter in self._stored:
+            total = max(current, kwh)
+        else:
+            total = kwh + current
+            self._stored.add(meter)
+        if total != current:
+            _LOGGER.info("Seeding %s from restored state: %.4f kWh", meter, total)
+            self._totals[meter] = total
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY_S)
+
+    def add_sample(self, timestamp: float, data: dict[str, Any]) -> None:
+        """Integrate from the previous sample to this poll's power values."""
+        power = {meter: float(data.get(key) or 0.0) for meter, key in ENERGY_METERS.items()}
+        if self._last is not None:
+            last_t, last_power = self._last
+            dt = min(timestamp - last_t, MAX_GAP_S)
+            if dt > 0:
+                for meter, watts in power.items():
+                    avg_w = (last_power.get(meter, watts) + watts) / 2
+                    self._totals[meter] = self._totals.get(meter, 0.0) + avg_w * dt / 3_600_000
+        self._last = (timestamp, power)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY_S)
+
+    def totals(self) -> dict[str, float]:
+        return dict(self._totals)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"totals": dict(self._totals)}
+        if self._last is not None:
+            data["last"] = {"t": self._last[0], "power": self._last[1]}
+        return data
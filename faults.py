@@ -0,0 +1,209 @@
+"""Fault injection around a Modbus client for Systemair SAVE VSR.
+
+`VSRFaultInjectingClient` wraps whatever client the hub would use (pymodbus,
+replay or the simulated unit below) and, per request, may delay it, drop
+the response, answer with an exception code, return fewer registers than
+asked for, or drop the connection. The profile is shared and mutable, so a
+scenario can switch faults on and off while the coordinator keeps polling
+(see benchmarks/fault_scenarios.py).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from pymodbus.exceptions import ConnectionException
+
+from .const import REG_MODE_MAIN_CMD, REG_MODE_MAIN_STATUS_IN
+from .traffic import ReplayResponse
+
+# A dropped response is held this long; the hub's own timeout fires first
+DROP_HOLD_S = 3600.0
+
+
+@dataclass
+class FaultProfile:
+    """
+    Fault probabilities (0..1) and timings applied to each request.
+
+    Attributes
+    ----------
+        delay_s / jitter_s: Added latency, uniform in delay_s +/- jitter_s.
+        drop_rate: No response at all (the caller times out).
+        exception_rate / exception_code: Modbus exception response.
+        partial_rate: Reads return a random non-empty prefix of the registers.
+        disconnect_rate: The connection is closed and the request fails.
+        addresses: Only requests starting at these addresses are affected
+            (None = all).
+    """
+
+    delay_s: float = 0.0
+    jitter_s: float = 0.0
+    drop_rate: float = 0.0
+    exception_rate: float = 0.0
+    exception_code: int = 2
+    partial_rate: float = 0.0
+    disconnect_rate: float = 0.0
+    addresses: frozenset[int] | None = None
+    seed: int | None = None
+
+    def clear(self) -> None:
+        """Back to a healthy line (keeps the seed)."""
+        self.delay_s = self.jitter_s = 0.0
+        self.drop_rate = self.exception_rate = self.partial_rate = self.disconnect_rate = 0.0
+        self.addresses = None
+
+
+@dataclass
+class FaultStats:
+    """What the injector did, and how much line time it cost."""
+
+    requests: int = 0
+    faulted: int = 0
+    dropped: int = 0
+    exceptions: int = 0
+    partial: int = 0
+    disconnects: int = 0
+    # Time spent on requests that did not yield a full, valid answer
+    wasted_s: float = 0.0
+    busy_s: float = 0.0
+
+
+class VSRFaultInjectingClient:
+    """Client wrapper injecting the faults of a shared FaultProfile."""
+
+    def __init__(self, inner: Any, profile: FaultProfile, stats: FaultStats | None = None) -> None:
+        self._inner = inner
+        self.profile = profile
+        self.stats = stats if stats is not None else FaultStats()
+        self._rng = random.Random(profile.seed)
+        self._disconnected = False
+
+    @property
+    def connected(self) -> bool:
+        return not self._disconnected and self._inner.connected
+
+    async def connect(self) -> bool:
+        self._disconnected = False
+        return await self._inner.connect()
+
+    def close(self) -> None:
+        self._inner.close()
+
+    def _hit(self, rate: float) -> bool:
+        return rate > 0 and self._rng.random() < rate
+
+    async def _call(
+        self, address: int, count: int, call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        profile = self.profile
+        stats = self.stats
+        stats.requests += 1
+        started = time.monotonic()
+        wasted = True
+        try:
+            if profile.addresses is not None and address not in profile.addresses:
+                resp = await call()
+                wasted = resp.isError()
+                return resp
+
+            delay = profile.delay_s + self._rng.uniform(-profile.jitter_s, profile.jitter_s)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self._hit(profile.disconnect_rate):
+                stats.faulted += 1
+                stats.disconnects += 1
+                self._disconnected = True
+                self._inner.close()
+                raise ConnectionException("Injected disconnect")
+            if self._hit(profile.drop_rate):
+                stats.faulted += 1
+                stats.dropped += 1
+                await asyncio.sleep(DROP_HOLD_S)
+            if self._hit(profile.exception_rate):
+                stats.faulted += 1
+                stats.exceptions += 1
+                return ReplayResponse(None, profile.exception_code)
+
+            resp = await call()
+            registers = getattr(resp, "registers", None)
+            if count > 1 and registers and not resp.isError() and self._hit(profile.partial_rate):
+                stats.faulted += 1
+                stats.partial += 1
+                return ReplayResponse(list(registers[: self._rng.randint(1, count - 1)]))
+            wasted = resp.isError()
+            return resp
+        finally:
+            elapsed = time.monotonic() - started
+            stats.busy_s += elapsed
+            if wasted:
+                stats.wasted_s += elapsed
+
+    async def read_input_registers(self, address: int, *, count: int = 1, device_id: int = 1) -> Any:
+        return await self._call(
+            address, count, lambda: self._inner.read_input_registers(address, count=count, device_id=device_id)
+        )
+
+    async def read_holding_registers(self, address: int, *, count: int = 1, device_id: int = 1) -> Any:
+        return await self._call(
+            address, count, lambda: self._inner.read_holding_registers(address, count=count, device_id=device_id)
+        )
+
+    async def write_register(self, address: int, value: int, *, device_id: int = 1) -> Any:
+        return await self._call(
+            address, 1, lambda: self._inner.write_register(address, value, device_id=device_id)
+        )
+
+    async def write_coil(self, address: int, value: bool, *, device_id: int = 1) -> Any:
+        return await self._call(
+            address, 1, lambda: self._inner.write_coil(address, value, device_id=device_id)
+        )
+
+
+class VSRSimulatedClient:
+    """
+    In-memory unit answering every register (0 unless set).
+
+    Registers are addressed as in modbus.py; writes to the main-mode command
+    (1161) show up in the status register (1160) as command - 1.
+    """
+
+    def __init__(self, registers: dict[int, int] | None = None, latency_s: float = 0.005) -> None:
+        self.registers: dict[int, int] = dict(registers or {})
+        self.latency_s = latency_s
+        self.connected = False
+
+    async def connect(self) -> bool:
+        self.connected = True
+        return True
+
+    def close(self) -> None:
+        self.connected = False
+
+    async def _read(self, address: int, count: int) -> ReplayResponse:
+        if not self.connected:
+            raise ConnectionException("Simulated unit not connected")
+        await asyncio.sleep(self.latency_s)
+        return ReplayResponse([self.registers.get(address + i, 0) for i in range(count)])
+
+    async def read_input_registers(self, address: int, *, count: int = 1, device_id: int = 1) -> ReplayResponse:
+        return await self._read(address, count)
+
+    async def read_holding_registers(self, address: int, *, count: int = 1, device_id: int = 1) -> ReplayResponse:
+        return await self._read(address, count)
+
+    async def write_register(self, address: int, value: int, *, device_id: int = 1) -> ReplayResponse:
+        await asyncio.sleep(self.latency_s)
+        self.registers[address] = value
+        if address == REG_MODE_MAIN_CMD:
+            self.registers[REG_MODE_MAIN_STATUS_IN] = max(0, value - 1)
+        return ReplayResponse([value])
+
+    async def write_coil(self, address: int, value: bool, *, device_id: int = 1) -> ReplayResponse:
+        await asyncio.sleep(self.latency_s)
+        self.registers[address] = int(value)
+        return ReplayResponse([int(value)])
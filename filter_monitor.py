@@ -0,0 +1,188 @@
+"""Filter clogging detection from supply fan RPM versus duty."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY_S = 600
+
+# One regression sample per 5 minutes; consecutive polls add no information
+SAMPLE_INTERVAL_S = 300
+# Duty buckets of 10 %; below 10 % the RPM reading is too coarse
+BUCKET_PCT = 10
+MIN_DUTY_PCT = 10
+# Samples per bucket that define the clean-filter baseline (~1 day of use)
+BASELINE_SAMPLES = 288
+# Forgetting factor of the current fit (~ 1 week of samples at one bucket)
+CURRENT_DECAY = 1 - 1 / 2000
+TREND_DECAY = 1 - 1 / 4000
+# RPM rise (%) assumed to trip the filter alarm until one has been observed
+DEFAULT_ALARM_DRIFT_PCT = 15.0
+# Raw value of an inactive alarm (see ALARM_VALUE_TO_STATE); 1 Active,
+# 2 Waiting and 3 Cleared (error still active) all mean the filter is dirty
+ALARM_INACTIVE = 0
+
+
+class LinearFit:
+    """Incremental least squares y = a + b·x with optional forgetting, O(1)."""
+
+    __slots__ = ("n", "sx", "sy", "sxx", "sxy")
+
+    def __init__(self, sums: list[float] | None = None) -> None:
+        self.n, self.sx, self.sy, self.sxx, self.sxy = sums or (0.0, 0.0, 0.0, 0.0, 0.0)
+
+    def add(self, x: float, y: float, decay: float = 1.0) -> None:
+        self.n = self.n * decay + 1
+        self.sx = self.sx * decay + x
+        self.sy = self.sy * decay + y
+        self.sxx = self.sxx * decay + x * x
+        self.sxy = self.sxy * decay + x * y
+
+    def slope(self) -> float | None:
+        det = self.n * self.sxx - self.sx * self.sx
+        if self.n < 2 or abs(det) < 1e-9:
+            return None
+        return (self.n * self.sxy - self.sx * self.sy) / det
+
+    def predict(self, x: float) -> float | None:
+        if self.n < 1:
+            return None
+        b = self.slope()
+        if b is None:
+            return self.sy / self.n
+        return (self.sy - b * self.sx) / self.n + b * x
+
+    def as_list(self) -> list[float]:
+        return [self.n, self.sx, self.sy, self.sxx, self.sxy]
+
+
+class VSRFilterMonitor:
+    """
+    Track how much faster the supply fan spins at a given duty than it did
+    with a clean filter.
+
+    Each 10 % duty bucket keeps two RPM-vs-duty fits: a frozen baseline
+    from the first samples after a filter change and a slowly forgetting
+    current fit. The drift score is the mean relative RPM rise at the
+    bucket centres. A forgetting fit of drift over time extrapolates to the
+    drift at which the filter alarm (15141) last tripped.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.filter"
+        )
+        self._baseline: dict[int, LinearFit] = {}
+        self._current: dict[int, LinearFit] = {}
+        self._trend = LinearFit()
+        # Trend x axis is days since this time (keeps the sums well conditioned)
+        self._origin = 0.0
+        self._alarm_drift = DEFAULT_ALARM_DRIFT_PCT
+        self._alarm_active = False
+        self._last_sample = 0.0
+        self.drift: float | None = None
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        self._baseline = {int(k): LinearFit(v) for k, v in data.get("baseline", {}).items()}
+        self._current = {int(k): LinearFit(v) for k, v in data.get("current", {}).items()}
+        if "trend" in data:
+            self._trend = LinearFit(data["trend"])
+        self._origin = data.get("origin", 0.0)
+        self._alarm_drift = data.get("alarm_drift", DEFAULT_ALARM_DRIFT_PCT)
+        self._alarm_active = data.get("alarm_active", False)
+        self._last_sample = data.get("last_sample", 0.0)
+        self.drift = self._drift()
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    def reset(self) -> None:
+        """Filter replaced: learn a new baseline."""
+        _LOGGER.info("Filter change detected; learning a new RPM baseline")
+        self._baseline.clear()
+        self._current.clear()
+        self._trend = LinearFit()
+        self.drift = None
+
+    def _drift(self) -> float | None:
+        total = weight = 0.0
+        for bucket, current in self._current.items():
+            baseline = self._baseline.get(bucket)
+            if baseline is None or baseline.n < BASELINE_SAMPLES:
+                continue
+            centre = bucket * BUCKET_PCT + BUCKET_PCT / 2
+            base_rpm = baseline.predict(centre)
+            cur_rpm = current.predict(centre)
+            if not base_rpm or cur_rpm is None:
+                continue
+            total += (cur_rpm - base_rpm) / base_rpm * 100 * current.n
+            weight += current.n
+        return total / weight if weight else None
+
+    def update(self, timestamp: float, data: dict[str, Any]) -> None:
+        """Feed one poll; writes filter_drift and days_until_filter_alarm."""
+        alarm = data.get("alarm_filter")
+        if alarm is not None:
+            active = alarm != ALARM_INACTIVE
+            if active and not self._alarm_active and self.drift is not None and self.drift > 0:
+                # Calibrate the alarm point of this unit
+                self._alarm_drift = self.drift
+            elif self._alarm_active and not active:
+                # Back to 0 only once the filter was replaced and the alarm reset
+                self.reset()
+            if active != self._alarm_active:
+                self._alarm_active = active
+                self._store.async_delay_save(self._data_to_save, SAVE_DELAY_S)
+
+        duty = data.get("fan_supply")
+        rpm = data.get("saf_rpm")
+        if (
+            duty is not None
+            and rpm
+            and duty >= MIN_DUTY_PCT
+            and timestamp - self._last_sample >= SAMPLE_INTERVAL_S
+        ):
+            self._last_sample = timestamp
+            bucket = min(int(duty // BUCKET_PCT), 100 // BUCKET_PCT - 1)
+            baseline = self._baseline.setdefault(bucket, LinearFit())
+            if baseline.n < BASELINE_SAMPLES:
+                baseline.add(duty, rpm)
+            self._current.setdefault(bucket, LinearFit()).add(duty, rpm, CURRENT_DECAY)
+            self.drift = self._drift()
+            if self.drift is not None:
+                if self._trend.n == 0:
+                    self._origin = timestamp
+                self._trend.add((timestamp - self._origin) / 86400, self.drift, TREND_DECAY)
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY_S)
+
+        data["filter_drift"] = round(self.drift, 2) if self.drift is not None else None
+        data["days_until_filter_alarm"] = self._days_until_alarm()
+
+    def _days_until_alarm(self) -> float | None:
+        if self.drift is None or self._alarm_active:
+            return None
+        rate = self._trend.slope()  # % per day
+        if rate is None or rate <= 0:
+            return None
+        return round(max(0.0, (self._alarm_drift - self.drift) / rate), 1)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "baseline": {str(k): v.as_list() for k, v in self._baseline.items()},
+            "current": {str(k): v.as_list() for k, v in self._current.items()},
+            "trend": self._trend.as_list(),
+            "origin": self._origin,
+            "alarm_drift": self._alarm_drift,
+            "alarm_active": self._alarm_active,
+            "last_sample": self._last_sample,
+        }
@@ -0,0 +1,136 @@
+"""Compact in-memory history of recent samples for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+from .modbus import IntegerType, parameter_map
+
+# One sample per minute, for the last day
+SAMPLE_INTERVAL_S = 60
+HISTORY_HOURS = 24
+
+# Stored value for "not read"; collides only with raw 0x8000, which none of
+# the fields below can report
+MISSING = -32768
+
+# History field -> register it is sampled from (kept at raw register scale)
+HISTORY_FIELDS: dict[str, str] = {
+    "temp_outdoor": "REG_TEMP_OUTDOOR",
+    "temp_supply": "REG_TEMP_SUPPLY",
+    "temp_extract": "REG_TEMP_EXTRACT",
+    "temp_exhaust": "REG_TEMP_EXHAUST",
+    "fan_supply": "REG_SUPPLY_FAN_PCT",
+    "fan_extract": "REG_EXTRACT_FAN_PCT",
+    "saf_rpm": "REG_SAF_RPM",
+    "eaf_rpm": "REG_EAF_RPM",
+    "heater_percentage": "REG_HEATER_PERCENT",
+}
+
+
+class SampleHistory:
+    """
+    Fixed-size ring buffer: one int16 array per field plus int64 timestamps.
+
+    Memory is allocated once, at capacity * (8 + 2 * fields) bytes (about
+    37 kB for the defaults), and never grows.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, str] = HISTORY_FIELDS,
+        hours: int = HISTORY_HOURS,
+        interval_s: int = SAMPLE_INTERVAL_S,
+    ) -> None:
+        self.fields = dict(fields)
+        self.interval_s = interval_s
+        self.capacity = hours * 3600 // interval_s
+        self._times = array("q", [0]) * self.capacity
+        self._values = {name: array("h", [MISSING]) * self.capacity for name in self.fields}
+        self._next = 0
+        self._size = 0
+        self._last_t = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        return self._times.itemsize * self.capacity + sum(
+            values.itemsize * self.capacity for values in self._values.values()
+        )
+
+    def add(self, timestamp: float, data: dict[str, Any]) -> None:
+        """Record the current raw registers, at most once per interval."""
+        t = int(timestamp)
+        if self._size and t - self._last_t < self.interval_s:
+            return
+        i = self._next
+        self._times[i] = t
+        for name, short in self.fields.items():
+            raw = data.get(short)
+            self._values[name][i] = MISSING if raw is None else (raw - 65536 if raw > 32767 else raw)
+        self._last_t = t
+        self._next = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def _decode(self, name: str, stored: int) -> float | int | None:
+        if stored == MISSING:
+            return None
+        param = parameter_map[self.fields[name]]
+        raw = stored if param.sig == IntegerType.INT else stored & 0xFFFF
+        return raw / param.scale_factor if param.scale_factor else raw
+
+    def _indices(self, start: float | None, end: float | None) -> list[int]:
+        """Buffer positions inside [start, end], oldest first."""
+        first = (self._next - self._size) % self.capacity
+        out = []
+        for k in range(self._size):
+            i = (first + k) % self.capacity
+            t = self._times[i]
+            if (start is None or t >= start) and (end is None or t <= end):
+                out.append(i)
+        return out
+
+    def query(self, start: float | None = None, end: float | None = None) -> list[dict[str, Any]]:
+        """Decoded samples in a time slice, oldest first."""
+        return [
+            {
+                "t": self._times[i],
+                **{name: self._decode(name, self._values[name][i]) for name in self.fields},
+            }
+            for i in self._indices(start, end)
+        ]
+
+    def aggregate(
+        self, start: float | None, end: float | None, bucket_s: int
+    ) -> list[dict[str, Any]]:
+        """Min / max / mean per field for fixed time buckets (empty buckets omitted)."""
+        buckets: dict[int, dict[str, list[float]]] = {}
+        for i in self._indices(start, end):
+            key = self._times[i] // bucket_s * bucket_s
+            bucket = buckets.setdefault(key, {})
+            for name in self.fields:
+                value = self._decode(name, self._values[name][i])
+                if value is None:
+                    continue
+                stats = bucket.get(name)
+                if stats is None:
+                    bucket[name] = [value, value, value, 1]
+                else:
+                    stats[0] = min(stats[0], value)
+                    stats[1] = max(stats[1], value)
+                    stats[2] += value
+                    stats[3] += 1
+        return [
+            {
+                "t": key,
+                **{
+                    name: {"min": lo, "max": hi, "mean": round(total / n, 2)}
+                    for name, (lo, hi, total, n) in fields.items()
+                },
+            }
+            for key, fields in sorted(buckets.items())
+        ]
@@ -2,18 +2,32 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Literal, Optional
+import os
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal, Optional
 
+from pymodbus import FramerType
 from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
+from .bus import VSRBus, acquire_bus, async_release_bus
+from .connection import CircuitOpenError, ConnectionState
+from .metrics import HubMetrics
+from .tracing import CURRENT_SPAN
+
+if TYPE_CHECKING:
+    # Capture and replay tooling is only loaded when it is used
+    from .traffic import TrafficRecorder, VSRReplayClient
+
 from .const import (
     DEFAULT_BAUDRATE,
     DEFAULT_BYTESIZE,
     DEFAULT_PARITY,
+    DEFAULT_PIPELINE_DEPTH,
     DEFAULT_SLAVE_ID,
     DEFAULT_STOPBITS,
     DEFAULT_TCP_PORT,
+    TRANSPORT_REPLAY,
+    TRANSPORT_RTU_TCP,
     TRANSPORT_SERIAL,
     TRANSPORT_TCP,
 )
@@ -26,15 +40,27 @@ IO_TIMEOUT_S = 10.0
 IO_ATTEMPTS = 3
 # Backoff between attempts
 IO_BACKOFF_S = 0.1
-# Inter-message delay for serial stability
+# Inter-message delay for serial stability (shared by all units on a line)
 MESSAGE_WAIT_MS = 30
+# Timeout for single-shot probe reads (unsupported registers answer fast)
+PROBE_TIMEOUT_S = 2.0
+
+
+def serial_bus_key(port: str) -> str:
+    """
+    Bus registry key of a serial port.
+
+    Symlinks are resolved so /dev/serial/by-id/... and /dev/ttyUSB0 naming
+    the same adapter share one bus instead of contending for the port.
+    """
+    return f"{TRANSPORT_SERIAL}:{os.path.realpath(port)}"
 
 
 class VSRHub:
     def __init__(
         self,
         *,
-        transport: Literal["serial", "tcp"],
+        transport: Literal["serial", "tcp", "rtu_tcp", "replay"],
         slave_id: int = DEFAULT_SLAVE_ID,
         # Serial
         port: Optional[str] = None,
@@ -45,6 +71,9 @@ class VSRHub:
         # TCP
         host: Optional[str] = None,
         tcp_port: int = DEFAULT_TCP_PORT,
+        pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+        # Replay (port is the capture file)
+        replay_speed: float = 1.0,
     ) -> None:
         self.transport = transport
         self.slave_id = slave_id
@@ -57,17 +86,42 @@ class VSRHub:
 
         self.host = host
         self.tcp_port = tcp_port
+        self.pipeline_depth = pipeline_depth
+        self.replay_speed = replay_speed
 
-        self._client: Optional[AsyncModbusSerialClient | AsyncModbusTcpClient] = None
-        self._lock = asyncio.Lock()
-        self._consecutive_failures = 0
-        self._max_consecutive_failures = 3  # Trigger reconnect after this
+        self._bus: Optional[VSRBus] = None
+        self._replay_client: Optional[VSRReplayClient] = None
+        self.metrics = HubMetrics(mbap=transport == TRANSPORT_TCP)
+        self.recorder: Optional[TrafficRecorder] = None
 
-    async def async_connect(self) -> None:
-        await self.async_close()  # Ensure clean start
+    @property
+    def bus_key(self) -> str:
+        """Identity of the physical line this unit is on."""
+        if self.transport == TRANSPORT_SERIAL:
+            return serial_bus_key(self.port)
+        if self.transport == TRANSPORT_REPLAY:
+            return f"{self.transport}:{self.port}"
+        return f"{self.transport}:{self.host}:{self.tcp_port}"
+
+    @property
+    def line_settings(self) -> Optional[tuple[Any, ...]]:
+        """Serial settings shared by every unit on this line."""
+        if self.transport == TRANSPORT_SERIAL:
+            return (self.baudrate, self.bytesize, self.parity, self.stopbits)
+        return None
+
+    def _create_client(self) -> Any:
+        """Client factory of the bus (benchmarks override it to wrap the client)."""
+        if self.transport == TRANSPORT_REPLAY:
+            # Reconnects keep the replay position
+            if self._replay_client is None:
+                from .traffic import VSRReplayClient
+
+                self._replay_client = VSRReplayClient(self.port or "", self.replay_speed)
+            return self._replay_client
         if self.transport == TRANSPORT_SERIAL:
             # CHANGED: Removed method="rtu" and strict=False (not supported in 3.11.2)
-            self._client = AsyncModbusSerialClient(
+            return AsyncModbusSerialClient(
                 port=self.port,
                 baudrate=self.baudrate,
                 bytesize=self.bytesize,
@@ -75,122 +129,219 @@ class VSRHub:
                 stopbits=self.stopbits,
                 timeout=IO_TIMEOUT_S,
             )
-        else:
-            self._client = AsyncModbusTcpClient(
-                host=self.host, port=self.tcp_port, timeout=IO_TIMEOUT_S
+        if self.transport == TRANSPORT_RTU_TCP:
+            # Transparent bridge: RTU framing (with CRC) inside a TCP stream
+            return AsyncModbusTcpClient(
+                host=self.host, port=self.tcp_port, framer=FramerType.RTU, timeout=IO_TIMEOUT_S
             )
-        connected = await self._client.connect()
-        if not connected:
-            raise ConnectionError("Failed to connect Modbus client")
-        self._consecutive_failures = 0
+        return AsyncModbusTcpClient(
+            host=self.host, port=self.tcp_port, timeout=IO_TIMEOUT_S
+        )
+
+    async def async_connect(self) -> None:
+        """Join the shared bus for this line and make sure it is connected."""
+        if self._bus is None:
+            if self.transport in (TRANSPORT_SERIAL, TRANSPORT_RTU_TCP):
+                # The far end of an RTU bridge is still a half-duplex RS485 line
+                pacing_s, depth = MESSAGE_WAIT_MS / 1000, 1
+            elif self.transport == TRANSPORT_REPLAY:
+                pacing_s, depth = 0.0, 1
+            else:
+                pacing_s, depth = 0.0, self.pipeline_depth
+            self._bus = acquire_bus(
+                self.bus_key, self._create_client, pacing_s, depth, self.line_settings
+            )
+        await self._bus.async_ensure_connected()
         _LOGGER.debug("Modbus client connected successfully")
 
+    @property
+    def connection_state(self) -> ConnectionState | None:
+        return self._bus.connection.state if self._bus is not None else None
+
+    def start_recording(self, path: str) -> None:
+        """Log every transaction of this unit to a JSONL capture (see traffic.py)."""
+        if self.recorder is not None:
+            raise RuntimeError(f"Already recording to {self.recorder.path}")
+        from .traffic import TrafficRecorder
+
+        self.recorder = TrafficRecorder(path)
+
+    async def async_stop_recording(self) -> Optional[str]:
+        """Flush and close the capture; returns its path."""
+        recorder, self.recorder = self.recorder, None
+        if recorder is None:
+            return None
+        await recorder.async_close()
+        return recorder.path
+
     async def async_close(self) -> None:
-        if self._client is not None:
-            try:
-                self._client.close()
-            except Exception as e:
-                _LOGGER.debug("Error closing Modbus client: %s", e)
-            self._client = None
+        """Leave the shared bus; the last unit on it closes the client."""
+        await self.async_stop_recording()
+        if self._bus is not None:
+            bus, self._bus = self._bus, None
+            await async_release_bus(bus)
 
-    async def _ensure(self) -> None:
-        if self._client is None or not self._client.connected:
+    async def _ensure(self) -> VSRBus:
+        if self._bus is None:
             await self.async_connect()
+        return self._bus  # type: ignore[return-value]
 
-    def _handle_failure(self, exc: Exception) -> None:
-        _LOGGER.debug("Modbus operation failed: %s", exc)
-        self._consecutive_failures += 1
-        if self._consecutive_failures >= self._max_consecutive_failures:
-            _LOGGER.warning("Too many consecutive failures; forcing reconnect")
-            asyncio.create_task(self.async_connect())  # Async reconnect
+    async def _transact(
+        self,
+        bus: VSRBus,
+        function_code: int,
+        address: int,
+        count: int,
+        call: Callable[[Any], Awaitable[Any]],
+        timeout: float,
+    ) -> Any:
+        """One transaction on the bus, timed for queue wait and response."""
+        loop = asyncio.get_running_loop()
+        queued = loop.time()
+        started: float | None = None
 
-    async def read_input(self, address: int, count: int = 1) -> Optional[list[int]]:
-        async with self._lock:
-            await self._ensure()
-            last_exc = None
-            for attempt in range(IO_ATTEMPTS):
-                try:
-                    # CHANGED: address positional, count= and device_id= as keywords
-                    rr = await asyncio.wait_for(
-                        self._client.read_input_registers(address, count=count, device_id=self.slave_id),
-                        timeout=IO_TIMEOUT_S,
+        async def attempt(client: Any) -> Any:
+            nonlocal started
+            started = loop.time()
+            return await asyncio.wait_for(call(client), timeout=timeout)
+
+        ok = False
+        resp = None
+        error: BaseException | None = None
+        try:
+            resp = await bus.execute(self.slave_id, attempt)
+            ok = not resp.isError()
+            return resp
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            # Requests refused before reaching the wire are not transactions
+            if started is not None:
+                elapsed = loop.time() - started
+                self.metrics.record_attempt(function_code, count, started - queued, elapsed, ok)
+                if self.recorder is not None:
+                    self.recorder.record(
+                        function_code, self.slave_id, address, count, resp, elapsed, error
                     )
-                    if rr.isError():
-                        raise ModbusException(f"Read input error: {rr}")
-                    return rr.registers
-                except (asyncio.TimeoutError, ModbusException) as e:
-                    self._handle_failure(e)
-                    last_exc = e
-                if attempt + 1 < IO_ATTEMPTS:
-                    await asyncio.sleep(IO_BACKOFF_S)
-            _LOGGER.error("Failed to read input at %s after %d attempts: %s", address, IO_ATTEMPTS, last_exc)
-            return None
+
+    async def _request(
+        self,
+        name: str,
+        function_code: int,
+        address: int,
+        count: int,
+        call: Callable[[Any], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run one Modbus request on the shared bus with retries.
+
+        Each attempt is queued separately, so retries do not hold the line
+        while other units are waiting. Returns the response or None; raises
+        CircuitOpenError without retrying while the line is known to be down.
+        """
+        bus = await self._ensure()
+        # Block span of a traced poll, if any
+        trace = CURRENT_SPAN.get()
+
+        # A unit that keeps timing out gets one attempt per request, so it
+        # does not hold the shared line for IO_ATTEMPTS timeouts each time
+        attempts = 1 if bus.slave_unresponsive(self.slave_id) else IO_ATTEMPTS
+        last_exc = None
+        for attempt_no in range(attempts):
+            if trace is not None:
+                trace.attrs["attempts"] = attempt_no + 1
+            try:
+                resp = await self._transact(bus, function_code, address, count, call, IO_TIMEOUT_S)
+                if resp.isError():
+                    raise ModbusException(f"{name} error: {resp}")
+                self.metrics.record_request(function_code, attempt_no + 1, True)
+                return resp
+            except CircuitOpenError:
+                self.metrics.record_request(function_code, attempt_no + 1, False)
+                raise
+            except (asyncio.TimeoutError, ModbusException, ConnectionError) as e:
+                _LOGGER.debug("Modbus operation failed: %s", e)
+                last_exc = e
+            if attempt_no + 1 < attempts:
+                await asyncio.sleep(IO_BACKOFF_S)
+        self.metrics.record_request(function_code, attempts, False)
+        _LOGGER.error("Failed to %s at %s after %d attempts: %s", name, address, attempts, last_exc)
+        return None
+
+    async def read_input(self, address: int, count: int = 1) -> Optional[list[int]]:
+        # CHANGED: address positional, count= and device_id= as keywords
+        rr = await self._request(
+            "read input",
+            4,
+            address,
+            count,
+            lambda c: c.read_input_registers(address, count=count, device_id=self.slave_id),
+        )
+        return rr.registers if rr is not None else None
 
     async def read_holding(self, address: int, count: int = 1) -> Optional[list[int]]:
-        async with self._lock:
-            await self._ensure()
-            last_exc = None
-            for attempt in range(IO_ATTEMPTS):
-                try:
-                    # CHANGED: address positional, count= and device_id= as keywords
-                    rr = await asyncio.wait_for(
-                        self._client.read_holding_registers(address, count=count, device_id=self.slave_id),
-                        timeout=IO_TIMEOUT_S,
-                    )
-                    if rr.isError():
-                        raise ModbusException(f"Read holding error: {rr}")
-                    return rr.registers
-                except (asyncio.TimeoutError, ModbusException) as e:
-                    self._handle_failure(e)
-                    last_exc = e
-                if attempt + 1 < IO_ATTEMPTS:
-                    await asyncio.sleep(IO_BACKOFF_S)
-            _LOGGER.error("Failed to read holding at %s after %d attempts: %s", address, IO_ATTEMPTS, last_exc)
+        # CHANGED: address positional, count= and device_id= as keywords
+        rr = await self._request(
+            "read holding",
+            3,
+            address,
+            count,
+            lambda c: c.read_holding_registers(address, count=count, device_id=self.slave_id),
+        )
+        return rr.registers if rr is not None else None
+
+    async def read_once(
+        self, address: int, count: int, *, is_input: bool, timeout: float = PROBE_TIMEOUT_S
+    ) -> Optional[list[int]]:
+        """
+        Single read attempt without retries or failure accounting.
+
+        Used for probing: an exception response for an unsupported register
+        is an expected answer here, not a reason to reconnect, and returns
+        None. Transport errors (timeout, lost connection, open circuit) say
+        nothing about the register and are raised to the caller.
+        """
+        bus = await self._ensure()
+
+        def call(client: Any) -> Awaitable[Any]:
+            request = client.read_input_registers if is_input else client.read_holding_registers
+            return request(address, count=count, device_id=self.slave_id)
+
+        rr = await self._transact(bus, 4 if is_input else 3, address, count, call, timeout)
+        if rr.isError():
+            _LOGGER.debug("Probe read at %s (count=%s) rejected: %s", address, count, rr)
             return None
+        return rr.registers
 
-    async def write_register(self, address: int, value: int) -> bool:
-        async with self._lock:
-            await self._ensure()
-            last_exc = None
-            for attempt in range(IO_ATTEMPTS):
-                try:
-                    # CHANGED: address and value positional, device_id= as keyword
-                    wr = await asyncio.wait_for(
-                        self._client.write_register(address, value, device_id=self.slave_id),
-                        timeout=IO_TIMEOUT_S,
-                    )
-                    if wr.isError():
-                        raise ModbusException(f"Write register error: {wr}")
-                    return True
-                except (asyncio.TimeoutError, ModbusException) as e:
-                    self._handle_failure(e)
-                    last_exc = e
-                if attempt + 1 < IO_ATTEMPTS:
-                    await asyncio.sleep(IO_BACKOFF_S)
-            _LOGGER.error("Failed to write register at %s after %d attempts: %s", address, IO_ATTEMPTS, last_exc)
+    async def _write(
+        self, name: str, function_code: int, address: int, call: Callable[[Any], Awaitable[Any]]
+    ) -> bool:
+        """Run a write; False if it failed, including while the line is down."""
+        try:
+            wr = await self._request(name, function_code, address, 1, call)
+        except CircuitOpenError as e:
+            _LOGGER.warning("Cannot %s at %s: %s", name, address, e)
             return False
+        return wr is not None
+
+    async def write_register(self, address: int, value: int) -> bool:
+        # CHANGED: address and value positional, device_id= as keyword
+        return await self._write(
+            "write register",
+            6,
+            address,
+            lambda c: c.write_register(address, value, device_id=self.slave_id),
+        )
 
     async def write_coil(self, address: int, value: bool) -> bool:
-        async with self._lock:
-            await self._ensure()
-            last_exc = None
-            for attempt in range(IO_ATTEMPTS):
-                try:
-                    # CHANGED: address and value positional, device_id= as keyword
-                    wr = await asyncio.wait_for(
-                        self._client.write_coil(address, value, device_id=self.slave_id),
-                        timeout=IO_TIMEOUT_S,
-                    )
-                    if wr.isError():
-                        raise ModbusException(f"Write coil error: {wr}")
-                    return True
-                except (asyncio.TimeoutError, ModbusException) as e:
-                    self._handle_failure(e)
-                    last_exc = e
-                if attempt + 1 < IO_ATTEMPTS:
-                    await asyncio.sleep(IO_BACKOFF_S)
-            _LOGGER.error("Failed to write coil at %s after %d attempts: %s", address, IO_ATTEMPTS, last_exc)
-            return False
+        # CHANGED: address and value positional, device_id= as keyword
+        return await self._write(
+            "write coil",
+            5,
+            address,
+            lambda c: c.write_coil(address, value, device_id=self.slave_id),
+        )
 
     @staticmethod
     def decode_uint16(regs: list[int], index: int = 0) -> int:
@@ -0,0 +1,197 @@
+"""Always-on Modbus latency and throughput metrics for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from typing import Any
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000,
+)
+
+FUNCTION_NAMES = {
+    3: "read_holding",
+    4: "read_input",
+    5: "write_coil",
+    6: "write_register",
+}
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram: O(log buckets) per sample, constant memory."""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the q-quantile (approximate)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 1),
+            "buckets_ms": list(LATENCY_BUCKETS_MS) + ["inf"],
+            "counts": list(self.counts),
+        }
+
+
+class FunctionStats:
+    """Counters and histograms for one Modbus function code."""
+
+    __slots__ = ("queue_wait", "response", "requests", "retries", "failures", "registers")
+
+    def __init__(self) -> None:
+        self.queue_wait = LatencyHistogram()
+        self.response = LatencyHistogram()
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.registers = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "registers": self.registers,
+            "queue_wait": self.queue_wait.as_dict(),
+            "response": self.response.as_dict(),
+        }
+
+
+def frame_bytes(function_code: int, count: int, mbap: bool = False) -> int:
+    """
+    Approximate bytes on the wire for one request + response.
+
+    RTU frames carry a slave address and a CRC (3 bytes around the PDU);
+    Modbus TCP replaces both with the 7-byte MBAP header.
+    """
+    overhead = 7 if mbap else 3
+    if function_code in (3, 4):
+        # fc + address + count / fc + byte count + data
+        return overhead + 5 + overhead + 2 + 2 * count
+    return 2 * (overhead + 5)  # single write: request echoed back
+
+
+class HubMetrics:
+    """Per-hub transaction metrics, cheap enough to keep on in production."""
+
+    def __init__(self, mbap: bool = False) -> None:
+        # Modbus TCP framing (MBAP header) instead of RTU, for byte counts
+        self.mbap = mbap
+        self.functions: dict[int, FunctionStats] = {}
+        self.transactions = 0
+        self.registers = 0
+        self.bytes = 0
+        self._started = time.monotonic()
+        # Totals at the last roll(), for per-interval rates
+        self._last_roll = (self._started, 0, 0, 0)
+        self.rates: dict[str, float] = {
+            "transactions_per_s": 0.0,
+            "registers_per_s": 0.0,
+            "bytes_per_s": 0.0,
+        }
+        # Latencies since the last roll() across function codes, and those
+        # of the interval roll() closed; percentile() reads the latter so it
+        # follows the current state of the line, not its lifetime
+        self._window = self._new_window()
+        self._closed_window = self._new_window()
+
+    @staticmethod
+    def _new_window() -> dict[str, LatencyHistogram]:
+        return {"queue_wait": LatencyHistogram(), "response": LatencyHistogram()}
+
+    def _stats(self, function_code: int) -> FunctionStats:
+        stats = self.functions.get(function_code)
+        if stats is None:
+            stats = self.functions[function_code] = FunctionStats()
+        return stats
+
+    def record_attempt(
+        self, function_code: int, count: int, queue_wait_s: float, response_s: float, ok: bool
+    ) -> None:
+        """One transaction on the wire (successful or not)."""
+        stats = self._stats(function_code)
+        stats.queue_wait.observe(queue_wait_s * 1000)
+        stats.response.observe(response_s * 1000)
+        self._window["queue_wait"].observe(queue_wait_s * 1000)
+        self._window["response"].observe(response_s * 1000)
+        self.transactions += 1
+        self.bytes += frame_bytes(function_code, count, self.mbap)
+        if ok:
+            stats.registers += count
+            self.registers += count
+
+    def record_request(self, function_code: int, attempts: int, ok: bool) -> None:
+        """One logical request, after all of its retries."""
+        stats = self._stats(function_code)
+        stats.requests += 1
+        stats.retries += max(0, attempts - 1)
+        if not ok:
+            stats.failures += 1
+
+    def roll(self) -> dict[str, float]:
+        """Update rates and latency percentiles over the interval since the previous roll."""
+        now = time.monotonic()
+        last_t, last_tx, last_regs, last_bytes = self._last_roll
+        elapsed = now - last_t
+        if elapsed > 0:
+            self.rates = {
+                "transactions_per_s": round((self.transactions - last_tx) / elapsed, 2),
+                "registers_per_s": round((self.registers - last_regs) / elapsed, 2),
+                "bytes_per_s": round((self.bytes - last_bytes) / elapsed, 1),
+            }
+        self._last_roll = (now, self.transactions, self.registers, self.bytes)
+        self._closed_window = self._window
+        self._window = self._new_window()
+        return self.rates
+
+    def percentile(self, kind: str, q: float) -> float | None:
+        """
+        Quantile for 'queue_wait' or 'response' across all function codes,
+        over the interval closed by the last roll() (None if it saw no traffic).
+        """
+        return self._closed_window[kind].percentile(q)
+
+    def as_dict(self) -> dict[str, Any]:
+        uptime = time.monotonic() - self._started
+        return {
+            "uptime_s": round(uptime, 1),
+            "transactions": self.transactions,
+            "registers": self.registers,
+            "bytes": self.bytes,
+            "rates": dict(self.rates),
+            "last_interval": {
+                kind: hist.as_dict() for kind, hist in self._closed_window.items()
+            },
+            "functions": {
+                FUNCTION_NAMES.get(fc, str(fc)): stats.as_dict()
+                for fc, stats in sorted(self.functions.items())
+            },
+        }
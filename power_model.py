@@ -0,0 +1,141 @@
+"""Fan and heater power model for Systemair SAVE VSR units."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from functools import lru_cache
+
+# Resolution of the precomputed fan curve (points over 0..100 % speed)
+TABLE_STEPS = 100
+
+
+@dataclass(frozen=True)
+class UnitModel:
+    """
+    Electrical data of one unit size (per fan, nominal datasheet values).
+
+    Attributes
+    ----------
+        fan_rated_w: Input power of one fan at full speed.
+        fan_max_rpm: Fan speed at 100 %, used to turn RPM into a speed fraction.
+        fan_standby_w: Electronics draw of a running fan at minimal speed.
+        heater_rated_w: Electric reheater at 100 % (output is proportional).
+        rated_airflow_m3h: Airflow at 100 % fan speed.
+        fan_curve: Measured (speed fraction, watts) points of one fan, from
+            the fan_curve option; when omitted the fan affinity law
+            (power ~ speed³) is used.
+    """
+
+    name: str
+    fan_rated_w: float
+    fan_max_rpm: float
+    fan_standby_w: float
+    heater_rated_w: float
+    rated_airflow_m3h: float
+    fan_curve: tuple[tuple[float, float], ...] | None = None
+
+
+UNIT_MODELS: dict[str, UnitModel] = {
+    "vsr150": UnitModel("SAVE VSR 150", 50.0, 4200.0, 2.0, 500.0, 150.0),
+    "vsr300": UnitModel("SAVE VSR 300", 85.0, 3800.0, 2.0, 1000.0, 300.0),
+    "vsr500": UnitModel("SAVE VSR 500", 160.0, 3400.0, 3.0, 1650.0, 500.0),
+}
+DEFAULT_UNIT_MODEL = "vsr500"
+
+
+def parse_fan_curve(text: str) -> tuple[tuple[float, float], ...] | None:
+    """
+    Parse "speed %:watts" pairs ("20:9, 50:32, 100:160") into curve points.
+
+    Returns None for an empty string; raises ValueError unless there are at
+    least two points with strictly increasing speeds in 0..100 % and
+    non-negative watts.
+    """
+    if not text.strip():
+        return None
+    points = []
+    for item in text.replace(";", ",").split(","):
+        speed, sep, watts = item.partition(":")
+        if not sep:
+            raise ValueError(f"expected speed:watts, got {item.strip()!r}")
+        points.append((float(speed) / 100, float(watts)))
+    if len(points) < 2:
+        raise ValueError("a fan curve needs at least two points")
+    if any(not 0 <= x <= 1 or w < 0 for x, w in points):
+        raise ValueError("speeds must be within 0..100 % and watts not negative")
+    if any(x1 <= x0 for (x0, _w0), (x1, _w1) in zip(points, points[1:])):
+        raise ValueError("speeds must be strictly increasing")
+    return tuple(points)
+
+
+def _interpolate(points: tuple[tuple[float, float], ...], x: float) -> float:
+    if x <= points[0][0]:
+        return points[0][1]
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        if x <= x1:
+            return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+    return points[-1][1]
+
+
+class PowerModel:
+    """Watts from fan speed and heater output via a precomputed fan table."""
+
+    __slots__ = ("unit", "_fan_table")
+
+    def __init__(self, unit: UnitModel) -> None:
+        self.unit = unit
+        self._fan_table = tuple(
+            self._fan_watts(i / TABLE_STEPS) for i in range(TABLE_STEPS + 1)
+        )
+
+    def _fan_watts(self, fraction: float) -> float:
+        if fraction <= 0:
+            return 0.0
+        unit = self.unit
+        if unit.fan_curve:
+            return _interpolate(unit.fan_curve, fraction)
+        return unit.fan_standby_w + (unit.fan_rated_w - unit.fan_standby_w) * fraction**3
+
+    def fan_power(self, pct: float | None, rpm: float | None = None) -> float | None:
+        """Power of one fan; measured RPM is preferred over the commanded %."""
+        if rpm:
+            fraction = rpm / self.unit.fan_max_rpm
+        elif pct is not None:
+            fraction = pct / 100
+        else:
+            return None
+        pos = min(max(fraction, 0.0), 1.0) * TABLE_STEPS
+        i = int(pos)
+        if i >= TABLE_STEPS:
+            return round(self._fan_table[TABLE_STEPS], 1)
+        lo = self._fan_table[i]
+        return round(lo + (self._fan_table[i + 1] - lo) * (pos - i), 1)
+
+    def heater_power(self, pct: float | None) -> float | None:
+        if pct is None:
+            return None
+        return round(pct / 100 * self.unit.heater_rated_w, 1)
+
+    def airflow(self, pct: float | None) -> float | None:
+        if pct is None:
+            return None
+        return round(pct / 100 * self.unit.rated_airflow_m3h, 1)
+
+
+@lru_cache(maxsize=None)
+def power_model(name: str, fan_curve: str = "", fan_max_rpm: float = 0) -> PowerModel:
+    """
+    Shared model for a unit size (unknown names fall back to the default),
+    optionally with a measured fan curve and fan RPM at 100 % overriding
+    the datasheet values. An invalid curve is ignored.
+    """
+    unit = UNIT_MODELS.get(name, UNIT_MODELS[DEFAULT_UNIT_MODEL])
+    try:
+        curve = parse_fan_curve(fan_curve)
+    except ValueError:
+        curve = None
+    if curve is not None:
+        unit = replace(unit, fan_curve=curve)
+    if fan_max_rpm > 0:
+        unit = replace(unit, fan_max_rpm=fan_max_rpm)
+    return PowerModel(unit)
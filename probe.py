@@ -0,0 +1,144 @@
+"""Register capability probe for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Iterable
+
+from pymodbus.exceptions import ModbusException
+
+from .connection import CircuitOpenError
+from .hub import VSRHub
+from .modbus import ModbusParameter
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump when the plan layout changes; older plans are ignored and re-probed
+PLAN_VERSION = 1
+
+# Same gap tolerance the coordinator uses when merging reads
+PROBE_BLOCK_GAP = 2
+# Modbus limit for a single read request
+MAX_READ_REGISTERS = 125
+# Attempts per block read before a transport error aborts the probe
+PROBE_ATTEMPTS = 2
+
+
+class ProbeAbortedError(Exception):
+    """The probe lost the device; its result would not describe the unit."""
+
+
+def plan_signature(candidates: Iterable[tuple[bool, int, int]]) -> list[list[int]]:
+    """Stable, JSON-friendly description of what a plan was probed for."""
+    return sorted([int(is_input), addr, cnt] for is_input, addr, cnt in set(candidates))
+
+
+def _merge(items: list[tuple[int, int]]) -> list[list[tuple[int, int]]]:
+    """Merge sorted (address, count) items into gap-tolerant groups."""
+    groups: list[list[tuple[int, int]]] = []
+    end = None
+    for addr, cnt in items:
+        if (
+            groups
+            and end is not None
+            and addr <= end + PROBE_BLOCK_GAP + 1
+            and addr + cnt - groups[-1][0][0] <= MAX_READ_REGISTERS
+        ):
+            groups[-1].append((addr, cnt))
+            end = max(end, addr + cnt - 1)
+        else:
+            groups.append([(addr, cnt)])
+            end = addr + cnt - 1
+    return groups
+
+
+async def _read(hub: VSRHub, start: int, count: int, is_input: bool) -> list[int] | None:
+    """
+    Registers, or None if the unit rejected the read (exception response).
+
+    Only a rejection marks registers unsupported. A timeout or connection
+    error is retried once and then aborts the whole probe.
+    """
+    for attempt in range(PROBE_ATTEMPTS):
+        try:
+            return await hub.read_once(start, count, is_input=is_input)
+        except CircuitOpenError as exc:
+            raise ProbeAbortedError(f"line down: {exc}") from exc
+        except (asyncio.TimeoutError, ModbusException, ConnectionError) as exc:
+            if attempt + 1 == PROBE_ATTEMPTS:
+                raise ProbeAbortedError(
+                    f"read at {start} (count={count}) failed: {exc!r}"
+                ) from exc
+            _LOGGER.debug("Probe read at %s (count=%s) failed, retrying: %s", start, count, exc)
+    return None
+
+
+async def _probe_group(
+    hub: VSRHub,
+    items: list[tuple[int, int]],
+    is_input: bool,
+    supported: set[int],
+    blocks: list[list[int]],
+) -> None:
+    """Read a group as one block; bisect on failure down to single registers."""
+    start = items[0][0]
+    end = max(addr + cnt - 1 for addr, cnt in items)
+    regs = await _read(hub, start, end - start + 1, is_input)
+    if regs is not None and len(regs) >= end - start + 1:
+        supported.update(addr for addr, _cnt in items)
+        blocks.append([start, end - start + 1])
+        return
+
+    if len(items) == 1:
+        _LOGGER.debug("Register %s (%s) not supported", start, "input" if is_input else "holding")
+        return
+
+    mid = len(items) // 2
+    await _probe_group(hub, items[:mid], is_input, supported, blocks)
+    await _probe_group(hub, items[mid:], is_input, supported, blocks)
+
+
+async def async_probe_registers(
+    hub: VSRHub, params: Iterable[tuple[ModbusParameter, int]]
+) -> dict[str, Any]:
+    """
+    Probe which candidate registers the unit answers and how to batch them.
+
+    Candidates are merged into blocks like a normal poll; a block that is
+    rejected is bisected until the unsupported registers are isolated. The
+    blocks that read successfully are the optimal read layout for this unit.
+
+    Args:
+        hub: Connected hub to probe through
+        params: (parameter, register count) pairs to test
+
+    Returns:
+        JSON-serialisable plan suitable for storing in the config entry
+
+    Raises:
+        ProbeAbortedError: A read failed on the transport, so the registers
+            it covered could not be classified
+    """
+    candidates = {
+        (param.reg_type.value == "Input", param.register, cnt) for param, cnt in params
+    }
+    supported: set[int] = set()
+    layout: dict[str, list[list[int]]] = {"input": [], "holding": []}
+
+    for is_input, key in ((True, "input"), (False, "holding")):
+        items = sorted((addr, cnt) for inp, addr, cnt in candidates if inp == is_input)
+        for group in _merge(items):
+            await _probe_group(hub, group, is_input, supported, layout[key])
+        layout[key].sort()
+
+    unsupported = sorted({addr for _inp, addr, _cnt in candidates} - supported)
+    if unsupported:
+        _LOGGER.info("Probe found unsupported registers: %s", unsupported)
+
+    return {
+        "version": PLAN_VERSION,
+        "signature": plan_signature(candidates),
+        "supported": sorted(supported),
+        "blocks": layout,
+    }
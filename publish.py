@@ -0,0 +1,89 @@
+"""Significant-change filtering of entity state writes for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import PERCENTAGE, REVOLUTIONS_PER_MINUTE
+
+
+@dataclass(frozen=True)
+class PublishPolicy:
+    """
+    When a new value is worth a state write.
+
+    Attributes
+    ----------
+        deadband: Numeric changes smaller than this are held back.
+        min_interval_s: Minimum time between two published changes.
+        heartbeat_s: Publish the current value at least this often anyway.
+    """
+
+    deadband: float = 0.0
+    min_interval_s: float = 0.0
+    heartbeat_s: float = 600.0
+
+
+# Per sensor class; a description can override with its own policy
+PUBLISH_POLICIES: dict[str, PublishPolicy] = {
+    # 12101/12102 jitter by one step (0.1 °C) from poll to poll
+    "temperature": PublishPolicy(deadband=0.2, heartbeat_s=300.0),
+    "rpm": PublishPolicy(deadband=25.0, min_interval_s=30.0),
+    "power": PublishPolicy(deadband=5.0, min_interval_s=30.0),
+    "percentage": PublishPolicy(deadband=1.0),
+    "volume_flow_rate": PublishPolicy(deadband=5.0, min_interval_s=30.0),
+}
+
+
+def sensor_class(device_class: Any, unit: str | None) -> str | None:
+    """Policy class of a sensor from its device class and unit."""
+    if device_class == SensorDeviceClass.TEMPERATURE:
+        return "temperature"
+    if device_class == SensorDeviceClass.POWER:
+        return "power"
+    if device_class == SensorDeviceClass.VOLUME_FLOW_RATE:
+        return "volume_flow_rate"
+    if unit == REVOLUTIONS_PER_MINUTE:
+        return "rpm"
+    if unit == PERCENTAGE:
+        return "percentage"
+    return None
+
+
+class PublishContext:
+    """
+    Listener context of one filtered entity, holding what it last published.
+
+    Passed as the CoordinatorEntity context; the coordinator asks it before
+    calling the entity's update callback.
+    """
+
+    __slots__ = ("key", "policy", "value", "published_at")
+
+    def __init__(self, key: str, policy: PublishPolicy) -> None:
+        self.key = key
+        self.policy = policy
+        self.value: Any = None
+        self.published_at: float | None = None
+
+    def should_publish(self, value: Any, now: float) -> bool:
+        if self.published_at is None:
+            return True
+        elapsed = now - self.published_at
+        if elapsed >= self.policy.heartbeat_s:
+            return True
+        if value == self.value or elapsed < self.policy.min_interval_s:
+            return False
+        if (
+            isinstance(value, (int, float))
+            and isinstance(self.value, (int, float))
+            and not isinstance(value, bool)
+        ):
+            return abs(value - self.value) >= self.policy.deadband
+        return True
+
+    def mark(self, value: Any, now: float) -> None:
+        self.value = value
+        self.published_at = now
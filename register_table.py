@@ -0,0 +1,309 @@
+"""Register table for Systemair SAVE VSR units.
+
+One plain tuple per parameter, so the whole map is a single constant in the
+compiled module. `modbus.parameter_map` turns a row into a ModbusParameter
+the first time that parameter is looked up.
+
+Row: (register, type, sign, short, description, min_value, max_value,
+boolean, scale_factor, combine_with_32_bit). Type is "I" (input) or "H"
+(holding), sign "U" or "S". Addresses are wire addresses: the number in
+the Systemair register list minus one.
+"""
+
+from __future__ import annotations
+
+REGISTER_TABLE: tuple[tuple, ...] = (
+    # Registers used by the integration
+    (1160, "I", "U", "REG_MODE_MAIN_STATUS_IN", "Active User mode status (read): 0: Auto, 1: Manual, 2: Crowded, 3: Refresh, 4: Fireplace, 5: Away, 6: Holiday, 7: Kitchen, 8: Vacuum Cleaner", 0, 8, None, None, None),
+    (1161, "H", "U", "REG_MODE_MAIN_CMD", "User mode command (write): 1: Auto, 2: Manual, 3: Crowded, 4: Refresh, 5: Fireplace, 6: Away, 7: Holiday, 8: Kitchen, 9: Vacuum Cleaner", 1, 9, None, None, None),
+    (1130, "H", "U", "REG_MODE_SPEED", "Fan speed level: 2: Low, 3: Medium, 4: High", 2, 4, None, None, None),
+    (1100, "H", "U", "REG_HOLIDAY_DAYS", "Time delay setting for user mode Holiday (days)", 1, 365, None, None, None),
+    (1101, "H", "U", "REG_AWAY_HOURS", "Time delay setting for user mode Away (hours)", 1, 72, None, None, None),
+    (1102, "H", "U", "REG_FIREPLACE_MINS", "Time delay setting for user mode Fire Place (minutes)", 1, 60, None, None, None),
+    (1103, "H", "U", "REG_REFRESH_MINS", "Time delay setting for user mode Refresh (minutes)", 1, 240, None, None, None),
+    (1104, "H", "U", "REG_CROWDED_HOURS", "Time delay setting for user mode Crowded (hours)", 1, 8, None, None, None),
+    (1110, "I", "U", "REG_USERMODE_REMAIN", "Remaining time for user mode, lower 16 bits (seconds)", None, None, None, None, 1111),
+    (1111, "I", "U", "REG_USERMODE_FACTOR", "Remaining time for user mode, higher 16 bits (seconds)", None, None, None, None, 1110),
+    (2000, "H", "S", "REG_TARGET_TEMP", "Temperature setpoint for supply air (°C × 10)", 120, 300, None, 10, None),
+    (12101, "H", "S", "REG_TEMP_OUTDOOR", "Outdoor Air Temperature (°C × 10)", None, None, None, 10, None),
+    (12102, "H", "S", "REG_TEMP_SUPPLY", "Supply Air Temperature (°C × 10)", None, None, None, 10, None),
+    (12543, "H", "S", "REG_TEMP_EXHAUST", "Exhaust Air Temperature (°C × 10)", None, None, None, 10, None),
+    (12542, "H", "S", "REG_TEMP_EXTRACT", "Extract Air Temperature (°C × 10)", None, None, None, 10, None),
+    (12107, "H", "S", "REG_TEMP_OVERHEAT", "Overheat Temperature (°C × 10)", None, None, None, 10, None),
+    (12106, "H", "S", "REG_TEMP_EFFICENCY", "Efficiency Temperature (°C × 10)", None, None, None, 10, None),
+    (12400, "H", "U", "REG_SAF_RPM", "Supply Air Fan RPM", None, None, None, None, None),
+    (12401, "H", "U", "REG_EAF_RPM", "Extract Air Fan RPM", None, None, None, None, None),
+    (14000, "H", "U", "REG_SUPPLY_FAN_PCT", "Supply air fan speed (%)", 0, 100, None, None, None),
+    (14001, "H", "U", "REG_EXTRACT_FAN_PCT", "Extract air fan speed (%)", 0, 100, None, None, None),
+    (2148, "H", "U", "REG_HEATER_PERCENT", "Heater output (%)", 0, 100, None, None, None),
+    (14102, "H", "U", "REG_HEAT_EXCH_STATE", "Heat exchanger state", None, None, True, None, None),
+    (14350, "H", "U", "REG_ROTOR", "Rotor speed/state", None, None, None, None, None),
+    (14101, "H", "U", "REG_HEATER", "Heater state", None, None, True, None, None),
+    (12135, "H", "U", "REG_MOIST_RELEASE", "Moisture release (%)", 0, 100, None, None, None),
+    (2210, "H", "U", "REG_MOIST_CALC_EXT", "Calculated extract moisture (%)", 0, 100, None, None, None),
+    (2211, "H", "U", "REG_MOIST_CALC_INT", "Calculated internal moisture (%)", 0, 100, None, None, None),
+    (2202, "H", "U", "REG_MOIST_EXT_SP", "Extract moisture setpoint (%)", 0, 100, None, None, None),
+    (2503, "H", "S", "REG_SETPOINT_ECO_OFFSET", "ECO mode temperature offset (°C × 10)", 0, 100, None, 10, None),
+    (1038, "H", "U", "REG_MODE_SUMMERWINTER", "Summer/Winter mode", None, None, True, None, None),
+    (1350, "H", "U", "REG_FAN_RUNNING_START", "Fan running status", None, None, True, None, None),
+    (14003, "H", "U", "REG_DAMPER_STATE", "Damper state", None, None, True, None, None),
+    (2133, "H", "U", "REG_COOLING_RECOVERY", "Cooling recovery", None, None, True, None, None),
+    (2504, "H", "U", "REG_ECO_MODE_ENABLE", "ECO mode enable", None, None, True, None, None),
+    (3001, "H", "U", "REG_HEATER_ENABLE", "Heater enable", None, None, True, None, None),
+    (2203, "H", "U", "REG_RH_TRANSFER_ENABLE", "RH transfer enable", None, None, True, None, None),
+    (15900, "I", "U", "REG_ALARM_TYPE_A", "Alarm Type A active", None, None, True, None, None),
+    (15901, "I", "U", "REG_ALARM_TYPE_B", "Alarm Type B active", None, None, True, None, None),
+    (15902, "I", "U", "REG_ALARM_TYPE_C", "Alarm Type C active", None, None, True, None, None),
+    (15001, "I", "U", "REG_ALARM_SAF", "Supply air fan alarm", 0, 3, None, None, None),
+    (15008, "I", "U", "REG_ALARM_EAF", "Extract air fan alarm", 0, 3, None, None, None),
+    (15015, "I", "U", "REG_ALARM_FROST_PROT", "Frost protection alarm", 0, 3, None, None, None),
+    (15029, "I", "U", "REG_ALARM_SAF_RPM", "Supply air fan RPM alarm", 0, 3, None, None, None),
+    (15036, "I", "U", "REG_ALARM_EAF_RPM", "Extract air fan RPM alarm", 0, 3, None, None, None),
+    (15057, "I", "U", "REG_ALARM_FPT", "Frost protection temperature alarm", 0, 3, None, None, None),
+    (15064, "I", "U", "REG_ALARM_OAT", "Outdoor air temperature alarm", 0, 3, None, None, None),
+    (15071, "I", "U", "REG_ALARM_SAT", "Supply air temperature alarm", 0, 3, None, None, None),
+    (15078, "I", "U", "REG_ALARM_RAT", "Room air temperature alarm", 0, 3, None, None, None),
+    (15085, "I", "U", "REG_ALARM_EAT", "Extract air temperature alarm", 0, 3, None, None, None),
+    (15092, "I", "U", "REG_ALARM_ECT", "Extra controller temperature alarm", 0, 3, None, None, None),
+    (15099, "I", "U", "REG_ALARM_EFT", "Efficiency temperature alarm", 0, 3, None, None, None),
+    (15106, "I", "U", "REG_ALARM_OHT", "Overheat temperature alarm", 0, 3, None, None, None),
+    (15113, "I", "U", "REG_ALARM_EMT", "Emergency thermostat alarm", 0, 3, None, None, None),
+    (15127, "I", "U", "REG_ALARM_BYS", "Bypass damper alarm", 0, 3, None, None, None),
+    (15134, "I", "U", "REG_ALARM_SEC_AIR", "Secondary air alarm", 0, 3, None, None, None),
+    (15141, "I", "U", "REG_ALARM_FILTER", "Filter alarm", 0, 3, None, None, None),
+    (15162, "I", "U", "REG_ALARM_RH", "Relative humidity alarm", 0, 3, None, None, None),
+    (15176, "I", "U", "REG_ALARM_LOW_SAT", "Low supply air temperature alarm", 0, 3, None, None, None),
+    (15508, "I", "U", "REG_ALARM_PDM_RHS", "PDM RHS sensor alarm", 0, 3, None, None, None),
+    (15515, "I", "U", "REG_ALARM_PDM_EAT", "PDM EAT sensor alarm", 0, 3, None, None, None),
+    (15522, "I", "U", "REG_ALARM_MAN_FAN_STOP", "Manual fan stop alarm", 0, 3, None, None, None),
+    (15529, "I", "U", "REG_ALARM_OVERHEAT_TEMP", "Overheat temperature alarm", 0, 3, None, None, None),
+    (15536, "I", "U", "REG_ALARM_FIRE", "Fire alarm", 0, 3, None, None, None),
+    (15543, "I", "U", "REG_ALARM_FILTER_WARN", "Filter warning alarm", 0, 3, None, None, None),
+    # Rest of the SAVE VSR register map (from the Systemair register list)
+    (1000, "I", "U", "REG_DEMC_RH_HIGHEST", "Highest value of all RH sensors", 0, 100, None, None, None),
+    (1001, "I", "U", "REG_DEMC_CO2_HIGHEST", "Highest CO2 value among all sensors, ppm.", 0, 2000, None, None, None),
+    (1002, "I", "U", "REG_DEMC_FAN_SPEED", "Supply air fan speed by demand control function.", 0, 65536, None, None, None),
+    (1003, "I", "U", "REG_DEMC_ACTIVE_CONTROLLER", "Sensor type by which demand control function is operating: 0: CO2, 1: RH", 0, 1, None, None, None),
+    (1006, "I", "U", "REG_DEMC_FAN_SPEED_EAF", "Extract air fan speed by demand control function.", 0, 65536, None, None, None),
+    (1030, "H", "U", "REG_DEMC_RH_SETTINGS_PBAND", "Demand control by RH P-band setting value, %.", 1, 100, None, None, None),
+    (1031, "H", "U", "REG_DEMC_RH_SETTINGS_ITIME", "Demand control by RH I-time setting value, s.", 0, 120, None, None, None),
+    (1032, "H", "U", "REG_DEMC_RH_SETTINGS_SP_SUMMER", "Summer relative humidity setpoint, %.", 10, 100, None, None, None),
+    (1033, "H", "U", "REG_DEMC_RH_SETTINGS_SP_WINTER", "Winter relative humidity setpoint, %.", 10, 100, None, None, None),
+    (1034, "H", "U", "REG_DEMC_RH_SETTINGS_ON_OFF", "Activation of demand control by relative humidity: 0: Disabled, 1: Enabled", None, None, True, None, None),
+    (1035, "I", "U", "REG_SUMMER_WINTER_RESTART_COUNTER_L", "Demand control summer mode counter. Time till summer mode becomes active, lower 16 bits.", None, None, None, None, 1036),
+    (1036, "I", "U", "REG_SUMMER_WINTER_RESTART_COUNTER_H", "Demand control summer mode counter. Time till summer mode becomes active, higher 16 bits.", None, None, None, None, 1035),
+    (1037, "I", "U", "REG_SUMMER_WINTER_STATE", "Demand control mode by season: 0: Summer, 1: Winter, 2: Identifying", 0, 2, None, None, None),
+    (1040, "H", "U", "REG_DEMC_CO2_SETTINGS_PBAND", "Demand control by CO2 P-band setting value, %.", 50, 2000, None, None, None),
+    (1041, "H", "U", "REG_DEMC_CO2_SETTINGS_ITIME", "Demand control by CO2 I-time setting value, s.", 0, 120, None, None, None),
+    (1042, "H", "U", "REG_DEMC_CO2_SETTINGS_SP", "CO2 setpoint, %.", 100, 2000, None, None, None),
+    (1043, "H", "U", "REG_DEMC_CO2_SETTINGS_ON_OFF", "Activation of demand control by CO2: 0: Disabled, 1: Enabled", None, None, True, None, None),
+    (1060, "I", "U", "REG_DEMC_ENABLED", "Status of demand control: 0: Disabled, 1: Enabled", None, None, True, None, None),
+    (1061, "I", "U", "REG_DEMC_AUTO_MODE_SOURCE", "Auto mode type: 0: External control, 1: Demand control, 2: Week schedule, 3: Configuration fault", 0, 3, None, None, None),
+    (1120, "H", "U", "REG_IAQ_SPEED_LEVEL_MIN", "Minimum fan speed for demand control function: 2: Low, 3: Normal", 2, 3, None, None, None),
+    (1121, "H", "U", "REG_IAQ_SPEED_LEVEL_MAX", "Maximum fan speed for demand control function: 3: Normal, 4: High, 5: Maximum", 3, 5, None, None, None),
+    (1122, "I", "U", "REG_IAQ_LEVEL", "Indoor air quality: 0: Perfect, 1: Good, 2: Improving", 0, 2, None, None, None),
+    (1134, "H", "U", "REG_USERMODE_CROWDED_AIRFLOW_LEVEL_SAF", "Fan speed level for mode Crowded. 3: Normal 4: High 5: Maximum", 3, 5, None, None, None),
+    (1135, "H", "U", "REG_USERMODE_CROWDED_AIRFLOW_LEVEL_EAF", "Fan speed level for mode Crowded. 3: Normal 4: High 5: Maximum", 3, 5, None, None, None),
+    (1136, "H", "U", "REG_USERMODE_REFRESH_AIRFLOW_LEVEL_SAF", "Fan speed level for mode Refresh. 3: Normal 4: High 5: Maximum", 3, 5, None, None, None),
+    (1137, "H", "U", "REG_USERMODE_REFRESH_AIRFLOW_LEVEL_EAF", "Fan speed level for mode Refresh. 3: Normal 4: High 5: Maximum", 3, 5, None, None, None),
+    (1138, "H", "U", "REG_USERMODE_FIREPLACE_AIRFLOW_LEVEL_SAF", "Fan speed level for mode Fireplace. 3: Normal 4: High 5: Maximum", 3, 5, None, None, None),
+    (1139, "H", "U", "REG_USERMODE_FIREPLACE_AIRFLOW_LEVEL_EAF", "Fan speed level for mode Fireplace. 1: Minimum 2: Low 3: Normal", 1, 3, None, None, None),
+    (1140, "H", "U", "REG_USERMODE_AWAY_AIRFLOW_LEVEL_SAF", "Fan speed level for mode Away. 0: Off(1) 1: Minimum 2: Low 3: Normal. (1): value Off only allowed if contents of register REG_FAN_MANUAL_STOP_ALLOWED is 1.", 0, 3, None, None, None),
+    (1141, "H", "U", "REG_USERMODE_AWAY_AIRFLOW_LEVEL_EAF", "Fan speed level for mode Away. 0: Off(1) 1: Minimum 2: Low 3: Normal. (1): value Off only allowed if contents of register REG_FAN_MANUAL_STOP_ALLOWED is 1.", 0, 3, None, None, None),
+    (1142, "H", "U", "REG_USERMODE_HOLIDAY_AIRFLOW_LEVEL_SAF", "Fan speed level for mode Holiday. 0: Off(1) 1: Minimum 2: Low 3: Normal. (1): valueOff only allowed if contents of register REG_FAN_MANUAL_STOP_ALLOWED is 1.", 0, 3, None, None, None),
+    (1143, "H", "U", "REG_USERMODE_HOLIDAY_AIRFLOW_LEVEL_EAF", "Fan speed level for mode Holiday. 0: Off(1) 1: Minimum 2: Low 3: Normal. (1): valueOff only allowed if contents of register REG_FAN_MANUAL_STOP_ALLOWED is 1.", 0, 3, None, None, None),
+    (1144, "H", "U", "REG_USERMODE_COOKERHOOD_AIRFLOW_LEVEL_SAF", "Fan speed level for mode Cooker Hood. 1: Minimum 2: Low 3: Normal 4: High 5: Maximum", 1, 5, None, None, None),
+    (1145, "H", "U", "REG_USERMODE_COOKERHOOD_AIRFLOW_LEVEL_EAF", "Fan speed level for mode Cooker Hood. 1: Minimum 2: Low 3: Normal 4: High 5: Maximum", 1, 5, None, None, None),
+    (1146, "H", "U", "REG_USERMODE_VACUUMCLEANER_AIRFLOW_LEVEL_SAF", "Fan speed level for mode Vacuum Cleaner. 1: Minimum 2: Low 3: Normal 4: High 5: Maximum", 1, 5, None, None, None),
+    (1147, "H", "U", "REG_USERMODE_VACUUMCLEANER_AIRFLOW_LEVEL_EAF", "Fan speed level for mode Vacuum Cleaner. 1: Minimum 2: Low 3: Normal 4: High 5: Maximum", 1, 5, None, None, None),
+    (1150, "H", "U", "REG_USERMODE_CROWDED_T_OFFSET", "Supply air temperature decrease during Crowded user mode.", 0, 65436, None, None, None),
+    (1163, "H", "U", "REG_USERMODE_FALLBACK", "Used mode in which SAVE unit should operate when user mode delay is expired: 0: Auto, 1: Manual", 0, 1, None, None, None),
+    (1170, "H", "U", "REG_CDI_1_AIRFLOW_LEVEL_SAF", "Supply fan speed for configurable digital input 1 mode. 0: Off 1: Minimum 2: Low 3: Normal 4: High 5: Maximum", 0, 5, None, None, None),
+    (1171, "H", "U", "REG_CDI_1_AIRFLOW_LEVEL_EAF", "Extract fan speed for configurable digital input 1 mode. 0: Off 1: Minimum 2: Low 3: Normal 4: High 5: Maximum", 0, 5, None, None, None),
+    (1172, "H", "U", "REG_CDI_2_AIRFLOW_LEVEL_SAF", "Supply fan speed for configurable digital input 2 mode. 0: Off 1: Minimum 2: Low 3: Normal 4: High 5: Maximum", 0, 5, None, None, None),
+    (1173, "H", "U", "REG_CDI_2_AIRFLOW_LEVEL_EAF", "Extract fan speed for configurable digital input 2 mode. 0: Off 1: Minimum 2: Low 3: Normal 4: High 5: Maximum", 0, 5, None, None, None),
+    (1174, "H", "U", "REG_CDI_3_AIRFLOW_LEVEL_SAF", "Supply fan speed for configurable digital input 3 mode. 0: Off 1: Minimum 2: Low 3: Normal 4: High 5: Maximum", 0, 5, None, None, None),
+    (1175, "H", "U", "REG_CDI_3_AIRFLOW_LEVEL_EAF", "Extract fan speed for configurable digital input 3 mode. 0: Off 1: Minimum 2: Low 3: Normal 4: High 5: Maximum", 0, 5, None, None, None),
+    (1176, "H", "U", "REG_PRESSURE_GUARD_AIRFLOW_LEVEL_SAF", "Fan speed level for configurable pressure guard function. 0: Off 1: Minimum 2: Low 3: Normal 4: High 5: Maximum", 0, 5, None, None, None),
+    (1177, "H", "U", "REG_PRESSURE_GUARD_AIRFLOW_LEVEL_EAF", "Fan speed level for configurable pressure guard function. 0: Off 1: Minimum 2: Low 3: Normal 4: High 5: Maximum", 0, 5, None, None, None),
+    (1180, "H", "U", "REG_USERMODE_HOLIDAY_DI_OFF_DELAY", "Digital input time delay setting for user mode Holiday, days.", 0, 365, None, None, None),
+    (1181, "H", "U", "REG_USERMODE_AWAY_DI_OFF_DELAY", "Digital input time delay setting for user mode Away, hours.", 0, 72, None, None, None),
+    (1182, "H", "U", "REG_USERMODE_FIRPLACE_DI_OFF_DELAY", "Digital input time delay setting for user mode Fire Place, minutes.", 0, 60, None, None, None),
+    (1183, "H", "U", "REG_USERMODE_REFRESH_DI_OFF_DELAY", "Digital input time delay setting for user mode Refresh, minutes.", 0, 240, None, None, None),
+    (1184, "H", "U", "REG_USERMODE_CROWDED_DI_OFF_DELAY", "Digital input time delay setting for user mode Crowded, hours.", 0, 8, None, None, None),
+    (1185, "H", "U", "REG_CDI1_OFF_DELAY", "Digital input time delay setting for user mode Configurable digital input 1, minutes.", 0, 240, None, None, None),
+    (1186, "H", "U", "REG_CDI2_OFF_DELAY", "Digital input time delay setting for user mode Configurable digital input 2, minutes.", 0, 240, None, None, None),
+    (1187, "H", "U", "REG_CDI3_OFF_DELAY", "Digital input time delay setting for user mode Configurable digital input 3, minutes.", 0, 240, None, None, None),
+    (1200, "I", "U", "REG_SPEED_MANUAL_SAF", "Supply air fan speed on manual mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1201, "I", "U", "REG_SPEED_MANUAL_EAF", "Extract air fan speed on manual mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1202, "I", "U", "REG_SPEED_AUTO_SAF", "Supply air fan speed on auto mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1203, "I", "U", "REG_SPEED_AUTO_EAF", "Extract air fan speed on auto mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1204, "I", "U", "REG_SPEED_CROWDED_SAF", "Supply air fan speed on crowded mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1205, "I", "U", "REG_SPEED_CROWDED_EAF", "Extract air fan speed on crowded mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1206, "I", "U", "REG_SPEED_REFRESH_SAF", "Supply air fan speed on refresh mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1207, "I", "U", "REG_SPEED_REFRESH_EAF", "Extract air fan speed on refresh mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1208, "I", "U", "REG_SPEED_FIREPLACE_SAF", "Supply air fan speed on fireplace mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1209, "I", "U", "REG_SPEED_FIREPLACE_EAF", "Extract air fan speed on fireplace mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1210, "I", "U", "REG_SPEED_AWAY_SAF", "Supply air fan speed on away mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1211, "I", "U", "REG_SPEED_AWAY_EAF", "Extract air fan speed on away mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1212, "I", "U", "REG_SPEED_HOLIDAY_SAF", "Supply air fan speed on holiday mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1213, "I", "U", "REG_SPEED_HOLIDAY_EAF", "Extract air fan speed on holiday mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1214, "I", "U", "REG_SPEED_COOKERHOOD_SAF", "Supply air fan speed on cookerhood mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1215, "I", "U", "REG_SPEED_COOKERHOOD_EAF", "Extract air fan speed on cookerhood mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1216, "I", "U", "REG_SPEED_VACUUMCLEANER_SAF", "Supply air fan speed on vacuum cleaner mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1217, "I", "U", "REG_SPEED_VACUUMCLEANER_EAF", "Extract air fan speed on vacuum cleaner mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1220, "I", "U", "REG_SPEED_CDI1_SAF", "Supply air fan speed on configurable digital input 1 mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1221, "I", "U", "REG_SPEED_CDI1_EAF", "Extract air fan speed on configurable digital input 1 mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1222, "I", "U", "REG_SPEED_CDI2_SAF", "Supply air fan speed on configurable digital input 2 mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1223, "I", "U", "REG_SPEED_CDI2_EAF", "Extract air fan speed on configurable digital input 2 mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1224, "I", "U", "REG_SPEED_CDI3_SAF", "Supply air fan speed on configurable digital input 3 mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1225, "I", "U", "REG_SPEED_CDI3_EAF", "Extract air fan speed on configurable digital input 3 mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1226, "I", "U", "REG_SPEED_PRESSURE_GUARD_SAF", "Supply air fan speed on pressure guard mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1227, "I", "U", "REG_SPEED_PRESSURE_GUARD_EAF", "Extract air fan speed on pressure guard mode expressed by selected fan control mode.", 0, None, None, None, None),
+    (1250, "H", "U", "REG_FAN_OUTDOOR_COMP_TYPE", "Outdoor air compensation type: 0: Supply air fan only, 1: Both fans", 0, 1, None, None, None),
+    (1251, "H", "U", "REG_FAN_OUTDOOR_COMP_VALUE_WINTER", "Maximum fan speed decrease during winter.", 0, 50, None, None, None),
+    (1253, "H", "U", "REG_FAN_OUTDOOR_COMP_STOP_T_WINTER", "Temperature setting at which outdoor air compensation should stop at winter time.", 150, 65136, None, None, None),
+    (1254, "I", "U", "REG_FAN_OUTDOOR_COMP_RESULT", "Outdoor air compensation result. Value depends on contents of register 1274. Value can be %, RPM, Pressure or Flow.", None, None, None, None, None),
+    (1255, "H", "U", "REG_FAN_OUTDOOR_COMP_START_T_WINTER", "Temperature setting at which outdoor air compensation should start at winter time.", 150, 65136, None, None, None),
+    (1256, "H", "U", "REG_FAN_OUTDOOR_COMP_START_T_SUMMER", "Temperature setting at which outdoor air compensation should start at summer time.", 150, 500, None, None, None),
+    (1257, "H", "U", "REG_FAN_OUTDOOR_COMP_STOP_T_SUMMER", "Temperature setting at which outdoor air compensation should stop at summer time.", 150, 500, None, None, None),
+    (1258, "H", "U", "REG_FAN_OUTDOOR_COMP_VALUE_SUMMER", "Maximum fan speed decrease during summer.", 0, 50, None, None, None),
+    (1270, "H", "U", "REG_FAN_REGULATION_PBAND", "Fan control P-band value. Applies only if fan is controlled by pressure, flow or RPM.", 1, 3000, None, None, None),
+    (1271, "H", "U", "REG_FAN_REGULATION_ITIME", "Fan control I-time value. Applies only if fan is controlled by pressure, flow or RPM.", 0, 240, None, None, None),
+    (1273, "H", "U", "REG_FAN_REGULATION_UNIT", "Fan control type: 0: Manual, %, 1: Manual, RPM, 2: Pressure, 3: Flow, 4: External", 0, 4, None, None, None),
+    (1352, "H", "U", "REG_FAN_MANUAL_STOP_ALLOWED", "Allow manual fan stop. 0: Manual stop not allowed, 1: Manual stop allowed", None, None, True, None, None),
+    (2010, "H", "U", "REG_TC_CASCADE_PBAND", "Extract/room air temperature control P-band value.", 10, 600, None, None, None),
+    (2011, "H", "U", "REG_TC_CASCADE_ITIME", "Extract/room air temperature control I-time value.", 0, 240, None, None, None),
+    (2020, "H", "U", "REG_TC_CASCADE_SP_MIN", "Minimum temperature setpoint for supply air.", None, None, None, None, None),
+    (2021, "H", "U", "REG_TC_CASCADE_SP_MAX", "Maximum temperature setpoint for supply air.", None, None, None, None, None),
+    (2030, "H", "U", "REG_TC_CONTROL_MODE", "Temperature control mode: 0 - Supply air; 1 - Room air; 2 - Extract air", None, None, None, None, None),
+    (2040, "H", "U", "REG_TC_CONTROL_PBAND", "Supply air temperature control P-band value.", None, None, None, None, None),
+    (2041, "H", "U", "REG_TC_CONTROL_ITIME", "Supply air temperature control I-time value.", None, None, None, None, None),
+    (2053, "I", "U", "REG_TC_SP_SATC", "Temperature setpoint for supply air temperature calculated for extract/room air temperature control mode.", None, None, None, None, None),
+    (2054, "I", "U", "REG_SATC_HEAT_DEMAND", "Overall heat demand, %.", None, None, None, None, None),
+    (2112, "H", "U", "REG_HEATER_CIRC_PUMP_START_T", "Temperature at which circulation pump for heating is started.", 0, 200, None, None, None),
+    (2113, "I", "U", "REG_HEATER_FROM_SATC", "Heating demand by temperature control, %.", 0, 100, None, None, None),
+    (2121, "H", "U", "REG_HEATER_CIRC_PUMP_STOP_DELAY", "Heating circulation pump stop delay time, min.", 0, 60, None, None, None),
+    (2123, "I", "U", "REG_HEATER_CIRC_PUMP_COUNTER", "Time till heating circulation pump stops, s.", 0, 3600, None, None, None),
+    (2140, "I", "U", "REG_HEAT_EXCHANGER_FROM_SATC", "Heat recovery demand by temperature control, %", 0, 100, None, None, None),
+    (2200, "H", "U", "REG_ROTOR_RH_TRANSFER_CTRL_PBAND", "Moisture transfer control P-band value.", 1, 1000, None, None, None),
+    (2201, "H", "U", "REG_ROTOR_RH_TRANSFER_CTRL_ITIME", "Moisture transfer control I-time value, s.", 0, 120, None, None, None),
+    (2220, "I", "U", "REG_ROTOR_CLEANING_DESIRED", "Rotary heat exchanger cleaning function status: 0 - Inactive; 1 - Active", None, None, True, None, None),
+    (2262, "H", "U", "REG_PASSIVE_HOUSE_ACTIVATION", "Passive house function status: 0 - Disabled; 1 - Enabled", None, None, True, None, None),
+    (2310, "I", "U", "REG_COOLER_FROM_SATC", "Cooling demand by temperature control, %.", 0, 100, None, None, None),
+    (2314, "H", "U", "REG_COOLER_RECOVERY_LIMIT_T", "Minimum temperature difference between extract and outside air temperatures to start cooling recovery function.", 0, 100, None, None, None),
+    (2315, "H", "U", "REG_COOLER_OAT_INTERLOCK_T", "Outside air temperature value at which cooler operation is disabled.", 0, 200, None, None, None),
+    (2316, "H", "U", "REG_COOLER_CIRC_PUMP_STOP_DELAY", "Cooling circulation pump stop delay time, min.", 0, 60, None, None, None),
+    (2317, "I", "U", "REG_COOLER_CIRC_PUMP_COUNTER", "Time till cooling circulation pump stops, s.", 0, 3600, None, None, None),
+    (2400, "H", "U", "REG_EXTRA_CONTROLLER_SET_PI_PBAND", "Extra controller P-band value.", 10, 600, None, None, None),
+    (2401, "H", "U", "REG_EXTRA_CONTROLLER_SET_PI_ITIME", "Extra controller I-time value, s.", 0, 240, None, None, None),
+    (2402, "H", "U", "REG_EXTRA_CONTROLLER_SET_PI_SETPOINT", "Extra controller temperature setpoint.", 0, 65536, None, None, None),
+    (2403, "H", "U", "REG_EXTRA_CONTROLLER_CIRC_PUMP_START_T", "Temperature at which circulation pump for heating is started.", 0, 200, None, None, None),
+    (2404, "H", "U", "REG_EXTRA_CONTROLLER_CIRC_PUMP_STOP_DELAY", "Extra controller circulation pump stop delay time, min.", 0, 60, None, None, None),
+    (2417, "H", "U", "REG_EXTRA_CONTROLLER_PREHEATER_SETPOINT_TYPE", "Preheater setpoint type: 0 - Auto; 1 - Manual", 0, 1, None, None, None),
+    (2418, "I", "U", "REG_EXTRA_CONTROLLER_CIRC_PUMP_COUNTER", "Time till extra controller circulation pump stops, s.", 0, 3600, None, None, None),
+    (2419, "H", "U", "REG_EXTRA_CONTROLLER_GEO_PRE_HEATER_SP", "Winter temperature setpoint for GEO heat exchanger.", 0, 65536, None, None, None),
+    (2420, "H", "U", "REG_EXTRA_CONTROLLER_GEO_PRE_HEATER_ACTIVATION_T", "Temperature at which GEO exchanger should be activated in winter mode.", 0, 65536, None, None, None),
+    (2421, "H", "U", "REG_EXTRA_CONTROLLER_GEO_PRE_COOLER_SP", "Summer temperature setpoint for GEO heat exchanger.", 100, 300, None, None, None),
+    (2422, "H", "U", "REG_EXTRA_CONTROLLER_GEO_PRE_COOLER_ACTIVATION_T", "Temperature at which GEO exchanger should be activated in summer mode.", 150, 300, None, None, None),
+    (2423, "I", "U", "REG_EXTRA_CONTROLLER_GEO_SUMMER_WINTER_CNTR_L", "Time till summer mode will be activated for GEO heat exchanger, s.", None, None, None, None, None),
+    (2424, "I", "U", "REG_EXTRA_CONTROLLER_GEO_SUMMER_WINTER_CNTR_H", "Time till summer mode will be activated for GEO heat exchanger, s.", None, None, None, None, None),
+    (2425, "I", "U", "REG_EXTRA_CONTROLLER_GEO_SUMMER_WINTER_MODE", "Mode for GEO heat exchanger: 0 - None; 1 - Summer; 2 - Winter", 0, 2, None, None, None),
+    (2426, "H", "U", "REG_EXTRA_CONTROLLER_PREHEATER_DEACTIVATE_AT_HIGH_OAT", "Preheater deactivation by outside air temperature status: 0 - Disabled; 1 - Enabled", None, None, True, None, None),
+    (2427, "H", "U", "REG_EXTRA_CONTROLLER_PREHEATER_ACTIVATION_T", "Temperature at which preheater operation is allowed.", 0, 65536, None, None, None),
+    (2450, "H", "U", "REG_CHANGE_OVER_CIRC_PUMP_START_T", "Temperature at which change over circulation pump is started.", 0, 200, None, None, None),
+    (2451, "H", "U", "REG_CHANGE_OVER_CIRC_PUMP_STOP_DELAY", "Change over circulation pump stop delay time, min.", 0, 60, None, None, None),
+    (2452, "H", "U", "REG_CHANGE_OVER_CIRC_PUMP_COUNTER", "Time till change over circulation pump stops, s.", 0, 3600, None, None, None),
+    (2505, "I", "U", "REG_ECO_FUNCTION_ACTIVE", "ECO mode status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (2520, "I", "U", "REG_ECO_MODE_ACTIVE", "Operation mode of ECO mode: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (3013, "I", "S", "REG_FUNCTION_ACTIVE_COOLER", "Which type of cooler is active (0=None, 1=Water, 2=Change over)", 0, 2, None, None, None),
+    (3100, "I", "U", "REG_FUNCTION_ACTIVE_COOLING", "Cooling status: 0 - Inactive; 1 - Active", None, None, True, None, None),
+    (3101, "I", "U", "REG_FUNCTION_ACTIVE_FREE_COOLING", "Free cooling function status: 0 - Inactive; 1 - Active", None, None, True, None, None),
+    (3102, "I", "U", "REG_FUNCTION_ACTIVE_HEATING", "Heating status: 0 - Inactive; 1 - Active", None, None, True, None, None),
+    (3103, "I", "U", "REG_FUNCTION_ACTIVE_DEFROSTING", "Defrosting status: 0 - Inactive; 1 - Active", None, None, True, None, None),
+    (3104, "I", "U", "REG_FUNCTION_ACTIVE_HEAT_RECOVERY", "Heat recovery function status: 0 - Inactive; 1 - Active", None, None, True, None, None),
+    (3105, "I", "U", "REG_FUNCTION_ACTIVE_COOLING_RECOVERY", "Cooling recovery function status: 0 - Inactive; 1 - Active", None, None, True, None, None),
+    (3106, "I", "U", "REG_FUNCTION_ACTIVE_MOISTURE_TRANSFER", "Moisture transfer function status: 0 - Inactive; 1 - Active", None, None, True, None, None),
+    (3107, "I", "U", "REG_FUNCTION_ACTIVE_SECONDARY_AIR", "Secondary air function status: 0 - Inactive; 1 - Active", None, None, True, None, None),
+    (3108, "I", "U", "REG_FUNCTION_ACTIVE_VACUUM_CLEANER", "Vacuum cleaner function status: 0 - Inactive; 1 - Active", None, None, True, None, None),
+    (3109, "I", "U", "REG_FUNCTION_ACTIVE_COOKER_HOOD", "Cooker hood function status: 0 - Inactive; 1 - Active", None, None, True, None, None),
+    (3112, "I", "S", "REG_FUNCTION_ACTIVE_HEATER_COOL_DOWN", "Active Heater Cool Down", None, None, True, None, None),
+    (3113, "I", "U", "REG_FUNCTION_ACTIVE_PRESSURE_GUARD", "Pressure guard", None, None, True, None, None),
+    (3114, "I", "U", "REG_FUNCTION_ACTIVE_CDI_1", "Configurable DI1", None, None, True, None, None),
+    (3115, "I", "U", "REG_FUNCTION_ACTIVE_CDI_2", "Configurable DI2", None, None, True, None, None),
+    (3116, "I", "U", "REG_FUNCTION_ACTIVE_CDI_3", "Configurable DI3", None, None, True, None, None),
+    (4000, "H", "U", "REG_DEFROSTING_MODE", "Defrosting mode: 0 - Soft; 1 - Normal; 2 - Hard", 0, 2, None, None, None),
+    (4002, "I", "U", "REG_DEFROSTING_LEVEL", "Defrosting level.", 0, 5, None, None, None),
+    (4010, "I", "U", "REG_DEFROSTING_STATE", "Defrosting state: 0 - Normal; 1 - Bypass; 2 - Stop; 3 - Secondary air; 4 - Error", 0, 4, None, None, None),
+    (4011, "I", "U", "REG_DEFROSTING_COUNTER", "Time in specific defrosting state, s.", None, None, None, None, None),
+    (4100, "H", "U", "REG_FREE_COOLING_ON_OFF", "Free cooling on/off: 0 - Disabled; 1 - Enabled", None, None, True, None, None),
+    (4101, "H", "U", "REG_FREE_COOLING_OUTDOOR_NIGHTTIME_ACTIVATION_HIGH_T_LIMIT", "Outdoor nighttime activation high limit, °C * 10", 70, 300, None, 10, None),
+    (4102, "H", "U", "REG_FREE_COOLING_OUTDOOR_NIGHTTIME_DEACTIVATION_LOW_T_LIMIT", "Outdoor activation low limit, °C * 10", 70, 300, None, 10, None),
+    (4103, "H", "U", "REG_FREE_COOLING_OUTDOOR_NIGHTTIME_DEACTIVATION_HIGH_T_LIMIT", "Outdoor activation high limit, °C * 10", 70, 300, None, 10, None),
+    (4104, "H", "U", "REG_FREE_COOLING_ROOM_CANCEL_T", "Extract/Room cancel temperature, °C * 10", 120, 300, None, 10, None),
+    (4105, "H", "U", "REG_FREE_COOLING_START_TIME_H", "Free cooling start time, hours (21-23 or 0-8)", 0, 23, None, None, None),
+    (4106, "H", "U", "REG_FREE_COOLING_START_TIME_M", "Free cooling start time, minutes", 0, 59, None, None, None),
+    (4107, "H", "U", "REG_FREE_COOLING_END_TIME_H", "Free cooling end time, hours", 0, 23, None, None, None),
+    (4108, "H", "U", "REG_FREE_COOLING_END_TIME_M", "Free cooling end time, minutes", 0, 59, None, None, None),
+    (4111, "H", "U", "REG_FREE_COOLING_MIN_SPEED_LEVEL_SAF", "Supply air fan speed during active free cooling function: 3: Normal, 4: High, 5: Maximum", 3, 5, None, None, None),
+    (4112, "H", "U", "REG_FREE_COOLING_MIN_SPEED_LEVEL_EAF", "Extract air fan speed during active free cooling function: 3: Normal, 4: High, 5: Maximum", 3, 5, None, None, None),
+    (4113, "I", "U", "REG_FREE_COOLING_STATE", "Free cooling state: 0 - Disabled; 1 - Enabled; 2 - Daytime; 3 - Temperatures are not reliable", 0, 3, None, None, None),
+    (4118, "I", "U", "REG_FREE_COOLING_BLOCK_Y1_COUNTER", "Time for heating block after free cooling.", 0, 3600, None, None, None),
+    (4119, "I", "U", "REG_FREE_COOLING_RELIABLE_TEMPERATURES", "Reliable temperature status: 0 - Not reliable; 1 - Reliable", None, None, True, None, None),
+    (7000, "H", "U", "REG_FILTER_PERIOD", "Filter replacement time in months.", 3, 15, None, None, None),
+    (7001, "I", "U", "REG_FILTER_REPLACEMENT_TIME_L", "Timestamp of latest filter replacement, lower 16 bits.", None, None, None, None, 7002),
+    (7002, "I", "U", "REG_FILTER_REPLACEMENT_TIME_H", "Timestamp of latest filter replacement, higher 16 bits.", None, None, None, None, 7001),
+    (7004, "I", "U", "REG_FILTER_REMAINING_TIME_L", "Remaining filter time in seconds, lower 16 bits", None, None, None, None, 7005),
+    (7005, "I", "U", "REG_FILTER_REMAINING_TIME_H", "Remaining filter time in seconds, higher 16 bits", None, None, None, None, 7004),
+    (12100, "I", "S", "REG_SENSOR_FPT", "Frost Protection Temperature sensor.", None, None, None, 10, None),
+    (12103, "I", "S", "REG_SENSOR_RAT", "Room Air Temperature sensor.", None, None, None, 10, None),
+    (12104, "I", "S", "REG_SENSOR_EAT", "Extract Air Temperature sensor (accessory)", None, None, None, 10, None),
+    (12105, "I", "S", "REG_SENSOR_ECT", "Extra Controller Temperature sensor.", None, None, None, 10, None),
+    (12108, "H", "U", "REG_SENSOR_RHS", "Relative Humidity Sensor (Accessory)", 0, 100, None, None, None),
+    (12109, "I", "U", "REG_SENSOR_BYS", "Bypass damper input status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12110, "I", "U", "REG_SENSOR_EMT", "Emergency thermostat input status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12111, "I", "U", "REG_SENSOR_RGS", "Rotor guard sensor input status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12112, "H", "U", "REG_SENSOR_MODBUS_CO2", "Modbus register for CO2 sensor value input, ppm.", 0, 2000, None, None, None),
+    (12113, "H", "U", "REG_SENSOR_MODBUS_RHS", "Modbus register for relative humidity sensor value input, %.", 0, 100, None, None, None),
+    (12300, "I", "U", "REG_SENSOR_DI_AWAY", "Away mode input status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12301, "I", "U", "REG_SENSOR_DI_HOLIDAY", "Holiday mode input status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12302, "I", "U", "REG_SENSOR_DI_FIREPLACE", "Fireplace mode input status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12303, "I", "U", "REG_SENSOR_DI_REHRESH", "Refresh mode input status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12304, "I", "U", "REG_SENSOR_DI_CROWDED", "Crowded mode input status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12305, "I", "U", "REG_SENSOR_DI_COOKERHOOD", "Cooker hood", None, None, True, None, None),
+    (12306, "I", "U", "REG_SENSOR_DI_VACUUMCLEANER", "Vacuum cleaner", None, None, True, None, None),
+    (12307, "I", "U", "REG_SENSOR_DI_EXTERNAL_STOP", "External stop input status 0 - Inactive 1 - Active", None, None, True, None, None),
+    (12310, "I", "U", "REG_SENSOR_DI_FIRE_ALARM", "Fire alarm input status 0 - Inactive 1 - Active", None, None, True, None, None),
+    (12311, "I", "U", "REG_SENSOR_DI_CHANGE_OVER_FEEDBACK", "Change over feedback input status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12312, "I", "U", "REG_SENSOR_DI_PRESSURE_GUARD", "Pressure guard mode input status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12313, "I", "U", "REG_SENSOR_DI_CDI_1", "Configurable digital input 1 status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12314, "I", "U", "REG_SENSOR_DI_CDI_2", "Configurable digital input 2 status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12315, "I", "U", "REG_SENSOR_DI_CDI_3", "Configurable digital input 3 status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (12404, "I", "U", "REG_SENSOR_DI_BYF", "Bypass damper feedback value, %.", 0, 100, None, None, None),
+    (14002, "I", "U", "REG_OUTPUT_ALARM", "Alarm output status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (14100, "I", "S", "REG_OUTPUT_Y1_ANALOG", "Heater AO state", 0, 100, None, None, None),
+    (14103, "I", "U", "REG_OUTPUT_Y2_DIGITAL", "Heat Exchanger DO state.0: Output not active1: Output active", None, None, True, None, None),
+    (14200, "I", "S", "REG_OUTPUT_Y3_ANALOG", "Cooler AO state", 0, 100, None, None, None),
+    (14201, "I", "S", "REG_OUTPUT_Y3_DIGITAL", "Cooler DO state: 0: Output not active 1: Output active", None, None, True, None, None),
+    (14202, "I", "U", "REG_OUTPUT_Y4_ANALOG", "Extra controller analog output value, %.", 0, 100, None, None, None),
+    (14203, "I", "U", "REG_OUTPUT_Y4_DIGITAL", "Extra controller digital output status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (14300, "I", "U", "REG_OUTPUT_Y1_CIRC_PUMP", "Heating circulation pump digital output status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (14301, "I", "U", "REG_OUTPUT_Y3_CIRC_PUMP", "Cooling circulation pump digital output status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (14302, "I", "U", "REG_OUTPUT_Y1_Y3_CIRC_PUMP", "Change over circulation pump digital output status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (14303, "I", "U", "REG_OUTPUT_Y4_CIRC_PUMP", "Extra controller circulation pump digital output status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (14304, "I", "U", "REG_OUTPUT_Y3_ACTIVATE_COIL", "Activate cooling digital output status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (14305, "I", "U", "REG_OUTPUT_Y1_Y3_ANALOG", "Change over analog output value, %.", 0, 100, None, None, None),
+    (14306, "I", "U", "REG_OUTPUT_Y4_SECONDARY_AIR", "Air recirculation digital output status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (14307, "I", "U", "REG_INTERLOCK_EXTERNAL_FAN_CONTROL", "External fan control block digital output status: 0 - Unblocked, 1 - Blocked", None, None, True, None, None),
+    (14308, "I", "U", "REG_OUTPUT_UNIT_STATUS_OK", "Digital output for unit status: 0 - Active alarms detected, 1 - Unit status OK", None, None, True, None, None),
+    (14309, "I", "U", "REG_OUTPUT_WS_RUNNING_UNSCHEDULED", "Week schedule unscheduled period digital output status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (14310, "I", "U", "REG_OUTPUT_WS_RUNNING_SCHEDULED", "Week schedule scheduled period digital output status: 0 - Inactive, 1 - Active", None, None, True, None, None),
+    (14380, "I", "S", "REG_OUTPUT_TRIAC", "TRIAC control signal", None, None, True, None, None),
+    (15022, "I", "U", "REG_ALARM_DEFROSTING_ALARM", "Defrosting", 0, 3, None, None, None),
+    (15120, "I", "U", "REG_ALARM_RGS_ALARM", "Rotation guard (RGS)", 0, 3, None, None, None),
+    (15169, "I", "U", "REG_ALARM_CO2_ALARM", "CO2", 0, 3, None, None, None),
+    (15904, "H", "U", "REG_ALARM_CLEAR_ALL", "Clears all active alarms: 1: Clear all active alarms", 0, 1, None, None, None),
+    (15905, "I", "U", "REG_ALARM_AMOUNT_ACTIVE", "Number of active alarms.", 0, 65536, None, None, None),
+    (15906, "I", "U", "REG_ALARM_MODBUS_SUM", "Any alarm indication: 0 - Not supported, 1 - No active alarms, 2 - Active alarm", 0, 2, None, None, None),
+    (15909, "H", "U", "REG_ALARM_LOW_SAT_ENABLED", "Low supply air temperature alarm monitoring status: 0 - Not monitored, 1 - Alarm conditions monitored.", None, None, True, None, None),
+)
@@ -9,7 +9,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import EntityCategory
 
-from .const import DOMAIN, PRESET_TO_VALUE, PRESET_MAP, REG_MODE_MAIN_CMD
+from .const import DOMAIN, PRESET_TO_VALUE, PRESET_MAP
 from .coordinator import VSRCoordinator
 from .hub import VSRHub
 
@@ -39,8 +39,8 @@ class VSRPresetSelect(CoordinatorEntity[VSRCoordinator], SelectEntity):
         val = PRESET_TO_VALUE.get(option)
         if val is None:
             return
-        if await self.hub.write_register(REG_MODE_MAIN_CMD, val):
-            await self.coordinator.async_request_refresh()
+        # Status (1160) is offset by -1 from the command value
+        await self.coordinator.async_write_main_mode(val - 1, [val])
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     data = hass.data[DOMAIN][entry.entry_id]
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -14,8 +13,11 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     UnitOfTemperature,
+    UnitOfVolumeFlowRate,
     UnitOfPower,
     UnitOfEnergy,
+    UnitOfDataRate,
+    UnitOfTime,
     PERCENTAGE,
     REVOLUTIONS_PER_MINUTE,
     EntityCategory,
@@ -24,18 +26,22 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
     ALARM_VALUE_TO_STATE,
 )
 from .coordinator import VSRCoordinator
+from .publish import PUBLISH_POLICIES, PublishContext, PublishPolicy, sensor_class
 
 
 @dataclass(frozen=True, kw_only=True)
 class VSRSensorDescription(SensorEntityDescription):
     coordinator_key: str
+    # Overrides the sensor-class policy (see publish.py)
+    publish: PublishPolicy | None = None
+    # Coordinator keys exposed as state attributes
+    attributes: tuple[str, ...] = ()
 
 
 SENSORS: tuple[VSRSensorDescription, ...] = (
@@ -61,6 +67,8 @@ SENSORS: tuple[VSRSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         coordinator_key="target_temp",
+        # A setpoint: every change is meaningful
+        publish=PublishPolicy(),
     ),
 
     # Temperatures
@@ -96,6 +104,16 @@ SENSORS: tuple[VSRSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         coordinator_key="temp_overheat",
     ),
+    VSRSensorDescription(
+        key="temp_efficiency",
+        name="Temperature Efficiency Sensor",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        coordinator_key="temp_efficiency",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
 
     # Fans / RPM / Percentages
     VSRSensorDescription(
@@ -149,7 +167,7 @@ SENSORS: tuple[VSRSensorDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
-        coordinator_key="fan_supply",
+        coordinator_key="supply_fan_power",
     ),
     VSRSensorDescription(
         key="extract_fan_power",
@@ -157,7 +175,7 @@ SENSORS: tuple[VSRSensorDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
-        coordinator_key="fan_extract",
+        coordinator_key="extract_fan_power",
     ),
     VSRSensorDescription(
         key="heater_power",
@@ -165,7 +183,7 @@ SENSORS: tuple[VSRSensorDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
-        coordinator_key="heater_percentage",
+        coordinator_key="heater_power",
     ),
     VSRSensorDescription(
         key="total_power",
@@ -175,6 +193,41 @@ SENSORS: tuple[VSRSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         coordinator_key="total_power",
     ),
+    # Airflow and heat recovery (estimated from fan % and temperatures)
+    VSRSensorDescription(
+        key="supply_airflow",
+        name="Supply Airflow",
+        device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
+        native_unit_of_measurement=UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
+        state_class=SensorStateClass.MEASUREMENT,
+        coordinator_key="supply_airflow",
+    ),
+    VSRSensorDescription(
+        key="extract_airflow",
+        name="Extract Airflow",
+        device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
+        native_unit_of_measurement=UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
+        state_class=SensorStateClass.MEASUREMENT,
+        coordinator_key="extract_airflow",
+    ),
+    VSRSensorDescription(
+        key="heat_recovery_efficiency",
+        name="Heat Recovery Efficiency",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        coordinator_key="heat_recovery_efficiency",
+        attributes=("heat_recovery_efficiency_sample", "heat_recovery_efficiency_device"),
+    ),
+    # Filter wear: supply fan RPM rise at equal duty vs. a clean filter
+    VSRSensorDescription(
+        key="filter_drift",
+        name="Filter Clogging Drift",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        coordinator_key="filter_drift",
+        attributes=("days_until_filter_alarm",),
+        publish=PublishPolicy(deadband=0.2),
+    ),
     # Energy Sensors (for Energy Dashboard)
     VSRSensorDescription(
         key="fans_energy",
@@ -201,14 +254,37 @@ SENSORS: tuple[VSRSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         coordinator_key="setpoint_eco_offset",
+        publish=PublishPolicy(),
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
 
-    # Countdown Raw (Diagnostics)
+    # Alarms currently not inactive, with their states as an attribute
+    VSRSensorDescription(
+        key="active_alarms",
+        name="Active Alarms",
+        coordinator_key="active_alarm_count",
+        attributes=("active_alarms",),
+    ),
+    # Device alarm log: newest alarm, recent entries as an attribute
+    VSRSensorDescription(
+        key="alarm_history",
+        name="Alarm History",
+        coordinator_key="alarm_history_latest",
+        attributes=("alarm_history",),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    # Countdown, projected locally between slow-tier reads of 1110/1111
     VSRSensorDescription(
         key="countdown_time_s",
         name="Countdown Remaining (s)",
-        coordinator_key="countdown_time_s",
+        coordinator_key="countdown_total_s",
+        publish=PublishPolicy(deadband=60.0),
+    ),
+    VSRSensorDescription(
+        key="mode_end_time",
+        name="User Mode End",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        coordinator_key="countdown_end",
     ),
     VSRSensorDescription(
         key="countdown_time_s_factor",
@@ -224,6 +300,50 @@ SENSORS: tuple[VSRSensorDescription, ...] = (
         coordinator_key="modbus_failures",
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
+    # Bus instrumentation (Diagnostics)
+    VSRSensorDescription(
+        key="bus_transactions_per_s",
+        name="Modbus Transactions Rate",
+        native_unit_of_measurement="tx/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        coordinator_key="bus_transactions_per_s",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    VSRSensorDescription(
+        key="bus_registers_per_s",
+        name="Modbus Registers Rate",
+        native_unit_of_measurement="reg/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        coordinator_key="bus_registers_per_s",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    VSRSensorDescription(
+        key="bus_bytes_per_s",
+        name="Modbus Throughput",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        coordinator_key="bus_bytes_per_s",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    VSRSensorDescription(
+        key="bus_response_p95_ms",
+        name="Modbus Response Time p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        coordinator_key="bus_response_p95_ms",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    VSRSensorDescription(
+        key="bus_queue_wait_p95_ms",
+        name="Modbus Queue Wait p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        coordinator_key="bus_queue_wait_p95_ms",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
 )
 
 
@@ -240,6 +360,8 @@ ALARM_SENSORS: tuple[VSRAlarmDescription, ...] = tuple(
         options=["Inactive", "Active", "Waiting", "Cleared Error Active"],
         coordinator_key=k,
         entity_category=EntityCategory.DIAGNOSTIC,
+        # "Active Alarms" and save_vsr_alarm events cover these; enable as needed
+        entity_registry_enabled_default=False,
     )
     for k, n in [
         ("alarm_typeA", "Alarm Type A"),
@@ -296,15 +418,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     entities: list[SensorEntity] = []
 
-    # Create power sensors first (needed by energy sensors)
-    power_sensors: dict[str, VSRSensor] = {}
-    
     for desc in SENSORS:
-        sensor = VSRSensor(coordinator, desc, device_info)
-        entities.append(sensor)
-        # Store power sensors for energy sensor references
-        if desc.key in ("supply_fan_power", "extract_fan_power", "heater_power"):
-            power_sensors[desc.key] = sensor
+        entities.append(VSRSensor(coordinator, desc, device_info))
 
     for desc in ALARM_SENSORS:
         entities.append(VSRAlarmSensor(coordinator, desc, device_info))
@@ -318,7 +433,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         device_info=device_info,
         key="fans_energy",
         name="Fans Energy",
-        power_sensors=[power_sensors["supply_fan_power"], power_sensors["extract_fan_power"]],
     ))
     
     entities.append(VSREnergySensor(
@@ -326,7 +440,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         device_info=device_info,
         key="heater_energy",
         name="Heater Energy",
-        power_sensors=[power_sensors["heater_power"]],
     ))
 
     async_add_entities(entities)
@@ -343,6 +456,15 @@ class VSRBaseSensor(CoordinatorEntity[VSRCoordinator], SensorEntity):
 
 
 class VSRSensor(VSRBaseSensor):
+    def __init__(self, coordinator: VSRCoordinator, description: VSRSensorDescription, device_info: dict[str, Any]) -> None:
+        super().__init__(coordinator, description, device_info)
+        policy = description.publish or PUBLISH_POLICIES.get(
+            sensor_class(description.device_class, description.native_unit_of_measurement)
+        )
+        if policy is not None:
+            # The coordinator only calls us when the value changed enough
+            self.coordinator_context = PublishContext(description.coordinator_key, policy)
+
     @property
     def native_value(self) -> Any:
         key = getattr(self.entity_description, "coordinator_key")
@@ -350,38 +472,26 @@ class VSRSensor(VSRBaseSensor):
 
         # Map mode_speed raw -> enum text
         if self.entity_description.key == "mode_speed":
-            raw = self.coordinator.data.get("mode_speed")
-            return {2: "low", 3: "medium", 4: "high"}.get(raw, "low")
-
-        # Power sensors calculations (defensive)
-        if self.entity_description.key == "supply_fan_power":
-            supply_pct = self.coordinator.data.get("fan_supply")
-            if supply_pct is None:
-                return None
-            return round((supply_pct / 100) * 160, 1)
-        if self.entity_description.key == "extract_fan_power":
-            extract_pct = self.coordinator.data.get("fan_extract")
-            if extract_pct is None:
-                return None
-            return round((extract_pct / 100) * 160, 1)
-        if self.entity_description.key == "heater_power":
-            heater_pct = self.coordinator.data.get("heater_percentage")
-            if heater_pct is None:
-                return None
-            return round((heater_pct / 100) * 1650, 1)
-        if self.entity_description.key == "total_power":
-            supply_pct = self.coordinator.data.get("fan_supply") or 0
-            extract_pct = self.coordinator.data.get("fan_extract") or 0
-            heater_pct = self.coordinator.data.get("heater_percentage") or 0
-            supply = (supply_pct / 100) * 160
-            extract = (extract_pct / 100) * 160
-            heater = (heater_pct / 100) * 1650
-            return round(supply + extract + heater, 1)
+            return {2: "low", 3: "medium", 4: "high"}.get(value, "low")
 
+        # Derived values (power, airflow, efficiency) are computed by the
+        # coordinator once per poll
         return value
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        keys = self.entity_description.attributes  # type: ignore[attr-defined]
+        if not keys:
+            return None
+        return {key: self.coordinator.data.get(key) for key in keys}
+
 
 class VSRAlarmSensor(VSRBaseSensor):
+    def __init__(self, coordinator: VSRCoordinator, description: VSRAlarmDescription, device_info: dict[str, Any]) -> None:
+        super().__init__(coordinator, description, device_info)
+        # Alarms change rarely: only write state when the raw value changes
+        self.coordinator_context = PublishContext(description.coordinator_key, PublishPolicy())
+
     @property
     def native_value(self) -> str | None:
         key = getattr(self.entity_description, "coordinator_key")
@@ -397,9 +507,7 @@ class VSRCountdownSensor(VSRBaseSensor):
         if mode != desc.target_mode:
             return "Inactive"
 
-        time_s = int(self.coordinator.data.get("countdown_time_s", 0))
-        factor = int(self.coordinator.data.get("countdown_time_s_factor", 0))
-        total = time_s + factor * 65535 if desc.target_mode == 6 else time_s
+        total = int(self.coordinator.data.get("countdown_total_s", 0))
 
         if total < 60:
             return "Less than 1 min"
@@ -418,7 +526,7 @@ class VSRCountdownSensor(VSRBaseSensor):
 
 
 class VSREnergySensor(CoordinatorEntity[VSRCoordinator], RestoreSensor):
-    """Energy sensor that integrates power over time for Energy Dashboard."""
+    """Energy total for the Energy Dashboard, integrated by the coordinator."""
 
     _attr_has_entity_name = True
     _attr_device_class = SensorDeviceClass.ENERGY
@@ -431,67 +539,28 @@ class VSREnergySensor(CoordinatorEntity[VSRCoordinator], RestoreSensor):
         device_info: dict[str, Any],
         key: str,
         name: str,
-        power_sensors: list[VSRSensor],
     ) -> None:
         """Initialize the energy sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{DOMAIN}_{coordinator.config_entry.entry_id}_{key}"
         self._attr_name = name
         self._attr_device_info = device_info
-        self._power_sensors = power_sensors
-        self._last_update: datetime | None = None
-        self._attr_native_value: float | None = None
+        self._key = key
 
     async def async_added_to_hass(self) -> None:
-        """Handle entity which provides long-term statistics."""
+        """Carry the total over from entities that integrated it themselves."""
         await super().async_added_to_hass()
 
-        # Restore last energy value from database
+        energy = self.coordinator.energy
+        if energy is None:
+            return
         last_sensor_data = await self.async_get_last_sensor_data()
-        if last_sensor_data:
-            self._attr_native_value = last_sensor_data.native_value
-
-        # Restore last update timestamp
-        if (
-            (last_state := await self.async_get_last_state())
-            and last_state.attributes.get("last_update") is not None
-        ):
-            self._last_update = dt_util.parse_datetime(last_state.attributes["last_update"])
+        if last_sensor_data and last_sensor_data.native_value is not None:
+            energy.seed(self._key, float(last_sensor_data.native_value))
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        return {
-            "last_update": self._last_update.isoformat() if self._last_update else None,
-        }
-
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        now = dt_util.utcnow()
-
-        # Calculate total power from all power sensors
-        total_power_w = 0.0
-        for power_sensor in self._power_sensors:
-            power_value = power_sensor.native_value
-            if power_value is not None:
-                total_power_w += float(power_value)
-
-        # Initialize on first update
-        if self._last_update is None:
-            self._last_update = now
-            self.async_write_ha_state()
-            return
-
-        # Calculate energy increment: E = P × t
-        # Power in Watts, time in hours, result in kWh
-        time_delta = now - self._last_update
-        hours = time_delta.total_seconds() / 3600
-        energy_increment_kwh = (total_power_w / 1000) * hours
-
-        # Add to accumulated energy
-        current_value = self._attr_native_value or 0.0
-        self._attr_native_value = round(current_value + energy_increment_kwh, 4)
-
-        # Update timestamp
-        self._last_update = now
-        self.async_write_ha_state()
+    def native_value(self) -> float | None:
+        # Displayed to the Wh; the integrator keeps full precision, and an
+        # unchanged state is not written to the recorder again
+        value = self.coordinator.data.get(self._key)
+        return round(value, 3) if value is not None else None
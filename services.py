@@ -0,0 +1,169 @@
+"""Services for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_BUCKET_MINUTES,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    ATTR_END,
+    ATTR_START,
+    DOMAIN,
+    SERVICE_GET_HISTORY,
+    SERVICE_GET_POLL_TRACES,
+    SERVICE_RECORD_BUS_TRAFFIC,
+    SERVICE_REPROBE_REGISTERS,
+)
+from .coordinator import VSRCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+ENTRY_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+# Recording length when none is given, and the upper bound
+DEFAULT_RECORD_S = 300
+MAX_RECORD_S = 86400
+
+RECORD_SCHEMA = ENTRY_SCHEMA.extend(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_RECORD_S): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_RECORD_S)
+        )
+    }
+)
+
+
+def _coordinators(hass: HomeAssistant, call: ServiceCall) -> dict[str, VSRCoordinator]:
+    """Coordinators targeted by a service call (all entries if none given)."""
+    entries = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is None:
+        return {eid: data["coordinator"] for eid, data in entries.items()}
+    if entry_id not in entries:
+        raise HomeAssistantError(f"Unknown or unloaded config entry: {entry_id}")
+    return {entry_id: entries[entry_id]["coordinator"]}
+
+
+async def _async_reprobe(call: ServiceCall) -> ServiceResponse:
+    result = {}
+    for entry_id, coordinator in _coordinators(call.hass, call).items():
+        plan = await coordinator.async_reprobe()
+        if plan is None:
+            raise HomeAssistantError(
+                f"Register probe of {entry_id} failed; the previous plan is kept"
+            )
+        result[entry_id] = {"supported": plan["supported"], "blocks": plan["blocks"]}
+    return result
+
+HISTORY_SCHEMA = ENTRY_SCHEMA.extend(
+    {
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_BUCKET_MINUTES, default=15): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1440)
+        ),
+    }
+)
+
+
+async def _async_get_poll_traces(call: ServiceCall) -> ServiceResponse:
+    return {
+        entry_id: {"enabled": coordinator.tracer.enabled, "traces": coordinator.tracer.traces()}
+        for entry_id, coordinator in _coordinators(call.hass, call).items()
+    }
+
+
+async def _async_record_bus_traffic(call: ServiceCall) -> ServiceResponse:
+    hass = call.hass
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    result = {}
+    for entry_id, coordinator in _coordinators(hass, call).items():
+        hub = coordinator.hub
+        if hub.recorder is not None:
+            raise HomeAssistantError(f"Already recording bus traffic to {hub.recorder.path}")
+        path = hass.config.path(f"save_vsr_traffic_{entry_id}_{stamp}.jsonl")
+        hub.start_recording(path)
+
+        def _stop(_now, hub=hub, path=path) -> None:
+            # The hub may have been closed (and its recording flushed) meanwhile
+            recorder = hub.recorder
+            if recorder is not None and recorder.path == path:
+                hass.async_create_background_task(
+                    hub.async_stop_recording(), "save_vsr stop bus recording"
+                )
+
+        async_call_later(hass, call.data[ATTR_DURATION], _stop)
+        result[entry_id] = {"path": path}
+    return result
+
+
+def _timestamp(value: datetime | None) -> float | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_util.get_default_time_zone())
+    return value.timestamp()
+
+
+def _iso(rows: list[dict]) -> list[dict]:
+    return [{**row, "t": dt_util.utc_from_timestamp(row["t"]).isoformat()} for row in rows]
+
+
+async def _async_get_history(call: ServiceCall) -> ServiceResponse:
+    start = _timestamp(call.data.get(ATTR_START))
+    end = _timestamp(call.data.get(ATTR_END))
+    bucket_s = call.data[ATTR_BUCKET_MINUTES] * 60
+    result = {}
+    for entry_id, coordinator in _coordinators(call.hass, call).items():
+        history = coordinator.history
+        result[entry_id] = {
+            "interval_s": history.interval_s,
+            "samples": _iso(history.query(start, end)),
+            "buckets": _iso(history.aggregate(start, end, bucket_s)),
+        }
+    return result
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services once per Home Assistant instance."""
+    if hass.services.has_service(DOMAIN, SERVICE_REPROBE_REGISTERS):
+        return
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPROBE_REGISTERS,
+        _async_reprobe,
+        schema=ENTRY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_POLL_TRACES,
+        _async_get_poll_traces,
+        schema=ENTRY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        _async_get_history,
+        schema=HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RECORD_BUS_TRAFFIC,
+        _async_record_bus_traffic,
+        schema=RECORD_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,97 @@
+"""Opt-in per-poll trace spans for Systemair SAVE VSR."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from homeassistant.util import dt as dt_util
+
+# Number of completed poll traces kept in memory
+TRACE_BUFFER_SIZE = 20
+
+# Innermost open span of the running task (each gathered read gets its own)
+CURRENT_SPAN: ContextVar["Span | None"] = ContextVar("save_vsr_span", default=None)
+
+
+class Span:
+    """A timed step with attributes and child steps."""
+
+    __slots__ = ("name", "attrs", "start", "end", "children")
+
+    def __init__(self, name: str, attrs: dict[str, Any]) -> None:
+        self.name = name
+        self.attrs = attrs
+        self.start = time.perf_counter()
+        self.end: float | None = None
+        self.children: list[Span] = []
+
+    def child(self, name: str, **attrs: Any) -> Span:
+        span = Span(name, attrs)
+        self.children.append(span)
+        return span
+
+    def finish(self) -> None:
+        if self.end is None:
+            self.end = time.perf_counter()
+
+    def as_dict(self, origin: float) -> dict[str, Any]:
+        end = self.end if self.end is not None else time.perf_counter()
+        return {
+            "name": self.name,
+            "offset_ms": round((self.start - origin) * 1000, 2),
+            "duration_ms": round((end - self.start) * 1000, 2),
+            **({"attrs": self.attrs} if self.attrs else {}),
+            **({"children": [c.as_dict(origin) for c in self.children]} if self.children else {}),
+        }
+
+
+@contextmanager
+def span(parent: Span | None, name: str, **attrs: Any) -> Iterator[Span | None]:
+    """Time a child step of `parent`; a no-op when tracing is off (parent is None)."""
+    if parent is None:
+        yield None
+        return
+    child = parent.child(name, **attrs)
+    token = CURRENT_SPAN.set(child)
+    try:
+        yield child
+    except BaseException as err:
+        child.attrs["error"] = repr(err)
+        raise
+    finally:
+        child.finish()
+        CURRENT_SPAN.reset(token)
+
+
+class PollTracer:
+    """Collects one root span per poll into a bounded ring buffer."""
+
+    def __init__(self, size: int = TRACE_BUFFER_SIZE) -> None:
+        self.enabled = False
+        self._traces: deque[dict[str, Any]] = deque(maxlen=size)
+        self.pending: Span | None = None
+        self._pending_at: str | None = None
+
+    def start(self, name: str, **attrs: Any) -> Span | None:
+        """Open the root span for a poll (None when tracing is disabled)."""
+        if not self.enabled:
+            return None
+        self.commit()
+        self.pending = Span(name, attrs)
+        self._pending_at = dt_util.utcnow().isoformat()
+        return self.pending
+
+    def commit(self) -> None:
+        """Close the pending root span and store it."""
+        root, self.pending = self.pending, None
+        if root is None:
+            return
+        root.finish()
+        self._traces.append({"at": self._pending_at, **root.as_dict(root.start)})
+
+    def traces(self) -> list[dict[str, Any]]:
+        return list(self._traces)
@@ -0,0 +1,200 @@
+"""Bus traffic recorder and replay client for Systemair SAVE VSR.
+
+Captures are JSONL, one transaction per line:
+
+    {"t": 1729339200.123, "fc": 4, "dev": 1, "addr": 1160, "n": 1,
+     "data": [3], "ms": 18.4, "err": null}
+
+`err` is null, "timeout", "connection", "exception:<code>" (Modbus
+exception response) or "error:<text>". A capture taken on a real line can
+be served back through `VSRReplayClient` (transport "replay") to rerun
+the coordinator against it deterministically.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Any
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+_LOGGER = logging.getLogger(__name__)
+
+# Buffered lines before a background write to disk
+FLUSH_EVERY = 50
+
+
+def _classify(response: Any, exc: BaseException | None) -> str | None:
+    if exc is not None:
+        if isinstance(exc, asyncio.TimeoutError):
+            return "timeout"
+        if isinstance(exc, (ConnectionError, ConnectionException)):
+            return "connection"
+        return f"error:{exc}"
+    if response is not None and response.isError():
+        return f"exception:{getattr(response, 'exception_code', 0)}"
+    return None
+
+
+def _payload(response: Any) -> list[int] | None:
+    if response is None or response.isError():
+        return None
+    registers = getattr(response, "registers", None)
+    if registers:
+        return list(registers)
+    bits = getattr(response, "bits", None)
+    if bits:
+        return [int(b) for b in bits[:1]]
+    return None
+
+
+class TrafficRecorder:
+    """Append every transaction of one hub to a JSONL file (writes off-loop)."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.records = 0
+        self._lines: list[str] = []
+        self._write_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+
+    def record(
+        self,
+        function_code: int,
+        device_id: int,
+        address: int,
+        count: int,
+        response: Any,
+        latency_s: float,
+        exc: BaseException | None,
+    ) -> None:
+        line = {
+            "t": round(time.time(), 3),
+            "fc": function_code,
+            "dev": device_id,
+            "addr": address,
+            "n": count,
+            "data": _payload(response),
+            "ms": round(latency_s * 1000, 2),
+            "err": _classify(response, exc),
+        }
+        self._lines.append(json.dumps(line, separators=(",", ":")) + "\n")
+        self.records += 1
+        if len(self._lines) >= FLUSH_EVERY and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self.async_flush())
+
+    def _write(self, lines: list[str]) -> None:
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.writelines(lines)
+
+    async def async_flush(self) -> None:
+        async with self._write_lock:
+            lines, self._lines = self._lines, []
+            if lines:
+                await asyncio.get_running_loop().run_in_executor(None, self._write, lines)
+
+    async def async_close(self) -> None:
+        if self._flush_task is not None:
+            await self._flush_task
+        await self.async_flush()
+        _LOGGER.info("Recorded %d Modbus transactions to %s", self.records, self.path)
+
+
+class ReplayResponse:
+    """Minimal stand-in for a pymodbus response (what the hub consumes)."""
+
+    __slots__ = ("registers", "bits", "exception_code")
+
+    def __init__(self, data: list[int] | None, exception_code: int | None = None) -> None:
+        self.registers = list(data or [])
+        self.bits = [bool(v) for v in self.registers]
+        self.exception_code = exception_code
+
+    def isError(self) -> bool:  # noqa: N802 - pymodbus naming
+        return self.exception_code is not None
+
+
+class VSRReplayClient:
+    """
+    Serve responses from a capture instead of a device.
+
+    Requests are matched on (function, device, address, count) and answered
+    in capture order, wrapping around when a key is exhausted. Recorded
+    latencies are reproduced divided by `speed` (1 = original timing,
+    10 = ten times faster, 0 = no delay). Unrecorded writes succeed;
+    unrecorded reads fail like a silent device.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0) -> None:
+        self.path = path
+        self.speed = speed
+        self.connected = False
+        self._records: dict[tuple[int, int, int, int], list[dict[str, Any]]] = {}
+        self._queues: dict[tuple[int, int, int, int], deque[dict[str, Any]]] = {}
+
+    def _load(self) -> dict[tuple[int, int, int, int], list[dict[str, Any]]]:
+        records: dict[tuple[int, int, int, int], list[dict[str, Any]]] = {}
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                rec = json.loads(line)
+                records.setdefault((rec["fc"], rec["dev"], rec["addr"], rec["n"]), []).append(rec)
+        return records
+
+    async def connect(self) -> bool:
+        if not self._records:
+            self._records = await asyncio.get_running_loop().run_in_executor(None, self._load)
+            _LOGGER.debug(
+                "Replaying %d recorded transactions from %s",
+                sum(len(v) for v in self._records.values()),
+                self.path,
+            )
+        self.connected = True
+        return True
+
+    def close(self) -> None:
+        self.connected = False
+
+    async def _serve(self, key: tuple[int, int, int, int], write_value: int | None) -> ReplayResponse:
+        queue = self._queues.get(key)
+        if not queue:
+            recorded = self._records.get(key)
+            if not recorded:
+                if write_value is not None:
+                    return ReplayResponse([write_value])
+                raise ModbusIOException(f"No recorded response for fc={key[0]} addr={key[2]}")
+            queue = self._queues[key] = deque(recorded)
+        rec = queue.popleft()
+        if self.speed > 0:
+            await asyncio.sleep(rec["ms"] / 1000 / self.speed)
+
+        err = rec["err"]
+        if err is None:
+            return ReplayResponse(rec["data"])
+        if err == "timeout":
+            raise asyncio.TimeoutError
+        if err == "connection":
+            self.connected = False
+            raise ConnectionException(f"Replayed connection loss on {self.path}")
+        if err.startswith("exception:"):
+            return ReplayResponse(None, int(err.partition(":")[2]))
+        raise ModbusIOException(err.partition(":")[2])
+
+    async def read_input_registers(self, address: int, *, count: int = 1, device_id: int = 1) -> ReplayResponse:
+        return await self._serve((4, device_id, address, count), None)
+
+    async def read_holding_registers(self, address: int, *, count: int = 1, device_id: int = 1) -> ReplayResponse:
+        return await self._serve((3, device_id, address, count), None)
+
+    async def write_register(self, address: int, value: int, *, device_id: int = 1) -> ReplayResponse:
+        return await self._serve((6, device_id, address, 1), value)
+
+    async def write_coil(self, address: int, value: bool, *, device_id: int = 1) -> ReplayResponse:
+        return await self._serve((5, device_id, address, 1), int(value))